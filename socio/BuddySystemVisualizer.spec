@@ -1,16 +1,21 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+# Distribución en carpeta (onedir): el ejecutable arranca sin descomprimir
+# todo el paquete en un directorio temporal en cada inicio, como en onefile.
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('utils', 'utils')],
-    hiddenimports=[],
+    datas=[],
+    # El registro importa las estrategias al usarlas; éstas son las que dibuja la interfaz
+    hiddenimports=['utils.array_buddy_system', 'utils.tlsf', 'utils.segregated_fit'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['tkinter', 'unittest', 'pydoc', 'doctest', 'benchmark',
+              'PyQt6.QtNetwork', 'PyQt6.QtQml', 'PyQt6.QtQuick', 'PyQt6.QtSql',
+              'PyQt6.QtMultimedia', 'PyQt6.QtPdf', 'PyQt6.QtOpenGL'],
     noarchive=False,
     optimize=0,
 )
@@ -19,16 +24,13 @@ pyz = PYZ(a.pure)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='BuddySystemVisualizer',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +38,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='BuddySystemVisualizer',
+)
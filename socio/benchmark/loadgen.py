@@ -0,0 +1,175 @@
+"""
+* Objetivo:
+*   Generador de carga para el servidor de asignación
+*
+* Descripción:
+*   Lanza varios procesos cliente, cada uno con su propia conexión, que
+*   reproducen una carga sintética contra el servidor enviando lotes de
+*   --depth solicitudes seguidas (pipelining). Reporta solicitudes por
+*   segundo entre todos los clientes y la latencia de ida y vuelta de cada
+*   lote (p50/p99/p99.9), que es lo que espera cada solicitud del lote. Con
+*   --spawn inicia su propio servidor en un puerto libre. Uso:
+*
+*       python -m benchmark.loadgen --spawn --strategy tlsf --clients 4 \\
+*           --depth 64 --ops 200000
+*
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from strategy.registry import STRATEGIES
+from benchmark.runner import percentile
+from benchmark.workloads import ALLOC, WORKLOADS
+from service.client import AllocatorClient
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bits del PID reservados al número de evento; los de arriba identifican al cliente
+CLIENT_PID_SHIFT = 40
+
+
+def run_client(address, client, workload, ops, depth, max_request, seed):
+    """
+    Reproduce una carga desde un proceso cliente
+
+    Args:
+        address (str): Dirección del servidor
+        client (int): Número de cliente (separa los PID de cada uno)
+        workload (str): Nombre en WORKLOADS
+        ops (int): Eventos a enviar
+        depth (int): Solicitudes por lote
+        max_request (int): Tamaño máximo de una solicitud
+        seed (int): Semilla base de la carga
+
+    Returns:
+        dict: Inicio y fin (reloj monotónico), solicitudes, fallas de
+            asignación y latencia de cada lote en ns
+    """
+    events = WORKLOADS[workload](ops, max_request, seed=seed + client)
+    base = client << CLIENT_PID_SHIFT
+    latencies = []
+    failures = 0
+
+    with AllocatorClient(address) as connection:
+        batch = connection.pipeline()
+        clock = time.perf_counter_ns
+        live = set()
+        start = time.monotonic()
+        for first in range(0, len(events), depth):
+            chunk = events[first:first + depth]
+            for op, pid, size in chunk:
+                if op == ALLOC:
+                    batch.allocate(base + pid, size)
+                else:
+                    batch.release(base + pid)
+            sent = clock()
+            results = batch.execute()
+            latencies.append(clock() - sent)
+            for (op, pid, _), result in zip(chunk, results):
+                if op != ALLOC:
+                    live.discard(pid)
+                elif result < 0:
+                    failures += 1
+                else:
+                    live.add(pid)
+        end = time.monotonic()
+
+        # Devolver lo que quedó asignado para dejar el servidor como estaba
+        for pid in live:
+            batch.release(base + pid)
+            if len(batch) >= depth:
+                batch.execute()
+        if len(batch):
+            batch.execute()
+
+    return {"start": start, "end": end, "ops": len(events), "failures": failures,
+            "latencies": latencies}
+
+
+def spawn_server(strategy, scale):
+    """
+    Inicia un servidor en un puerto TCP libre
+
+    Returns:
+        tuple: (proceso, dirección)
+    """
+    command = [sys.executable, "-m", "service.server", "--strategy", strategy,
+               "--scale", scale, "--tcp", "127.0.0.1:0"]
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    line = server.stdout.readline()
+    if not line.startswith("Escuchando en "):
+        server.kill()
+        raise RuntimeError("No se pudo iniciar el servidor")
+    return server, line.split()[-1]
+
+
+def summarize(results, depth):
+    """Combina los resultados de los clientes en una sola medición"""
+    ops = sum(r["ops"] for r in results)
+    elapsed = max(r["end"] for r in results) - min(r["start"] for r in results)
+    latencies = sorted(latency for r in results for latency in r["latencies"])
+    return {
+        "clients": len(results),
+        "depth": depth,
+        "ops": ops,
+        "ops_per_sec": ops / elapsed if elapsed else 0.0,
+        "failures": sum(r["failures"] for r in results),
+        "batches": len(latencies),
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "p999_us": percentile(latencies, 0.999) / 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generador de carga del servidor de asignación")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--address", help="Servidor existente (host:puerto o socket Unix)")
+    target.add_argument("--spawn", action="store_true", help="Iniciar un servidor propio")
+    parser.add_argument("--strategy", default="buddy", choices=list(STRATEGIES),
+                        help="Estrategia del servidor con --spawn")
+    parser.add_argument("--scale", default="1048576:64", help="MAX:MIN del servidor con --spawn")
+    parser.add_argument("--workload", default="uniform", choices=list(WORKLOADS))
+    parser.add_argument("--clients", type=int, default=4, help="Procesos cliente")
+    parser.add_argument("--depth", type=int, default=32, help="Solicitudes por lote (1 = sin pipelining)")
+    parser.add_argument("--ops", type=int, default=100000, help="Eventos por cliente")
+    parser.add_argument("--max-request", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Imprimir el resultado como JSON")
+    args = parser.parse_args(argv)
+    if args.depth < 1:
+        parser.error("--depth debe ser al menos 1")
+
+    server = None
+    address = args.address
+    if args.spawn:
+        server, address = spawn_server(args.strategy, args.scale)
+    try:
+        with ProcessPoolExecutor(max_workers=args.clients) as pool:
+            futures = [pool.submit(run_client, address, client, args.workload, args.ops,
+                                   args.depth, args.max_request, args.seed)
+                       for client in range(args.clients)]
+            summary = summarize([future.result() for future in futures], args.depth)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"{summary['clients']} clientes, lotes de {summary['depth']}: "
+              f"{summary['ops_per_sec']:.0f} solicitudes/s, "
+              f"fallas de asignación {summary['failures']}\n"
+              f"latencia por lote p50 {summary['p50_us']:.1f} µs, "
+              f"p99 {summary['p99_us']:.1f} µs, p99.9 {summary['p999_us']:.1f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
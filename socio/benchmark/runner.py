@@ -0,0 +1,249 @@
+"""
+* Objetivo:
+*   Banco de pruebas para implementaciones de MemoryAllocationStrategy
+*
+* Descripción:
+*   Reproduce cargas sintéticas o trazas sobre cualquier estrategia registrada
+*   y reporta operaciones por segundo, latencias p50/p99, memoria pico del
+*   propio asignador y fragmentación interna/externa en varias escalas
+*   de MAX_SIZE/MIN_SIZE. Uso:
+*
+*       python -m benchmark.runner --strategies buddy array-buddy --ops 20000
+*
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from strategy.registry import STRATEGIES, create_strategy
+from benchmark.workloads import ALLOC, WORKLOADS, load_trace
+from utils.scale import parse_scale
+
+DEFAULT_SCALES = [(1 << 16, 16), (1 << 20, 64)]
+
+
+def fragmentation(system):
+    """
+    Calcula la fragmentación actual de una estrategia
+
+    Args:
+        system (MemoryAllocationStrategy): Estrategia a medir
+
+    Returns:
+        tuple: (interna, externa) como proporciones de 0.0 a 1.0
+            - interna: memoria asignada sin usar / memoria asignada
+            - externa: 1 - bloque libre más grande / memoria libre
+    """
+    used = system.get_used_memory()
+    internal = 0.0
+    if used and hasattr(system, "get_requested_memory"):
+        internal = (used - system.get_requested_memory()) / used
+
+    free = system.get_free_memory()
+    external = 0.0
+    if free and hasattr(system, "get_largest_free_block"):
+        external = 1 - system.get_largest_free_block() / free
+    return internal, external
+
+
+def replay(system, events, sample_every=0):
+    """
+    Reproduce una carga de trabajo midiendo la latencia de cada operación
+
+    Args:
+        system (MemoryAllocationStrategy): Estrategia a ejercitar
+        events (iterable): Eventos (op, pid, size)
+        sample_every (int, optional): Cada cuántos eventos medir fragmentación
+            (fuera del tiempo medido). Defaults to 0 (nunca).
+
+    Returns:
+        dict: Latencias en ns, fallas de asignación y muestras de fragmentación
+    """
+    latencies = []
+    samples = []
+    failures = 0
+    allocate = system.allocate
+    release = system.release
+    clock = time.perf_counter_ns
+    for i, (op, pid, size) in enumerate(events, 1):
+        if op == ALLOC:
+            start = clock()
+            ok = allocate(pid, size)
+            latencies.append(clock() - start)
+            if not ok:
+                failures += 1
+        else:
+            start = clock()
+            release(pid)
+            latencies.append(clock() - start)
+        if sample_every and i % sample_every == 0:
+            samples.append(fragmentation(system))
+    return {"latencies": latencies, "failures": failures, "samples": samples}
+
+
+def percentile(values, fraction):
+    """Retorna el percentil indicado (0.0 a 1.0) de una lista ordenada"""
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def peak_memory(name, MAX_SIZE, MIN_SIZE, events):
+    """
+    Mide la memoria pico del asignador (estructuras internas) con tracemalloc
+
+    Returns:
+        int: Bytes pico asignados por la estrategia durante la carga
+    """
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        system = create_strategy(name, MAX_SIZE, MIN_SIZE)
+        for op, pid, size in events:
+            if op == ALLOC:
+                system.allocate(pid, size)
+            else:
+                system.release(pid)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(name, events, MAX_SIZE, MIN_SIZE, sample_every=100, measure_memory=True):
+    """
+    Ejecuta una carga de trabajo sobre una estrategia y resume los resultados
+
+    Args:
+        name (str): Nombre de la estrategia registrada
+        events (list): Eventos (op, pid, size)
+        MAX_SIZE (int): Tamaño máximo de memoria
+        MIN_SIZE (int): Tamaño mínimo de bloque
+        sample_every (int, optional): Cada cuántos eventos medir fragmentación. Defaults to 100.
+        measure_memory (bool, optional): Medir memoria pico (una pasada extra). Defaults to True.
+
+    Returns:
+        dict: ops, ops/s, p50/p99 en ns, fallas, memoria pico y fragmentación
+    """
+    # Pasada cronometrada, sin muestreo para no distorsionar el tiempo total
+    system = create_strategy(name, MAX_SIZE, MIN_SIZE)
+    start = time.perf_counter()
+    timed = replay(system, events)
+    elapsed = time.perf_counter() - start
+
+    # Pasada de muestreo de fragmentación
+    sampled = replay(create_strategy(name, MAX_SIZE, MIN_SIZE), events, sample_every)
+    samples = sampled["samples"] or [(0.0, 0.0)]
+
+    latencies = sorted(timed["latencies"])
+    allocations = sum(1 for op, _, _ in events if op == ALLOC)
+    return {
+        "strategy": name,
+        "MAX_SIZE": MAX_SIZE,
+        "MIN_SIZE": MIN_SIZE,
+        "ops": len(events),
+        "ops_per_sec": len(events) / elapsed if elapsed else 0.0,
+        "p50_ns": percentile(latencies, 0.50),
+        "p99_ns": percentile(latencies, 0.99),
+        "failure_rate": timed["failures"] / allocations if allocations else 0.0,
+        "peak_memory": peak_memory(name, MAX_SIZE, MIN_SIZE, events) if measure_memory else 0,
+        "internal_fragmentation": sum(s[0] for s in samples) / len(samples),
+        "external_fragmentation": sum(s[1] for s in samples) / len(samples),
+    }
+
+
+def format_table(results):
+    """Da formato de tabla de texto a una lista de resultados"""
+    header = (f"{'estrategia':<20}{'carga':<12}{'MAX/MIN':<14}{'ops/s':>12}"
+              f"{'p50 ns':>9}{'p99 ns':>9}{'fallas':>8}{'pico KB':>10}{'f.int':>7}{'f.ext':>7}")
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['strategy']:<20}{r.get('workload', '-'):<12}"
+            f"{str(r['MAX_SIZE']) + '/' + str(r['MIN_SIZE']):<14}"
+            f"{r['ops_per_sec']:>12.0f}{r['p50_ns']:>9}{r['p99_ns']:>9}"
+            f"{r['failure_rate']:>8.1%}{r['peak_memory'] / 1024:>10.1f}"
+            f"{r['internal_fragmentation']:>7.2f}{r['external_fragmentation']:>7.2f}")
+    return "\n".join(lines)
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    Compara ops/s contra una ejecución anterior
+
+    Args:
+        results (list): Resultados actuales
+        baseline (list): Resultados guardados con --save
+        tolerance (float): Caída relativa permitida (0.2 = 20 %)
+
+    Returns:
+        list: Mensajes de las configuraciones que empeoraron más que la tolerancia
+    """
+    def key(r):
+        return (r["strategy"], r.get("workload"), r["MAX_SIZE"], r["MIN_SIZE"])
+
+    previous = {key(r): r for r in baseline if "error" not in r}
+    regressions = []
+    for r in results:
+        old = previous.get(key(r))
+        if old and "error" not in r and r["ops_per_sec"] < old["ops_per_sec"] * (1 - tolerance):
+            regressions.append(f"{key(r)}: {old['ops_per_sec']:.0f} → {r['ops_per_sec']:.0f} ops/s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banco de pruebas de estrategias de memoria")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument("--workloads", nargs="+", default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument("--trace", action="append", default=[], help="Traza a reproducir (se puede repetir)")
+    parser.add_argument("--scales", nargs="+", type=parse_scale, default=DEFAULT_SCALES,
+                        help="Configuraciones MAX:MIN (p. ej. 65536:16)")
+    parser.add_argument("--ops", type=int, default=20000, help="Eventos por carga sintética")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="No medir memoria pico")
+    parser.add_argument("--json", action="store_true", help="Imprimir resultados como JSON")
+    parser.add_argument("--save", help="Guardar resultados en un archivo JSON")
+    parser.add_argument("--baseline", help="Comparar ops/s contra resultados guardados")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    traces = {path: load_trace(path) for path in args.trace}
+    results = []
+    for MAX_SIZE, MIN_SIZE in args.scales:
+        workloads = {name: WORKLOADS[name](args.ops, MAX_SIZE // 64, seed=args.seed)
+                     for name in args.workloads}
+        workloads.update(traces)
+        for workload, events in workloads.items():
+            for name in args.strategies:
+                try:
+                    result = run_benchmark(name, events, MAX_SIZE, MIN_SIZE,
+                                           measure_memory=not args.no_memory)
+                except Exception as error:  # Una configuración inválida no detiene el banco
+                    result = {"strategy": name, "MAX_SIZE": MAX_SIZE, "MIN_SIZE": MIN_SIZE,
+                              "error": f"{type(error).__name__}: {error}"}
+                    print(f"OMITIDA {name} {workload} {MAX_SIZE}/{MIN_SIZE}: {result['error']}",
+                          file=sys.stderr)
+                result["workload"] = workload
+                results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table([r for r in results if "error" not in r]))
+
+    if args.save:
+        with open(args.save, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as previous:
+            regressions = find_regressions(results, json.load(previous), args.tolerance)
+        for message in regressions:
+            print(f"REGRESIÓN {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
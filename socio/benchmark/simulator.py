@@ -0,0 +1,156 @@
+"""
+* Objetivo:
+*   Motor de simulación sin interfaz gráfica para estrategias de memoria
+*
+* Descripción:
+*   Hace pasar una traza (con o sin marcas de tiempo) o una carga sintética
+*   por una estrategia registrada y emite una serie de tiempo con el uso de
+*   memoria, la fragmentación y la tasa de fallas, en CSV o JSON. No importa
+*   Qt, así que sirve en CI y en servidores sin pantalla. Uso:
+*
+*       python -m benchmark.simulator --strategy tlsf --workload power-law \\
+*           --ops 1000000 --interval 10000 --format csv --output serie.csv
+*
+"""
+
+import argparse
+import csv
+import json
+import sys
+from strategy.registry import STRATEGIES, create_strategy
+from benchmark.runner import fragmentation
+from utils.scale import parse_scale
+from benchmark.workloads import ALLOC, WORKLOADS, iter_timed_trace, with_time
+
+# Columnas de cada muestra de la serie de tiempo
+FIELDS = [
+    "time", "events", "used_memory", "free_memory", "usage", "live_blocks",
+    "internal_fragmentation", "external_fragmentation", "largest_free_block",
+    "allocations", "failures", "failure_rate", "window_failure_rate",
+]
+
+
+def simulate(system, timed_events, interval):
+    """
+    Reproduce eventos con tiempo y emite una muestra del estado en cada
+    múltiplo de interval (incluye los eventos con ese mismo tiempo)
+
+    Args:
+        system (MemoryAllocationStrategy): Estrategia a ejercitar
+        timed_events (iterable): Pares (tiempo, (op, pid, size)) en orden de tiempo
+        interval (float): Tiempo entre muestras
+
+    Yields:
+        dict: Muestra con las columnas de FIELDS; la última corresponde al
+            final de la traza
+    """
+    allocate = system.allocate
+    release = system.release
+    events = allocations = failures = 0
+    window_allocations = window_failures = 0
+    next_sample = None
+    now = 0
+
+    def sample():
+        internal, external = fragmentation(system)
+        used = system.get_used_memory()
+        return {
+            "time": now,
+            "events": events,
+            "used_memory": used,
+            "free_memory": system.get_free_memory(),
+            "usage": system.get_memory_usage(),
+            "live_blocks": len(system.allocated_blocks),
+            "internal_fragmentation": internal,
+            "external_fragmentation": external,
+            "largest_free_block": system.get_largest_free_block(),
+            "allocations": allocations,
+            "failures": failures,
+            "failure_rate": failures / allocations if allocations else 0.0,
+            "window_failure_rate": window_failures / window_allocations if window_allocations else 0.0,
+        }
+
+    for timestamp, (op, pid, size) in timed_events:
+        if next_sample is None:
+            next_sample = -(-timestamp // interval) * interval  # Primer múltiplo >= timestamp
+        # Una muestra por cada límite de intervalo que el evento cruza
+        while timestamp > next_sample:
+            now = next_sample
+            yield sample()
+            window_allocations = window_failures = 0
+            next_sample += interval
+
+        now = timestamp
+        events += 1
+        if op == ALLOC:
+            allocations += 1
+            window_allocations += 1
+            if not allocate(pid, size):
+                failures += 1
+                window_failures += 1
+        else:
+            release(pid)
+
+    yield sample()
+
+
+def write_csv(samples, output):
+    """Escribe las muestras como CSV a medida que se generan"""
+    writer = csv.DictWriter(output, fieldnames=FIELDS)
+    writer.writeheader()
+    for row in samples:
+        writer.writerow(row)
+
+
+def write_json(samples, output):
+    """Escribe las muestras como un arreglo JSON a medida que se generan"""
+    output.write("[")
+    for i, row in enumerate(samples):
+        output.write(",\n" if i else "\n")
+        output.write(json.dumps(row))
+    output.write("\n]\n")
+
+
+WRITERS = {"csv": write_csv, "json": write_json}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación sin interfaz de estrategias de memoria")
+    parser.add_argument("--strategy", default="buddy", choices=list(STRATEGIES))
+    parser.add_argument("--scale", type=parse_scale, default=(1 << 20, 64),
+                        help="Configuración MAX:MIN (p. ej. 1048576:64)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--trace", help="Traza a reproducir (las líneas pueden tener marca de tiempo)")
+    source.add_argument("--workload", default="uniform", choices=list(WORKLOADS))
+    parser.add_argument("--ops", type=int, default=100000, help="Eventos de la carga sintética")
+    parser.add_argument("--max-request", type=int, help="Tamaño máximo de solicitud (por defecto MAX/64)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--interval", type=float, default=1000,
+                        help="Tiempo entre muestras (eventos si la traza no tiene marcas de tiempo)")
+    parser.add_argument("--format", default="csv", choices=list(WRITERS))
+    parser.add_argument("--output", help="Archivo de salida (por defecto la salida estándar)")
+    args = parser.parse_args(argv)
+
+    if args.interval <= 0:
+        parser.error("--interval debe ser positivo")
+    if args.interval.is_integer():
+        args.interval = int(args.interval)
+
+    MAX_SIZE, MIN_SIZE = args.scale
+    if args.trace:
+        timed_events = iter_timed_trace(args.trace)
+    else:
+        max_request = args.max_request or MAX_SIZE // 64
+        timed_events = with_time(WORKLOADS[args.workload](args.ops, max_request, seed=args.seed))
+
+    samples = simulate(create_strategy(args.strategy, MAX_SIZE, MIN_SIZE), timed_events, args.interval)
+    if args.output:
+        with open(args.output, "w", newline="") as output:
+            WRITERS[args.format](samples, output)
+    else:
+        WRITERS[args.format](samples, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+* Objetivo:
+*   Medir el tiempo de importación en frío de los módulos del proyecto
+*
+* Descripción:
+*   Importa cada módulo en un intérprete nuevo con -X importtime y reporta la
+*   mediana del tiempo acumulado, las dependencias más costosas y si el módulo
+*   arrastra PyQt6. El núcleo (utils, strategy) no debe cargar Qt; la interfaz
+*   sólo se importa al lanzar main.py. Uso:
+*
+*       python -m benchmark.startup --modules utils.buddy_system strategy.registry \\
+*           --repeat 7 --max-ms 10
+*
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ["utils.buddy_system", "strategy.registry", "benchmark.simulator",
+                   "main", "gui.visualizer"]
+
+# Imprime si el módulo cargó PyQt6 (la salida de -X importtime va a stderr)
+PROBE = "import sys, {module}; print(any(name.startswith('PyQt6') for name in sys.modules))"
+
+
+def parse_importtime(output):
+    """
+    Interpreta la salida de -X importtime
+
+    Args:
+        output (str): Texto de stderr del intérprete
+
+    Returns:
+        list: Tuplas (módulo, propio µs, acumulado µs, profundidad) en el
+            orden en que terminaron de importarse
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def measure(module, repeat=5, top=3):
+    """
+    Mide la importación en frío de un módulo
+
+    La primera ejecución sólo calienta los .pyc y no se cuenta.
+
+    Args:
+        module (str): Módulo a importar (relativo a la raíz del proyecto)
+        repeat (int, optional): Intérpretes medidos. Defaults to 5.
+        top (int, optional): Dependencias más costosas a reportar. Defaults to 3.
+
+    Returns:
+        dict: module, import_ms (mediana), loads_qt, heaviest [(módulo, ms)] o
+            error si el módulo no se puede importar
+    """
+    command = [sys.executable, "-X", "importtime", "-c", PROBE.format(module=module)]
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    totals = []
+    for run in range(repeat + 1):
+        process = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+        if process.returncode != 0:
+            error = process.stderr.strip().splitlines()[-1]
+            return {"module": module, "error": error}
+        entries = parse_importtime(process.stderr)
+        if run:
+            totals.append(next(cumulative for name, _, cumulative, depth in reversed(entries)
+                               if name == module and depth == 0))
+
+    # Dependencias directas del módulo en la última ejecución: las entradas de
+    # profundidad 1 entre la entrada de nivel superior anterior y la del módulo
+    children = []
+    for entry in entries:
+        if entry[3] == 1:
+            children.append(entry)
+        elif entry[3] == 0:
+            if entry[0] == module:
+                break
+            children = []
+    dependencies = sorted(children, key=lambda entry: entry[2], reverse=True)
+    return {
+        "module": module,
+        "import_ms": statistics.median(totals) / 1000,
+        "loads_qt": process.stdout.strip() == "True",
+        "heaviest": [(name, cumulative / 1000) for name, _, cumulative, _ in dependencies[:top]],
+    }
+
+
+def format_table(results):
+    """Da formato de tabla de texto a los resultados de measure"""
+    header = f"{'módulo':<24}{'ms':>8}{'Qt':>5}  dependencias más costosas (ms)"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        if "error" in r:
+            lines.append(f"{r['module']:<24}{'-':>8}{'-':>5}  {r['error']}")
+            continue
+        heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in r["heaviest"])
+        lines.append(f"{r['module']:<24}{r['import_ms']:>8.1f}"
+                     f"{'sí' if r['loads_qt'] else 'no':>5}  {heaviest}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de importación en frío")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5, help="Intérpretes medidos por módulo")
+    parser.add_argument("--max-ms", type=float,
+                        help="Terminar con código 1 si algún módulo que no usa Qt supera este tiempo")
+    parser.add_argument("--json", action="store_true", help="Imprimir los resultados como JSON")
+    args = parser.parse_args(argv)
+
+    results = [measure(module, args.repeat) for module in args.modules]
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+
+    if args.max_ms is not None:
+        slow = [r for r in results
+                if "error" not in r and not r["loads_qt"] and r["import_ms"] > args.max_ms]
+        if slow:
+            for r in slow:
+                print(f"{r['module']}: {r['import_ms']:.1f} ms > {args.max_ms} ms", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
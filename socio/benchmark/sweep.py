@@ -0,0 +1,170 @@
+"""
+* Objetivo:
+*   Barridos de parámetros en paralelo sobre estrategias de memoria
+*
+* Descripción:
+*   Combina estrategias, tamaños MAX_SIZE/MIN_SIZE, cargas y semillas, y
+*   reparte cada simulación independiente en un ProcessPoolExecutor (un
+*   proceso por núcleo por defecto). Cada proceso genera su propia carga, así
+*   sólo viajan los parámetros y el resumen. Los resultados se reciben en
+*   cuanto terminan (y se pueden ir guardando como JSON Lines) y al final se
+*   promedian las semillas en una tabla comparativa. Una configuración que
+*   la estrategia rechaza (p. ej. un MAX_SIZE que no es potencia de 2) queda
+*   registrada como fallida con su error y el barrido continúa. Uso:
+*
+*       python -m benchmark.sweep --strategies buddy tlsf \\
+*           --max-sizes 65536 1048576 --min-sizes 16 64 --seeds 4
+*
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from strategy.registry import STRATEGIES
+from benchmark.runner import format_table, run_benchmark
+from benchmark.workloads import WORKLOADS
+
+# Métricas que se promedian entre semillas
+AVERAGED = ("ops_per_sec", "p50_ns", "p99_ns", "failure_rate", "peak_memory",
+            "internal_fragmentation", "external_fragmentation")
+
+
+def build_tasks(strategies, max_sizes, min_sizes, workloads, seeds, ops):
+    """
+    Genera todas las combinaciones válidas de parámetros
+
+    Returns:
+        list: Diccionarios con strategy, MAX_SIZE, MIN_SIZE, workload, seed y ops
+            (se omiten las combinaciones con MIN_SIZE >= MAX_SIZE)
+    """
+    return [
+        {"strategy": strategy, "MAX_SIZE": max_size, "MIN_SIZE": min_size,
+         "workload": workload, "seed": seed, "ops": ops}
+        for max_size, min_size, workload, seed, strategy
+        in itertools.product(max_sizes, min_sizes, workloads, seeds, strategies)
+        if min_size < max_size
+    ]
+
+
+def run_task(task):
+    """
+    Ejecuta una simulación del barrido (en un proceso del pool)
+
+    Args:
+        task (dict): Parámetros generados por build_tasks
+
+    Returns:
+        dict: Resultado de run_benchmark con los parámetros de la tarea, o los
+            parámetros con el mensaje en "error" si la simulación falló
+    """
+    try:
+        events = WORKLOADS[task["workload"]](task["ops"], task["MAX_SIZE"] // 64, seed=task["seed"])
+        result = run_benchmark(task["strategy"], events, task["MAX_SIZE"], task["MIN_SIZE"],
+                               measure_memory=False)
+    except Exception as error:  # Una configuración inválida no debe detener el barrido
+        return {**task, "error": f"{type(error).__name__}: {error}"}
+    result.update(task)
+    return result
+
+
+def run_sweep(tasks, workers=None):
+    """
+    Reparte las tareas en un pool de procesos
+
+    Args:
+        tasks (list): Tareas de build_tasks
+        workers (int, optional): Procesos del pool. Defaults to None (todos los núcleos).
+
+    Yields:
+        dict: Resultado de cada tarea en el orden en que terminan
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_task, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def aggregate(results):
+    """
+    Promedia las semillas de cada configuración
+
+    Args:
+        results (list): Resultados individuales (los que tienen "error" se omiten)
+
+    Returns:
+        list: Un resultado por (estrategia, carga, MAX_SIZE, MIN_SIZE) con las
+            métricas de AVERAGED promediadas y la cantidad de semillas en "runs",
+            ordenados por configuración
+    """
+    groups = {}
+    for result in results:
+        if "error" in result:
+            continue
+        key = (result["MAX_SIZE"], result["MIN_SIZE"], result["workload"], result["strategy"])
+        groups.setdefault(key, []).append(result)
+
+    rows = []
+    for (max_size, min_size, workload, strategy), group in sorted(groups.items()):
+        row = {"strategy": strategy, "workload": workload, "MAX_SIZE": max_size,
+               "MIN_SIZE": min_size, "runs": len(group)}
+        for metric in AVERAGED:
+            row[metric] = sum(result[metric] for result in group) / len(group)
+        row["p50_ns"] = round(row["p50_ns"])
+        row["p99_ns"] = round(row["p99_ns"])
+        rows.append(row)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros en paralelo")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument("--workloads", nargs="+", default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument("--max-sizes", nargs="+", type=int, default=[1 << 16, 1 << 20])
+    parser.add_argument("--min-sizes", nargs="+", type=int, default=[16, 64])
+    parser.add_argument("--seeds", type=int, default=3, help="Semillas por configuración (0..N-1)")
+    parser.add_argument("--ops", type=int, default=20000, help="Eventos por simulación")
+    parser.add_argument("--workers", type=int, help="Procesos del pool (por defecto todos los núcleos)")
+    parser.add_argument("--output", help="Guardar cada resultado como JSON Lines a medida que llega")
+    parser.add_argument("--json", action="store_true", help="Imprimir la tabla agregada como JSON")
+    args = parser.parse_args(argv)
+
+    tasks = build_tasks(args.strategies, args.max_sizes, args.min_sizes,
+                        args.workloads, range(args.seeds), args.ops)
+    if not tasks:
+        parser.error("Ninguna combinación válida (MIN_SIZE debe ser menor que MAX_SIZE)")
+
+    print(f"{len(tasks)} simulaciones en {args.workers or os.cpu_count()} procesos", file=sys.stderr)
+    results = []
+    failed = []
+    output = open(args.output, "w") if args.output else None
+    try:
+        for done, result in enumerate(run_sweep(tasks, args.workers), 1):
+            results.append(result)
+            if output:
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+            label = (f"[{done}/{len(tasks)}] {result['strategy']} {result['workload']} "
+                     f"{result['MAX_SIZE']}/{result['MIN_SIZE']} semilla {result['seed']}")
+            if "error" in result:
+                failed.append(result)
+                print(f"{label}: error, {result['error']}", file=sys.stderr)
+            else:
+                print(f"{label}: {result['ops_per_sec']:.0f} ops/s, "
+                      f"fallas {result['failure_rate']:.1%}", file=sys.stderr)
+    finally:
+        if output:
+            output.close()
+
+    rows = aggregate(results)
+    print(json.dumps(rows, indent=2) if args.json else format_table(rows))
+    if failed:
+        print(f"{len(failed)} de {len(tasks)} simulaciones fallaron", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+* Objetivo:
+*   Cargas de trabajo sintéticas y trazas para evaluar estrategias de memoria
+*
+* Descripción:
+*   Una carga de trabajo es una secuencia de eventos (op, pid, size):
+*     - (ALLOC, pid, size): asignar size bytes al proceso pid
+*     - (RELEASE, pid, 0): liberar la memoria del proceso pid
+*   Las trazas se guardan en texto, un evento por línea ("a pid size" o "r pid").
+*   Una línea puede empezar con una marca de tiempo ("12.5 a pid size"); sin
+*   ella el tiempo de un evento es su número de orden
+*
+"""
+
+import random
+from collections import deque
+
+ALLOC = "a"
+RELEASE = "r"
+
+
+def uniform(ops, max_request, seed=0, release_ratio=0.5):
+    """
+    Tamaños uniformes en [1, max_request] y liberaciones de procesos al azar
+
+    Args:
+        ops (int): Cantidad de eventos a generar
+        max_request (int): Tamaño máximo de una solicitud
+        seed (int, optional): Semilla del generador. Defaults to 0.
+        release_ratio (float, optional): Probabilidad de liberar en cada paso. Defaults to 0.5.
+
+    Returns:
+        list: Eventos de la carga de trabajo
+    """
+    rng = random.Random(seed)
+    return _generate(ops, lambda: rng.randint(1, max_request), rng, release_ratio, "random")
+
+
+def power_law(ops, max_request, min_request=1, alpha=1.5, seed=0, release_ratio=0.5):
+    """
+    Tamaños con distribución de Pareto (muchos pequeños, pocos muy grandes)
+
+    Args:
+        ops (int): Cantidad de eventos a generar
+        max_request (int): Tamaño máximo de una solicitud
+        min_request (int, optional): Escala de la distribución. Defaults to 1.
+        alpha (float, optional): Forma de la distribución. Defaults to 1.5.
+        seed (int, optional): Semilla del generador. Defaults to 0.
+        release_ratio (float, optional): Probabilidad de liberar en cada paso. Defaults to 0.5.
+
+    Returns:
+        list: Eventos de la carga de trabajo
+    """
+    rng = random.Random(seed)
+
+    def size():
+        return min(max_request, int(min_request * rng.paretovariate(alpha)))
+
+    return _generate(ops, size, rng, release_ratio, "random")
+
+
+def lifo(ops, max_request, seed=0, release_ratio=0.5):
+    """Tamaños uniformes; siempre se libera el proceso asignado más recientemente"""
+    rng = random.Random(seed)
+    return _generate(ops, lambda: rng.randint(1, max_request), rng, release_ratio, "lifo")
+
+
+def fifo(ops, max_request, seed=0, release_ratio=0.5):
+    """Tamaños uniformes; siempre se libera el proceso asignado hace más tiempo"""
+    rng = random.Random(seed)
+    return _generate(ops, lambda: rng.randint(1, max_request), rng, release_ratio, "fifo")
+
+
+def churn(ops, max_request, live=64, seed=0):
+    """
+    Estado estable: llena hasta live procesos vivos y luego alterna una
+    liberación al azar con una asignación nueva
+
+    Args:
+        ops (int): Cantidad de eventos a generar
+        max_request (int): Tamaño máximo de una solicitud
+        live (int, optional): Procesos vivos en estado estable. Defaults to 64.
+        seed (int, optional): Semilla del generador. Defaults to 0.
+
+    Returns:
+        list: Eventos de la carga de trabajo
+    """
+    rng = random.Random(seed)
+    events = []
+    alive = []
+    pid = 1
+    while len(events) < ops:
+        if len(alive) >= live:
+            # Intercambia con el último para quitar en O(1)
+            i = rng.randrange(len(alive))
+            alive[i], alive[-1] = alive[-1], alive[i]
+            events.append((RELEASE, alive.pop(), 0))
+        else:
+            events.append((ALLOC, pid, rng.randint(1, max_request)))
+            alive.append(pid)
+            pid += 1
+    return events
+
+
+def _generate(ops, size, rng, release_ratio, order):
+    """
+    Generador común: en cada paso asigna o libera según release_ratio
+
+    Args:
+        ops (int): Cantidad de eventos
+        size (callable): Función que retorna el tamaño de la siguiente solicitud
+        rng (random.Random): Generador de números aleatorios
+        release_ratio (float): Probabilidad de liberar en cada paso
+        order (str): Proceso a liberar: "random", "lifo" o "fifo"
+
+    Returns:
+        list: Eventos de la carga de trabajo
+    """
+    events = []
+    alive = deque()
+    pid = 1
+    for _ in range(ops):
+        if alive and rng.random() < release_ratio:
+            if order == "lifo":
+                victim = alive.pop()
+            elif order == "fifo":
+                victim = alive.popleft()
+            else:
+                alive.rotate(-rng.randrange(len(alive)))
+                victim = alive.popleft()
+            events.append((RELEASE, victim, 0))
+        else:
+            events.append((ALLOC, pid, size()))
+            alive.append(pid)
+            pid += 1
+    return events
+
+
+# Cargas sintéticas: nombre → función(ops, max_request, seed)
+WORKLOADS = {
+    "uniform": uniform,
+    "power-law": power_law,
+    "lifo": lifo,
+    "fifo": fifo,
+    "churn": churn,
+}
+
+
+def save_trace(events, path):
+    """
+    Guarda una carga de trabajo como traza de texto
+
+    Args:
+        events (iterable): Eventos (op, pid, size)
+        path (str): Archivo destino
+    """
+    with open(path, "w") as trace:
+        for op, pid, size in events:
+            if op == ALLOC:
+                trace.write(f"{ALLOC} {pid} {size}\n")
+            else:
+                trace.write(f"{RELEASE} {pid}\n")
+
+
+def load_trace(path):
+    """
+    Lee una traza de texto; se ignoran líneas vacías y comentarios (#)
+
+    Args:
+        path (str): Archivo de la traza
+
+    Returns:
+        list: Eventos (op, pid, size)
+
+    Raises:
+        ValueError: Si una línea no tiene el formato esperado
+    """
+    return list(iter_trace(path))
+
+
+def iter_trace(path):
+    """Recorre una traza de texto evento por evento, sin cargarla completa"""
+    for _, event in iter_timed_trace(path):
+        yield event
+
+
+def iter_timed_trace(path):
+    """
+    Recorre una traza de texto con el tiempo de cada evento
+
+    Args:
+        path (str): Archivo de la traza
+
+    Yields:
+        tuple: (tiempo, (op, pid, size)); sin marca de tiempo el tiempo es el
+            número de evento (1, 2, ...)
+
+    Raises:
+        ValueError: Si una línea no tiene el formato esperado
+    """
+    with open(path) as trace:
+        count = 0
+        for number, line in enumerate(trace, 1):
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            count += 1
+            timestamp = count
+            if fields[0] not in (ALLOC, RELEASE):
+                try:
+                    timestamp = float(fields[0])
+                except ValueError:
+                    raise ValueError(f"Línea {number} inválida en la traza: {line.strip()}") from None
+                fields = fields[1:]
+            if fields and fields[0] == ALLOC and len(fields) == 3:
+                yield timestamp, (ALLOC, int(fields[1]), int(fields[2]))
+            elif fields and fields[0] == RELEASE and len(fields) == 2:
+                yield timestamp, (RELEASE, int(fields[1]), 0)
+            else:
+                raise ValueError(f"Línea {number} inválida en la traza: {line.strip()}")
+
+
+def with_time(events):
+    """Asigna a cada evento su número de orden como tiempo: (1, evento), (2, evento), ..."""
+    return enumerate(events, 1)
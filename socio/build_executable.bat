@@ -3,9 +3,9 @@ echo Instalando PyInstaller si no está presente...
 pip install pyinstaller
 
 echo Creando ejecutable...
-pyinstaller --name="BuddySystemVisualizer" --windowed --onefile --add-data "utils;utils" main.py
+pyinstaller --noconfirm BuddySystemVisualizer.spec
 
 echo.
 echo ¡Ejecutable creado!
-echo Encuentra tu archivo .exe en la carpeta 'dist'
+echo Encuentra BuddySystemVisualizer.exe en la carpeta 'dist\BuddySystemVisualizer'
 pause
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+* Objetivo:
+*   Configuración de pytest
+*
+* Descripción:
+*   Su presencia en la raíz del proyecto hace que pytest agregue este
+*   directorio a sys.path, así las pruebas importan los paquetes igual que
+*   la aplicación (from utils.buddy_system import ...). Uso:
+*
+*       python -m pytest -q
+*
+"""
@@ -0,0 +1,819 @@
+"""
+* Objetivo:
+*   Ventana del visualizador del Buddy System y sus elementos gráficos
+*
+* Descripción:
+*   Contiene todo lo que depende de PyQt6; main.py lo importa sólo al lanzar
+*   la aplicación. El journal (zlib, struct) se importa al guardar o cargar
+*   un estado, no al abrir la ventana.
+"""
+
+from array import array
+from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                             QPushButton, QLabel, QLineEdit, QGraphicsView, QGraphicsScene,
+                             QGraphicsItem, QGraphicsRectItem, QGraphicsTextItem,
+                             QGroupBox, QProgressBar, QSplitter, QMessageBox,
+                             QComboBox, QFormLayout, QFileDialog)
+from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPainter, QAction, QImage
+
+# Importar tu implementación del Buddy System
+from utils.buddy_system import BuddySystem, Node, EVENT_ALLOCATE, EVENT_RELEASE
+from strategy.registry import create_strategy
+
+# Estrategias que el visualizador sabe dibujar (árbol buddy o bloques lineales)
+VISUAL_STRATEGIES = {
+    "Buddy System": "buddy",
+    "Buddy System (combinación diferida)": "buddy-lazy",
+    "Buddy System (recorte de cola)": "buddy-trim",
+    "Buddy System (arreglos)": "array-buddy",
+    "TLSF": "tlsf",
+    "Ajuste segregado": "segregated-fit",
+}
+
+def process_blocks_of(system, pid):
+    """
+    Retorna los bloques de un proceso sin depender del índice interno de la estrategia
+
+    Con trim_tail un proceso puede tener varios bloques (blocks_of); las demás
+    estrategias exponen su único bloque con lookup.
+    """
+    if hasattr(system, "blocks_of"):
+        return system.blocks_of(pid)
+    return [system.lookup(pid)]
+
+class MemoryBlockItem(QGraphicsRectItem):
+    def __init__(self, x, y, width, height, text, status, size):
+        super().__init__(x, y, width, height)
+        self.setPen(QPen(QColor(0, 0, 0), 1))
+        
+        # Añadir texto centrado
+        self.text_item = QGraphicsTextItem()
+        
+        # Ajustar tamaño de fuente según el tamaño del bloque
+        font_size = 10 if size >= 128 else 8
+        self.text_item.setFont(QFont("Arial", font_size, QFont.Weight.Bold))
+        
+        self.set_state(text, status)
+    
+    def set_state(self, text, status):
+        """Cambia el color y el texto del bloque sin recrear el elemento"""
+        # Configurar colores según el estado
+        if status == "allocated":
+            brush = QBrush(QColor(255, 100, 100))  # Rojo
+            text_color = QColor(255, 255, 255)     # Blanco
+        elif status == "split":
+            brush = QBrush(QColor(100, 100, 255))  # Azul
+            text_color = QColor(255, 255, 255)     # Blanco
+        else:
+            brush = QBrush(QColor(100, 255, 100))  # Verde
+            text_color = QColor(0, 0, 0)           # Negro
+            
+        self.setBrush(brush)
+        self.text_item.setPlainText(text)
+        self.text_item.setDefaultTextColor(text_color)
+        
+        rect = self.rect()
+        text_rect = self.text_item.boundingRect()
+        text_x = rect.x() + (rect.width() - text_rect.width()) / 2
+        text_y = rect.y() + (rect.height() - text_rect.height()) / 2
+        self.text_item.setPos(text_x, text_y)
+        
+        # Sólo se muestra el texto si cabe dentro del bloque
+        self.text_item.setVisible(text_rect.width() <= rect.width())
+
+# Umbrales del dibujo por nivel de detalle, en píxeles de pantalla
+MIN_NODE_PIXELS = 6  # Hijos más angostos se dibujan como un bloque agregado del padre
+LABEL_PIXELS = 48  # Ancho mínimo de un bloque para dibujar su texto
+LABEL_MIN_HEIGHT = 20  # Alto mínimo de un bloque para dibujar su texto
+LEVEL_SPACING = 80  # Separación vertical entre niveles del árbol
+
+# Colores de los bloques según su estado
+FREE_COLOR = QColor(100, 255, 100)  # Verde
+SPLIT_COLOR = QColor(100, 100, 255)  # Azul
+ALLOCATED_COLOR = QColor(255, 100, 100)  # Rojo
+
+class BuddyTreeItem(QGraphicsItem):
+    """
+    Dibuja el árbol completo como un solo elemento de la escena
+    
+    Cada pintado recorre el árbol desde la raíz descartando los subárboles
+    fuera del área expuesta. Cuando los hijos de un nodo dividido quedarían
+    más angostos que MIN_NODE_PIXELS (o el subárbol está completamente libre
+    o asignado y sus hijos no alcanzarían a mostrar texto) el subárbol se
+    dibuja como un bloque agregado coloreado según su uso, así el costo
+    depende de los píxeles visibles y no de la cantidad de nodos.
+    """
+    
+    def __init__(self, system, width):
+        super().__init__()
+        self.system = system
+        self.width = width
+        self.height = 50 + (system.MAX_ORDER + 1) * LEVEL_SPACING
+        self.used_per_subtree = {}  # (profundidad, dirección) → bytes asignados en el subárbol
+        self.font = QFont("Arial", 8, QFont.Weight.Bold)
+        # Necesario para recibir el área expuesta en option.exposedRect
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        
+        for pid in system.allocated_blocks:
+            for node in process_blocks_of(system, pid):
+                self.track(node, node.size)
+    
+    def boundingRect(self):
+        return QRectF(0, 0, self.width, self.height)
+    
+    def node_level(self, node):
+        """Retorna la profundidad de un nodo (0 = raíz más grande)"""
+        return (self.system.order_sizes[-1] // node.size).bit_length() - 1
+    
+    def track(self, node, delta):
+        """Suma delta bytes asignados a un nodo y a todos sus ancestros, en O(profundidad)"""
+        for level in range(self.node_level(node), -1, -1):
+            span = self.system.order_sizes[-1] >> level
+            key = (level, node.offset - node.offset % span)
+            used = self.used_per_subtree.get(key, 0) + delta
+            if used:
+                self.used_per_subtree[key] = used
+            else:
+                self.used_per_subtree.pop(key, None)
+    
+    def on_allocator_event(self, event, node):
+        """Actualiza el uso por subárbol y programa un repintado"""
+        if event == EVENT_ALLOCATE:
+            self.track(node, node.size)
+        elif event == EVENT_RELEASE:
+            self.track(node, -node.size)
+        # Qt agrupa los repintados pendientes; sólo se vuelve a dibujar lo visible
+        self.update()
+    
+    def paint(self, painter, option, widget=None):
+        transform = painter.worldTransform()
+        painter.setFont(self.font)
+        # Con MAX_SIZE que no es potencia de 2 hay varias raíces, cada una en su nivel
+        for root in getattr(self.system, "roots", None) or [self.system.root]:
+            self.draw_node(painter, root, self.node_level(root), option.exposedRect,
+                           transform.m11(), transform.m22())
+    
+    def draw_node(self, painter, node, level, exposed, scale_x, scale_y):
+        """
+        Dibuja un nodo y, si el nivel de detalle lo permite, sus hijos
+        
+        Args:
+            painter (QPainter): Pintor de la escena
+            node (Node): Nodo a dibujar
+            level (int): Profundidad del nodo
+            exposed (QRectF): Área de la escena que se debe repintar
+            scale_x (float): Píxeles por unidad horizontal de la escena
+            scale_y (float): Píxeles por unidad vertical de la escena
+        """
+        size = node.size
+        slot_x = node.offset / self.system.MAX_SIZE * self.width
+        slot_width = size / self.system.MAX_SIZE * self.width
+        y = 50 + level * LEVEL_SPACING
+        if slot_x > exposed.right() or slot_x + slot_width < exposed.left() or y > exposed.bottom():
+            return  # Fuera del área visible: ni el nodo ni sus hijos se dibujan
+        
+        height = max(40 - level * 3, 25)
+        pen = QPen(QColor(0, 0, 0), 0)  # Trazo cosmético de un píxel
+        
+        if node.is_split:
+            used = self.used_per_subtree.get((level, node.offset), 0)
+            child_pixels = slot_width / 2 * scale_x
+            homogeneous = used == 0 or used == size
+            if child_pixels < MIN_NODE_PIXELS or (homogeneous and child_pixels < LABEL_PIXELS):
+                # Subárbol agregado: un bloque del ancho del nodo coloreado según su uso
+                rect = QRectF(slot_x, y, slot_width, height)
+                painter.setPen(pen)
+                painter.setBrush(QBrush(self.usage_color(used / size)))
+                painter.drawRect(rect)
+                self.draw_label(painter, rect, f"{used * 100 // size}% usado\n{size}B",
+                                QColor(0, 0, 0), scale_x, scale_y)
+                return
+        
+        width = min(max(100 - level * 5, 60), slot_width * 0.9)
+        x = slot_x + slot_width / 2
+        rect = QRectF(x - width / 2, y, width, height)
+        if node.is_allocated:
+            color, text, text_color = ALLOCATED_COLOR, f"PID {node.pid}\n{size}B", QColor(255, 255, 255)
+        elif node.is_split:
+            color, text, text_color = SPLIT_COLOR, f"DIV\n{size}B", QColor(255, 255, 255)
+        else:
+            color, text, text_color = FREE_COLOR, f"LIBRE\n{size}B", QColor(0, 0, 0)
+        painter.setPen(pen)
+        painter.setBrush(QBrush(color))
+        painter.drawRect(rect)
+        self.draw_label(painter, rect, text, text_color, scale_x, scale_y)
+        
+        if node.is_split:
+            child_y = y + LEVEL_SPACING
+            painter.setPen(QPen(Qt.GlobalColor.gray, 0))
+            painter.drawLine(QPointF(x, y + height), QPointF(x - slot_width / 4, child_y))
+            painter.drawLine(QPointF(x, y + height), QPointF(x + slot_width / 4, child_y))
+            self.draw_node(painter, node.left, level + 1, exposed, scale_x, scale_y)
+            self.draw_node(painter, node.right, level + 1, exposed, scale_x, scale_y)
+    
+    def draw_label(self, painter, rect, text, color, scale_x, scale_y):
+        """Dibuja el texto de un bloque en coordenadas de pantalla si cabe"""
+        if rect.width() * scale_x < LABEL_PIXELS or rect.height() * scale_y < LABEL_MIN_HEIGHT:
+            return
+        # El texto se dibuja sin la transformación para que no se deforme con el zoom
+        device_rect = painter.worldTransform().mapRect(rect)
+        painter.save()
+        painter.resetTransform()
+        painter.setPen(color)
+        painter.drawText(device_rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+    
+    @staticmethod
+    def usage_color(fraction):
+        """Interpola entre el color libre y el asignado según la fracción usada"""
+        return QColor(int(FREE_COLOR.red() + (ALLOCATED_COLOR.red() - FREE_COLOR.red()) * fraction),
+                      int(FREE_COLOR.green() + (ALLOCATED_COLOR.green() - FREE_COLOR.green()) * fraction),
+                      int(FREE_COLOR.blue() + (ALLOCATED_COLOR.blue() - FREE_COLOR.blue()) * fraction))
+
+class MemoryMapItem(QGraphicsItem):
+    """
+    Mapa lineal de direcciones: una franja donde cada bloque mínimo tiene el
+    color de su estado (libre o el color de su PID)
+    
+    Los colores se guardan en un arreglo compacto de un entero por bloque
+    mínimo que se pinta de una vez como un QImage de una fila, en lugar de
+    crear un elemento de la escena por bloque.
+    """
+    
+    def __init__(self, system):
+        super().__init__()
+        # Unidad del mapa: el bloque más pequeño que la estrategia puede entregar
+        self.unit = getattr(system, "order_sizes", [system.MIN_SIZE])[0]
+        self.length = system.MAX_SIZE // self.unit
+        self.free_color = FREE_COLOR.rgb()
+        self.pixels = array("I", [self.free_color]) * self.length  # Color RGB32 por bloque mínimo
+        self.image = None  # QImage construido bajo demanda desde pixels
+        self.rebuild(system)
+    
+    def boundingRect(self):
+        # Una unidad de la escena por bloque mínimo y una de alto
+        return QRectF(0, 0, self.length, 1)
+    
+    @staticmethod
+    def pid_color(pid):
+        """Color estable y distinguible para cada PID"""
+        return QColor.fromHsv((pid * 47) % 360, 170, 235).rgb()
+    
+    def fill(self, offset, size, color):
+        """Colorea los bloques mínimos de [offset, offset + size) y programa un repintado"""
+        start = offset // self.unit
+        count = max(size // self.unit, 1)
+        self.pixels[start:start + count] = array("I", [color]) * count
+        self.image = None
+        self.update()
+    
+    def rebuild(self, system):
+        """Recalcula el mapa completo recorriendo los bloques de la estrategia"""
+        self.pixels = array("I", [self.free_color]) * self.length
+        for block in system:
+            if block.is_allocated:
+                self.fill(block.offset, block.size, self.pid_color(block.pid))
+        self.image = None
+        self.update()
+    
+    def on_allocator_event(self, event, node):
+        """Sólo las asignaciones y liberaciones cambian el mapa"""
+        if event == EVENT_ALLOCATE:
+            self.fill(node.offset, node.size, self.pid_color(node.pid))
+        elif event == EVENT_RELEASE:
+            self.fill(node.offset, node.size, self.free_color)
+    
+    def paint(self, painter, option, widget=None):
+        if self.image is None:
+            # copy() desliga la imagen del buffer temporal de bytes
+            self.image = QImage(self.pixels.tobytes(), self.length, 1, self.length * 4,
+                                QImage.Format.Format_RGB32).copy()
+        painter.drawImage(self.boundingRect(), self.image)
+
+class BuddySystemVisualizer(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.buddy_system = None
+        self.incremental = False  # El asignador notifica sus cambios con eventos
+        self.tree_item = None  # BuddyTreeItem de la estrategia actual (None si no es un árbol)
+        self.process_blocks = {}  # (profundidad, dirección) → PID, para quitarlo de la lista al liberar
+        self.process_sizes = {}  # PID → bytes de todos sus bloques
+        self.tree_width = 2000
+        self.initUI()
+        
+    def initUI(self):
+        self.setWindowTitle("Buddy System Memory Management - Tree Visualizer")
+        self.setGeometry(50, 50, 1600, 900)
+        
+        # Widget central
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QHBoxLayout(central_widget)
+        
+        # Splitter con proporción 25%-75%
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        
+        # Panel izquierdo: Controles (25%)
+        left_panel = QWidget()
+        left_panel.setMaximumWidth(400)
+        left_layout = QVBoxLayout(left_panel)
+        
+        # Grupo de configuración del sistema
+        config_group = QGroupBox("Configuración del Sistema")
+        config_layout = QFormLayout(config_group)
+        
+        # Selección de la estrategia de administración de memoria
+        strategy_layout = QHBoxLayout()
+        strategy_layout.addWidget(QLabel("Estrategia:"))
+        self.strategy_combo = QComboBox()
+        for label, name in VISUAL_STRATEGIES.items():
+            self.strategy_combo.addItem(label, name)
+        strategy_layout.addWidget(self.strategy_combo)
+        config_layout.addRow(strategy_layout)
+        
+        # Entrada para tamaño máximo de memoria (potencias de 2 o un valor escrito)
+        max_size_layout = QHBoxLayout()
+        max_size_layout.addWidget(QLabel("Tamaño máximo:"))
+        self.max_size_combo = QComboBox()
+        self.max_size_combo.setEditable(True)
+        # Agregar opciones de potencias de 2
+        sizes = [64, 128, 256, 512, 1024, 2048, 4096, 8192, 65536, 1048576]
+        for size in sizes:
+            self.max_size_combo.addItem(f"{size} KB", size)
+        self.max_size_combo.setCurrentIndex(4)  # 1024 KB por defecto
+        max_size_layout.addWidget(self.max_size_combo)
+        config_layout.addRow(max_size_layout)
+
+        # Entrada para tamaño mínimo de bloque (potencias de 2)
+        min_size_layout = QHBoxLayout()
+        min_size_layout.addWidget(QLabel("Tamaño mínimo:"))
+        self.min_size_combo = QComboBox()
+        # Agregar opciones de potencias de 2 (más pequeñas)
+        min_sizes = [8, 16, 32, 64, 128, 256]
+        for size in min_sizes:
+            self.min_size_combo.addItem(f"{size} KB", size)
+        self.min_size_combo.setCurrentIndex(3)  # 64 KB por defecto
+        min_size_layout.addWidget(self.min_size_combo)
+        config_layout.addRow(min_size_layout)
+        
+        # Botón para inicializar el sistema
+        self.init_btn = QPushButton("Inicializar Sistema")
+        self.init_btn.clicked.connect(self.initialize_system)
+        config_layout.addRow(self.init_btn)
+        
+        # Guardar y cargar el estado del Buddy System (snapshot)
+        state_layout = QHBoxLayout()
+        self.save_state_btn = QPushButton("Guardar Estado")
+        self.save_state_btn.clicked.connect(self.save_state)
+        state_layout.addWidget(self.save_state_btn)
+        self.load_state_btn = QPushButton("Cargar Estado")
+        self.load_state_btn.clicked.connect(self.load_state)
+        state_layout.addWidget(self.load_state_btn)
+        config_layout.addRow(state_layout)
+        
+        left_layout.addWidget(config_group)
+        
+        # Grupo de controles
+        controls_group = QGroupBox("Controles de Memoria")
+        controls_layout = QVBoxLayout(controls_group)
+        
+        # Entrada para PID
+        pid_layout = QHBoxLayout()
+        pid_layout.addWidget(QLabel("PID:"))
+        self.pid_input = QLineEdit()
+        self.pid_input.setPlaceholderText("ID del proceso")
+        pid_layout.addWidget(self.pid_input)
+        controls_layout.addLayout(pid_layout)
+        
+        # Entrada para tamaño
+        size_layout = QHBoxLayout()
+        size_layout.addWidget(QLabel("Tamaño:"))
+        self.size_input = QLineEdit()
+        self.size_input.setPlaceholderText("Tamaño en bytes")
+        size_layout.addWidget(self.size_input)
+        controls_layout.addLayout(size_layout)
+        
+        # Botones
+        buttons_layout = QHBoxLayout()
+        self.allocate_btn = QPushButton("Asignar Memoria")
+        self.allocate_btn.clicked.connect(self.allocate_memory)
+        self.allocate_btn.setEnabled(False)
+        buttons_layout.addWidget(self.allocate_btn)
+        controls_layout.addLayout(buttons_layout)
+        
+        # Entrada para asignar un lote de procesos (pid:tamaño, pid:tamaño, ...)
+        batch_layout = QHBoxLayout()
+        batch_layout.addWidget(QLabel("Lote:"))
+        self.batch_input = QLineEdit()
+        self.batch_input.setPlaceholderText("pid:tamaño, pid:tamaño, ...")
+        batch_layout.addWidget(self.batch_input)
+        controls_layout.addLayout(batch_layout)
+        
+        batch_buttons_layout = QHBoxLayout()
+        self.allocate_batch_btn = QPushButton("Asignar Lote")
+        self.allocate_batch_btn.clicked.connect(self.allocate_batch)
+        self.allocate_batch_btn.setEnabled(False)
+        batch_buttons_layout.addWidget(self.allocate_batch_btn)
+        self.release_all_btn = QPushButton("Liberar Todos")
+        self.release_all_btn.clicked.connect(self.release_all_memory)
+        self.release_all_btn.setEnabled(False)
+        batch_buttons_layout.addWidget(self.release_all_btn)
+        controls_layout.addLayout(batch_buttons_layout)
+        
+        # Barras de progreso para memoria
+        memory_info_layout = QVBoxLayout()
+        
+        # Barra de memoria usada
+        used_layout = QHBoxLayout()
+        used_layout.addWidget(QLabel("Memoria Usada:"))
+        self.memory_used_bar = QProgressBar()
+        self.memory_used_bar.setFormat("%v bytes (%p%)")
+        self.memory_used_bar.setStyleSheet("QProgressBar::chunk { background-color: #ff6464; }")
+        used_layout.addWidget(self.memory_used_bar)
+        memory_info_layout.addLayout(used_layout)
+        
+        # Barra de memoria libre
+        free_layout = QHBoxLayout()
+        free_layout.addWidget(QLabel("Memoria Libre:"))
+        self.memory_free_bar = QProgressBar()
+        self.memory_free_bar.setFormat("%v bytes (%p%)")
+        self.memory_free_bar.setStyleSheet("QProgressBar::chunk { background-color: #5F7689; }")
+        free_layout.addWidget(self.memory_free_bar)
+        memory_info_layout.addLayout(free_layout)
+        
+        # Etiqueta de fragmentación interna (memoria asignada - solicitada)
+        self.fragmentation_label = QLabel("Fragmentación interna: 0 bytes")
+        memory_info_layout.addWidget(self.fragmentation_label)
+        
+        controls_layout.addLayout(memory_info_layout)
+        left_layout.addWidget(controls_group)
+        
+        # Menú desplegable de procesos
+        processes_group = QGroupBox("Gestión de Procesos")
+        processes_layout = QVBoxLayout(processes_group)
+        
+        # ComboBox para seleccionar procesos
+        self.process_combo = QComboBox()
+        self.process_combo.setPlaceholderText("Seleccione un proceso")
+        self.process_combo.currentIndexChanged.connect(self.on_process_selected)
+        processes_layout.addWidget(QLabel("Seleccionar proceso:"))
+        processes_layout.addWidget(self.process_combo)
+        
+        # Botón para liberar proceso seleccionado
+        self.release_selected_btn = QPushButton("Liberar Proceso")
+        self.release_selected_btn.clicked.connect(self.release_selected_memory)
+        self.release_selected_btn.setEnabled(False)
+        processes_layout.addWidget(self.release_selected_btn)
+        
+        left_layout.addWidget(processes_group)
+        left_layout.addStretch()
+        
+        # Panel derecho: Visualización (75%)
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        
+        visualization_group = QGroupBox("Visualización del Árbol Buddy System")
+        visualization_layout = QVBoxLayout(visualization_group)
+        
+        self.scene = QGraphicsScene()
+        self.view = QGraphicsView(self.scene)
+        self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.view.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self.view.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.view.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        
+        # Habilitar zoom con rueda del mouse
+        self.view.wheelEvent = self.zoom_event
+        
+        visualization_layout.addWidget(self.view)
+        right_layout.addWidget(visualization_group)
+        
+        # Mapa lineal de direcciones (una franja, siempre completa)
+        memory_map_group = QGroupBox("Mapa de Memoria")
+        memory_map_layout = QVBoxLayout(memory_map_group)
+        self.map_scene = QGraphicsScene()
+        self.map_view = QGraphicsView(self.map_scene)
+        self.map_view.setFixedHeight(70)
+        self.map_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.map_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.map_view.resizeEvent = self.map_resize_event
+        self.map_item = None
+        memory_map_layout.addWidget(self.map_view)
+        right_layout.addWidget(memory_map_group)
+        
+        # Añadir paneles al splitter
+        splitter.addWidget(left_panel)
+        splitter.addWidget(right_panel)
+        splitter.setSizes([400, 1200])
+        
+        main_layout.addWidget(splitter)
+        
+        # Menú contextual para el árbol
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+        zoom_in_action = QAction("Zoom +", self)
+        zoom_in_action.triggered.connect(self.zoom_in)
+        zoom_out_action = QAction("Zoom -", self)
+        zoom_out_action.triggered.connect(self.zoom_out)
+        reset_zoom_action = QAction("Reset Zoom", self)
+        reset_zoom_action.triggered.connect(self.reset_zoom)
+        self.addAction(zoom_in_action)
+        self.addAction(zoom_out_action)
+        self.addAction(reset_zoom_action)
+        
+        # Inicializar con un sistema por defecto
+        self.initialize_system()
+    
+    def initialize_system(self):
+        try:
+            max_size = int(self.max_size_combo.currentText().split()[0])
+        except (ValueError, IndexError):
+            QMessageBox.warning(self, "Error", "El tamaño máximo debe ser un número entero")
+            return
+        min_size = self.min_size_combo.currentData()    
+
+        if min_size >= max_size:
+            QMessageBox.warning(self, "Error", "El tamaño mínimo debe ser menor que el tamaño máximo")
+            return
+            
+        if max_size % min_size != 0:
+            QMessageBox.warning(self, "Error", "El tamaño máximo debe ser múltiplo del tamaño mínimo")
+            return
+            
+        try:
+            system = create_strategy(self.strategy_combo.currentData(), max_size, min_size)
+        except ValueError as error:
+            # Sólo el Buddy System admite tamaños que no son potencia de 2
+            QMessageBox.warning(self, "Error", str(error))
+            return
+        self.set_system(system)
+    
+    def set_system(self, system):
+        """Muestra una estrategia ya creada y habilita los controles"""
+        self.buddy_system = system
+        
+        # Ancho fijo del árbol: cada bloque mínimo tiene su propia columna
+        self.tree_width = max(2000, 60 * (system.MAX_SIZE // system.MIN_SIZE))
+        self.incremental = hasattr(self.buddy_system, "add_listener")
+        if self.incremental:
+            self.buddy_system.add_listener(self.on_allocator_event)
+        self.rebuild_view()
+        self.update_interface()
+        
+        # Habilitar controles
+        self.allocate_btn.setEnabled(True)
+        self.allocate_batch_btn.setEnabled(True)
+        self.release_all_btn.setEnabled(True)
+        self.release_selected_btn.setEnabled(True)
+        self.save_state_btn.setEnabled(isinstance(system, BuddySystem) and not system.trim_tail)
+    
+    def save_state(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Guardar Estado", "", "Snapshot (*.snapshot)")
+        if not path:
+            return
+        from utils.journal import save_snapshot
+        try:
+            save_snapshot(self.buddy_system, path)
+        except OSError as error:
+            QMessageBox.warning(self, "Error", f"No se pudo guardar el estado: {error}")
+    
+    def load_state(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Cargar Estado", "", "Snapshot (*.snapshot)")
+        if not path:
+            return
+        from utils.journal import restore
+        try:
+            system = restore(path)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self, "Error", f"No se pudo cargar el estado: {error}")
+            return
+        self.strategy_combo.setCurrentIndex(self.strategy_combo.findData("buddy"))
+        self.set_system(system)
+    
+    def map_resize_event(self, event):
+        # El mapa siempre ocupa todo el ancho de su vista
+        QGraphicsView.resizeEvent(self.map_view, event)
+        self.fit_memory_map()
+    
+    def fit_memory_map(self):
+        if self.map_item is not None:
+            self.map_view.fitInView(self.map_item.boundingRect(), Qt.AspectRatioMode.IgnoreAspectRatio)
+    
+    def zoom_event(self, event):
+        # Zoom con la rueda del mouse
+        if event.angleDelta().y() > 0:
+            self.zoom_in()
+        else:
+            self.zoom_out()
+    
+    def zoom_in(self):
+        # El árbol tiene pocos niveles y muchas hojas: sólo se amplía a lo ancho
+        self.view.scale(1.2, 1.0 if self.tree_item else 1.2)
+    
+    def zoom_out(self):
+        self.view.scale(0.8, 1.0 if self.tree_item else 0.8)
+    
+    def reset_zoom(self):
+        self.view.resetTransform()
+    
+    def allocate_memory(self):
+        if not self.buddy_system:
+            QMessageBox.warning(self, "Error", "Primero debe inicializar el sistema")
+            return
+            
+        try:
+            pid = int(self.pid_input.text())
+            size = int(self.size_input.text())
+            
+            if pid <= 0 or size <= 0:
+                QMessageBox.warning(self, "Error", "Los valores deben ser positivos")
+                return
+                
+            success = self.buddy_system.allocate(pid, size)
+            if success:
+                self.update_interface()
+                self.pid_input.clear()
+                self.size_input.clear()
+            else:
+                QMessageBox.warning(self, "Error", "No se pudo asignar memoria. Memoria insuficiente o PID duplicado")
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Por favor ingrese valores numéricos válidos")
+    
+    def allocate_batch(self):
+        if not self.buddy_system:
+            QMessageBox.warning(self, "Error", "Primero debe inicializar el sistema")
+            return
+            
+        try:
+            requests = []
+            for item in self.batch_input.text().split(","):
+                if not item.strip():
+                    continue
+                pid_text, size_text = item.split(":")
+                pid, size = int(pid_text), int(size_text)
+                if pid <= 0 or size <= 0:
+                    QMessageBox.warning(self, "Error", "Los valores deben ser positivos")
+                    return
+                requests.append((pid, size))
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Formato de lote inválido. Use pid:tamaño separados por comas")
+            return
+            
+        results = self.buddy_system.allocate_many(requests)
+        # Redibujar una sola vez para todo el lote
+        self.update_interface()
+        
+        failed = [str(pid) for (pid, _), offset in zip(requests, results) if offset < 0]
+        if failed:
+            QMessageBox.warning(self, "Error", f"No se pudo asignar memoria a los PID: {', '.join(failed)}")
+        else:
+            self.batch_input.clear()
+    
+    def release_all_memory(self):
+        if not self.buddy_system:
+            QMessageBox.warning(self, "Error", "Primero debe inicializar el sistema")
+            return
+            
+        self.buddy_system.release_many(list(self.buddy_system.allocated_blocks))
+        self.update_interface()
+    
+    def release_memory(self):
+        if not self.buddy_system:
+            QMessageBox.warning(self, "Error", "Primero debe inicializar el sistema")
+            return
+            
+        try:
+            pid = int(self.pid_input.text())
+            success = self.buddy_system.release(pid)
+            if success:
+                self.update_interface()
+                self.pid_input.clear()
+            else:
+                QMessageBox.warning(self, "Error", "PID no encontrado")
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Por favor ingrese un PID numérico válido")
+    
+    def release_selected_memory(self):
+        if not self.buddy_system:
+            QMessageBox.warning(self, "Error", "Primero debe inicializar el sistema")
+            return
+            
+        if self.process_combo.currentIndex() > 0:
+            pid_text = self.process_combo.currentText().split(":")[0]
+            try:
+                pid = int(pid_text)
+                self.pid_input.setText(str(pid))
+                self.release_memory()
+            except ValueError:
+                QMessageBox.warning(self, "Error", "Error al obtener el PID")
+    
+    def on_process_selected(self, index):
+        if index > 0:
+            pid_text = self.process_combo.currentText().split(":")[0]
+            self.pid_input.setText(pid_text)
+    
+    def update_interface(self):
+        if not self.buddy_system:
+            return
+            
+        # Actualizar barras de progreso
+        used_memory = self.buddy_system.get_used_memory()
+        free_memory = self.buddy_system.get_free_memory()
+        total_memory = self.buddy_system.MAX_SIZE
+        
+        self.memory_used_bar.setMaximum(total_memory)
+        self.memory_used_bar.setValue(used_memory)
+        
+        self.memory_free_bar.setMaximum(total_memory)
+        self.memory_free_bar.setValue(free_memory)
+        
+        self.fragmentation_label.setText(
+            f"Fragmentación interna: {self.buddy_system.get_internal_fragmentation()} bytes")
+        
+        # Con eventos del asignador la escena y los procesos ya están al día
+        if not self.incremental:
+            self.rebuild_view()
+    
+    def rebuild_view(self):
+        """Reconstruye por completo la escena, el mapa de memoria y la lista de procesos"""
+        self.map_scene.clear()
+        self.map_item = MemoryMapItem(self.buddy_system)
+        self.map_scene.addItem(self.map_item)
+        self.map_scene.setSceneRect(self.map_item.boundingRect())
+        self.fit_memory_map()
+        
+        self.scene.clear()
+        
+        if hasattr(self.buddy_system, "root"):
+            self.tree_item = BuddyTreeItem(self.buddy_system, self.tree_width)
+            self.scene.addItem(self.tree_item)
+            self.scene.setSceneRect(self.tree_item.boundingRect())
+            # El ancho y el alto se ajustan por separado: el texto se dibuja sin deformar
+            self.view.fitInView(self.tree_item.boundingRect(), Qt.AspectRatioMode.IgnoreAspectRatio)
+        else:
+            # Estrategias sin árbol: bloques en orden de dirección
+            self.tree_item = None
+            self.draw_blocks()
+            self.scene.setSceneRect(self.scene.itemsBoundingRect())
+            self.view.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        
+        # Actualizar combo box de procesos
+        self.process_combo.clear()
+        self.process_combo.addItem("Seleccione un proceso")
+        self.process_blocks.clear()
+        
+        # Obtener los procesos asignados desde el índice de PIDs, ordenados por PID
+        self.process_sizes.clear()
+        for pid in sorted(self.buddy_system.allocated_blocks):
+            blocks = process_blocks_of(self.buddy_system, pid)
+            self.process_sizes[pid] = sum(block.size for block in blocks)
+            self.process_combo.addItem(f"{pid}: {self.process_sizes[pid]} bytes", pid)
+            if self.tree_item is not None:
+                for block in blocks:
+                    self.process_blocks[(self.tree_item.node_level(block), block.offset)] = pid
+    
+    def on_allocator_event(self, event, node):
+        """Actualiza el árbol y la lista de procesos con un cambio del asignador"""
+        self.tree_item.on_allocator_event(event, node)
+        self.map_item.on_allocator_event(event, node)
+        if event == EVENT_ALLOCATE:
+            self.process_blocks[(self.tree_item.node_level(node), node.offset)] = node.pid
+            if node.pid in self.process_sizes:
+                # Bloque de la cola de un proceso (trim_tail): se suma a su entrada
+                self.process_sizes[node.pid] += node.size
+                index = self.process_combo.findData(node.pid)
+                self.process_combo.setItemText(index, f"{node.pid}: {self.process_sizes[node.pid]} bytes")
+            else:
+                self.process_sizes[node.pid] = node.size
+                self.add_process_item(node.pid, node.size)
+        elif event == EVENT_RELEASE:
+            pid = self.process_blocks.pop((self.tree_item.node_level(node), node.offset), None)
+            if self.process_sizes.pop(pid, None) is not None:
+                index = self.process_combo.findData(pid)
+                if index > 0:
+                    self.process_combo.removeItem(index)
+    
+    def add_process_item(self, pid, size):
+        """Inserta un proceso en el combo box manteniendo el orden por PID"""
+        index = 1
+        while index < self.process_combo.count() and self.process_combo.itemData(index) < pid:
+            index += 1
+        self.process_combo.insertItem(index, f"{pid}: {size} bytes", pid)
+    
+    def draw_blocks(self, width=1600, height=60):
+        """Dibuja los bloques de una estrategia sin árbol como una franja de direcciones"""
+        total_memory = self.buddy_system.MAX_SIZE
+        for block in self.buddy_system:
+            x = block.offset / total_memory * width
+            block_width = block.size / total_memory * width
+            if block.is_allocated:
+                status = "allocated"
+                text = f"PID {block.pid}\n{block.size}B"
+            else:
+                status = "free"
+                text = f"LIBRE\n{block.size}B"
+            rect = MemoryBlockItem(x, 0, block_width, height, text, status, block.size)
+            self.scene.addItem(rect)
+            self.scene.addItem(rect.text_item)
@@ -0,0 +1,178 @@
+"""
+* Objetivo:
+*   Cliente del servidor de asignación
+*
+* Descripción:
+*   Conexión bloqueante con el protocolo de service/protocol.py. Cada método
+*   hace una solicitud y espera su respuesta; pipeline() acumula solicitudes
+*   y las envía en una sola escritura, leyendo después todas las respuestas,
+*   lo que evita un viaje de ida y vuelta por operación. Uso:
+*
+*       with AllocatorClient("127.0.0.1:7070") as client:
+*           offset = client.allocate(pid, 4096)
+*           batch = client.pipeline()
+*           for pid in pids:
+*               batch.release(pid)
+*           results = batch.execute()
+*
+"""
+
+import socket
+from service.protocol import (FRAME, REPLY, STATS, REQUEST_FRAME, REQUEST,
+                              OP_ALLOCATE, OP_RELEASE, OP_STATS,
+                              STATUS_OK, STATUS_ERROR, STATS_FIELDS, parse_address)
+
+
+class AllocatorClient:
+    def __init__(self, address, timeout=None):
+        """
+        Abre una conexión con el servidor
+
+        Args:
+            address (str): "host:puerto" o ruta de un socket Unix
+            timeout (float, optional): Segundos máximos por operación de red.
+                Defaults to None (sin límite).
+        """
+        target = parse_address(address)
+        if isinstance(target, tuple):
+            self.sock = socket.create_connection(target, timeout)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(target)
+        self.reader = self.sock.makefile("rb")
+
+    def allocate(self, pid, size):
+        """
+        Asigna memoria a un proceso
+
+        Returns:
+            int: Dirección de inicio del bloque asignado o -1 si no se pudo asignar
+        """
+        batch = self.pipeline()
+        batch.allocate(pid, size)
+        return batch.execute()[0]
+
+    def release(self, pid):
+        """
+        Libera la memoria de un proceso
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        batch = self.pipeline()
+        batch.release(pid)
+        return batch.execute()[0]
+
+    def stats(self):
+        """
+        Consulta el estado del asignador del servidor
+
+        Returns:
+            dict: Campos de STATS_FIELDS
+        """
+        batch = self.pipeline()
+        batch.stats()
+        return batch.execute()[0]
+
+    def pipeline(self):
+        """Crea un lote de solicitudes que se envían juntas"""
+        return Pipeline(self)
+
+    def send(self, data):
+        """Envía solicitudes ya codificadas"""
+        self.sock.sendall(data)
+
+    def read_reply(self):
+        """
+        Lee una respuesta
+
+        Returns:
+            tuple: (estado, valor, datos adicionales)
+
+        Raises:
+            ConnectionError: Si el servidor cerró la conexión
+        """
+        header = self.reader.read(FRAME.size)
+        if len(header) < FRAME.size:
+            raise ConnectionError("El servidor cerró la conexión")
+        length, = FRAME.unpack(header)
+        payload = self.reader.read(length)
+        if len(payload) < length:
+            raise ConnectionError("El servidor cerró la conexión")
+        status, value = REPLY.unpack_from(payload)
+        return status, value, payload[REPLY.size:]
+
+    def close(self):
+        """Cierra la conexión"""
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class Pipeline:
+    def __init__(self, client):
+        """
+        Inicializa un lote vacío
+
+        Args:
+            client (AllocatorClient): Conexión por la que se envía el lote
+        """
+        self.client = client
+        self.requests = []
+        self.ops = []
+
+    def allocate(self, pid, size):
+        """Agrega una asignación; su resultado es la dirección o -1"""
+        self.requests.append(REQUEST_FRAME.pack(REQUEST.size, OP_ALLOCATE, pid, size))
+        self.ops.append(OP_ALLOCATE)
+
+    def release(self, pid):
+        """Agrega una liberación; su resultado es True o False"""
+        self.requests.append(REQUEST_FRAME.pack(REQUEST.size, OP_RELEASE, pid, 0))
+        self.ops.append(OP_RELEASE)
+
+    def stats(self):
+        """Agrega una consulta de estado; su resultado es un dict"""
+        self.requests.append(REQUEST_FRAME.pack(REQUEST.size, OP_STATS, 0, 0))
+        self.ops.append(OP_STATS)
+
+    def __len__(self):
+        return len(self.ops)
+
+    def execute(self):
+        """
+        Envía el lote y espera todas sus respuestas
+
+        Returns:
+            list: Resultado de cada solicitud, en el orden en que se agregaron
+
+        Raises:
+            ValueError: Si el servidor rechazó una solicitud por mal formada
+        """
+        client = self.client
+        client.send(b"".join(self.requests))
+        results = []
+        rejected = 0
+        for op in self.ops:
+            status, value, extra = client.read_reply()
+            if status == STATUS_ERROR:
+                rejected += 1  # Se siguen leyendo las respuestas para no desfasar la conexión
+                results.append(None)
+            elif op == OP_ALLOCATE:
+                results.append(value if status == STATUS_OK else -1)
+            elif op == OP_RELEASE:
+                results.append(status == STATUS_OK)
+            else:
+                results.append(dict(zip(STATS_FIELDS, STATS.unpack(extra))))
+        self.requests.clear()
+        self.ops.clear()
+        if rejected:
+            raise ValueError(f"El servidor rechazó {rejected} solicitudes del lote")
+        return results
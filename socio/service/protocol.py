@@ -0,0 +1,56 @@
+"""
+* Objetivo:
+*   Protocolo binario del servidor de asignación
+*
+* Descripción:
+*   Cada mensaje es un entero de 4 bytes con la longitud del contenido
+*   seguido del contenido. Una solicitud es (operación, pid, tamaño) y una
+*   respuesta es (estado, valor); la respuesta de OP_STATS agrega los campos
+*   de STATS_FIELDS. Un cliente puede enviar muchas solicitudes seguidas sin
+*   esperar respuesta (pipelining); el servidor responde en el mismo orden y
+*   agrupa en una sola escritura las respuestas de todo lo que leyó de una vez.
+*   Todos los enteros son little-endian con signo de 8 bytes salvo la
+*   longitud (4 bytes sin signo) y los códigos (1 byte).
+*
+"""
+
+import struct
+
+FRAME = struct.Struct("<I")  # Longitud del contenido
+REQUEST = struct.Struct("<Bqq")  # Operación, PID, tamaño
+REPLY = struct.Struct("<Bq")  # Estado, valor
+STATS = struct.Struct("<qqqqq")
+
+# Solicitud y respuesta con su longitud, para codificar en un solo pack
+REQUEST_FRAME = struct.Struct("<IBqq")
+REPLY_FRAME = struct.Struct("<IBq")
+
+MAX_FRAME = 1024  # Un contenido más largo es un error de protocolo
+
+# Operaciones
+OP_ALLOCATE = 1  # valor = dirección del bloque
+OP_RELEASE = 2  # tamaño se ignora
+OP_STATS = 3  # pid y tamaño se ignoran
+
+# Estados de respuesta
+STATUS_OK = 0
+STATUS_FAILED = 1  # Sin memoria suficiente o PID no encontrado
+STATUS_ERROR = 2  # Solicitud mal formada u operación desconocida
+
+STATS_FIELDS = ("MAX_SIZE", "used_memory", "free_memory", "largest_free_block", "live_blocks")
+
+
+def parse_address(address):
+    """
+    Interpreta una dirección de servidor
+
+    Args:
+        address (str): "host:puerto" para TCP o la ruta de un socket Unix
+
+    Returns:
+        tuple | str: (host, puerto) para TCP o la ruta del socket Unix
+    """
+    host, separator, port = address.rpartition(":")
+    if separator and port.isdigit() and "/" not in address:
+        return host or "127.0.0.1", int(port)
+    return address
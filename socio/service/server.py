@@ -0,0 +1,183 @@
+"""
+* Objetivo:
+*   Servidor local que comparte un asignador entre varios procesos
+*
+* Descripción:
+*   Atiende conexiones TCP o de socket Unix con el protocolo de
+*   service/protocol.py sobre una estrategia registrada. Todo corre en un
+*   único bucle asyncio, así la estrategia no necesita ser segura para hilos.
+*   Por cada lectura del socket se procesan todas las solicitudes completas
+*   recibidas y sus respuestas se envían en una sola escritura. Uso:
+*
+*       python -m service.server --strategy buddy --scale 1048576:64 \\
+*           --tcp 127.0.0.1:7070 --unix /tmp/buddy.sock
+*
+"""
+
+import argparse
+import asyncio
+import sys
+from strategy.registry import STRATEGIES, create_strategy
+from utils.scale import parse_scale
+from service.protocol import (FRAME, REQUEST, REPLY, STATS, REPLY_FRAME, MAX_FRAME,
+                              OP_ALLOCATE, OP_RELEASE, OP_STATS,
+                              STATUS_OK, STATUS_FAILED, STATUS_ERROR, parse_address)
+
+READ_SIZE = 1 << 16
+
+REPLY_RELEASED = REPLY_FRAME.pack(REPLY.size, STATUS_OK, 0)
+REPLY_NOT_RELEASED = REPLY_FRAME.pack(REPLY.size, STATUS_FAILED, 0)
+REPLY_NO_MEMORY = REPLY_FRAME.pack(REPLY.size, STATUS_FAILED, -1)
+REPLY_BAD_REQUEST = REPLY_FRAME.pack(REPLY.size, STATUS_ERROR, 0)
+
+
+class AllocatorServer:
+    def __init__(self, system):
+        """
+        Inicializa el servidor sobre una estrategia de memoria
+
+        Args:
+            system (MemoryAllocationStrategy): Estrategia compartida por los clientes
+        """
+        self.system = system
+        self.servers = []
+        self.connections = 0
+        self.requests = 0
+        self.writes = 0  # Escrituras de respuestas (cada una agrupa un lote)
+
+    async def start(self, tcp=None, unix=None):
+        """
+        Empieza a escuchar en las direcciones indicadas
+
+        Args:
+            tcp (tuple, optional): (host, puerto); puerto 0 elige uno libre
+            unix (str, optional): Ruta del socket Unix
+
+        Returns:
+            list: Direcciones en escucha ("host:puerto" o ruta)
+        """
+        addresses = []
+        if tcp is not None:
+            server = await asyncio.start_server(self.handle, *tcp)
+            self.servers.append(server)
+            host, port = server.sockets[0].getsockname()[:2]
+            addresses.append(f"{host}:{port}")
+        if unix is not None:
+            self.servers.append(await asyncio.start_unix_server(self.handle, unix))
+            addresses.append(unix)
+        return addresses
+
+    async def serve_forever(self):
+        """Atiende conexiones hasta que se cancele la tarea"""
+        await asyncio.gather(*(server.serve_forever() for server in self.servers))
+
+    def close(self):
+        """Deja de aceptar conexiones"""
+        for server in self.servers:
+            server.close()
+
+    async def handle(self, reader, writer):
+        """Atiende una conexión: lee lotes de solicitudes y responde cada lote junto"""
+        self.connections += 1
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                buffer += data
+
+                replies = []
+                position = 0
+                end = len(buffer)
+                while end - position >= FRAME.size:
+                    length, = FRAME.unpack_from(buffer, position)
+                    if length > MAX_FRAME:
+                        return  # Error de protocolo: se cierra la conexión
+                    if end - position - FRAME.size < length:
+                        break  # Solicitud incompleta: se espera la siguiente lectura
+                    replies.append(self.dispatch(buffer, position + FRAME.size, length))
+                    position += FRAME.size + length
+                del buffer[:position]
+
+                if replies:
+                    self.requests += len(replies)
+                    self.writes += 1
+                    writer.write(b"".join(replies))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def dispatch(self, buffer, position, length):
+        """
+        Ejecuta una solicitud
+
+        Args:
+            buffer (bytearray): Datos recibidos
+            position (int): Inicio del contenido de la solicitud
+            length (int): Longitud del contenido
+
+        Returns:
+            bytes: Respuesta con su longitud
+        """
+        if length != REQUEST.size:
+            return REPLY_BAD_REQUEST
+        op, pid, size = REQUEST.unpack_from(buffer, position)
+
+        if op == OP_ALLOCATE:
+            if size <= 0:
+                return REPLY_BAD_REQUEST
+            offset = self.system.allocate_offset(pid, size)
+            if offset < 0:
+                return REPLY_NO_MEMORY
+            return REPLY_FRAME.pack(REPLY.size, STATUS_OK, offset)
+        if op == OP_RELEASE:
+            return REPLY_RELEASED if self.system.release(pid) else REPLY_NOT_RELEASED
+        if op == OP_STATS:
+            system = self.system
+            stats = STATS.pack(system.MAX_SIZE, system.get_used_memory(), system.get_free_memory(),
+                               system.get_largest_free_block(), len(system.allocated_blocks))
+            return REPLY_FRAME.pack(REPLY.size + STATS.size, STATUS_OK, 0) + stats
+        return REPLY_BAD_REQUEST
+
+
+async def serve(system, tcp=None, unix=None):
+    """Inicia un AllocatorServer, anuncia sus direcciones y atiende hasta cancelarse"""
+    server = AllocatorServer(system)
+    for address in await server.start(tcp, unix):
+        print(f"Escuchando en {address}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        server.close()
+        print(f"{server.connections} conexiones, {server.requests} solicitudes "
+              f"en {server.writes} lotes", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor local de asignación de memoria")
+    parser.add_argument("--strategy", default="buddy", choices=list(STRATEGIES))
+    parser.add_argument("--scale", type=parse_scale, default=(1 << 20, 64),
+                        help="Configuración MAX:MIN (p. ej. 1048576:64)")
+    parser.add_argument("--tcp", help="host:puerto (puerto 0 = uno libre)")
+    parser.add_argument("--unix", help="Ruta del socket Unix")
+    args = parser.parse_args(argv)
+
+    tcp = parse_address(args.tcp) if args.tcp else None
+    if args.tcp and not isinstance(tcp, tuple):
+        parser.error("--tcp debe tener la forma host:puerto")
+    if tcp is None and args.unix is None:
+        tcp = ("127.0.0.1", 7070)
+
+    MAX_SIZE, MIN_SIZE = args.scale
+    try:
+        asyncio.run(serve(create_strategy(args.strategy, MAX_SIZE, MIN_SIZE), tcp, args.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
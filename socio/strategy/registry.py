@@ -0,0 +1,61 @@
+from importlib import import_module
+from utils.buddy_system import BuddySystem, COALESCE_LAZY
+
+
+def lazy_strategy(module, name, **kwargs):
+    """
+    Crea un constructor que importa la estrategia la primera vez que se usa,
+    así importar el registro no carga todas las implementaciones
+
+    Args:
+        module (str): Módulo de la estrategia
+        name (str): Clase dentro del módulo
+        **kwargs: Argumentos adicionales para el constructor
+
+    Returns:
+        callable: constructor(MAX_SIZE, MIN_SIZE)
+    """
+    def constructor(MAX_SIZE, MIN_SIZE):
+        return getattr(import_module(module), name)(MAX_SIZE, MIN_SIZE, **kwargs)
+    return constructor
+
+
+def cached_buddy(MAX_SIZE, MIN_SIZE):
+    """BuddySystem con cachés de bloques pequeños"""
+    from utils.cached_buddy_system import CachedBuddySystem
+    return CachedBuddySystem(BuddySystem(MAX_SIZE, MIN_SIZE))
+
+
+# Estrategias disponibles: nombre → constructor(MAX_SIZE, MIN_SIZE)
+STRATEGIES = {
+    "buddy": BuddySystem,
+    "buddy-lazy": lambda MAX_SIZE, MIN_SIZE: BuddySystem(MAX_SIZE, MIN_SIZE, coalescing=COALESCE_LAZY),
+    "buddy-trim": lambda MAX_SIZE, MIN_SIZE: BuddySystem(MAX_SIZE, MIN_SIZE, trim_tail=True),
+    "array-buddy": lazy_strategy("utils.array_buddy_system", "ArrayBuddySystem"),
+    "concurrent-buddy": lazy_strategy("utils.concurrent_buddy_system", "ConcurrentBuddySystem"),
+    "cached-buddy": cached_buddy,
+    "tlsf": lazy_strategy("utils.tlsf", "TLSF"),
+    "segregated-fit": lazy_strategy("utils.segregated_fit", "SegregatedFit"),
+    "multi-arena": lazy_strategy("utils.multi_arena", "MultiArenaAllocator"),
+    # routing=ROUTE_THREAD de utils.multi_arena
+    "multi-arena-thread": lazy_strategy("utils.multi_arena", "MultiArenaAllocator", routing="thread"),
+}
+
+def create_strategy(name, MAX_SIZE, MIN_SIZE):
+    """
+    Crea una estrategia de administración de memoria por nombre
+
+    Args:
+        name (str): Nombre registrado en STRATEGIES
+        MAX_SIZE (int): Tamaño máximo de memoria
+        MIN_SIZE (int): Tamaño mínimo de bloque
+
+    Returns:
+        MemoryAllocationStrategy: Estrategia inicializada
+
+    Raises:
+        ValueError: Si el nombre no está registrado
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Estrategia desconocida: {name}. Opciones: {', '.join(STRATEGIES)}")
+    return STRATEGIES[name](MAX_SIZE, MIN_SIZE)
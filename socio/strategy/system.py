@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from utils.process import Process
 
 class MemoryAllocationStrategy(ABC):
     """Interfaz para estrategias de administración de memoria"""
@@ -9,11 +8,52 @@ class MemoryAllocationStrategy(ABC):
         """Asigna memoria a un proceso"""
         pass
     
+    @abstractmethod
+    def allocate_offset(self, pid, size):
+        """Asigna memoria a un proceso y retorna la dirección del bloque (-1 si falla)"""
+        pass
+    
     @abstractmethod
     def release(self, pid):
         """Libera memoria de un proceso"""
         pass
     
+    @abstractmethod
+    def release_at(self, offset):
+        """Libera el bloque que comienza en una dirección"""
+        pass
+    
+    def allocate_many(self, requests):
+        """
+        Asigna memoria a varios procesos en un solo llamado
+        
+        Args:
+            requests (iterable): Pares (pid, size)
+            
+        Returns:
+            list: Dirección asignada a cada solicitud (-1 si falló), en el mismo orden
+        """
+        return [self.allocate_offset(pid, size) for pid, size in requests]
+    
+    def release_many(self, pids):
+        """
+        Libera la memoria de varios procesos en un solo llamado
+        
+        Args:
+            pids (iterable): IDs de los procesos a liberar
+            
+        Returns:
+            list: Resultado de la liberación de cada PID, en el mismo orden
+        """
+        return [self.release(pid) for pid in pids]
+    
+    def get_max_block_size(self):
+        """
+        Retorna el tamaño de la solicitud más grande que la estrategia podría
+        atender con toda la memoria libre (por defecto MAX_SIZE)
+        """
+        return self.MAX_SIZE
+    
     @abstractmethod
     def get_used_memory(self):
         """Retorna memoria utilizada"""
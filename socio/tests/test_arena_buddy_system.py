@@ -0,0 +1,37 @@
+"""
+* Objetivo:
+*   Pruebas del Buddy System sobre memoria real
+*
+"""
+
+import pytest
+from utils.arena_buddy_system import ArenaBuddySystem
+
+
+def test_release_invalidates_view():
+    with ArenaBuddySystem(1024, 16) as system:
+        view = system.allocate_buffer(1, 100)
+        view[:5] = b"hello"
+        assert system.release(1)
+        with pytest.raises(ValueError):
+            view[0]
+
+
+def test_load_blocks_invalidates_previous_views():
+    with ArenaBuddySystem(1024, 16) as system:
+        view = system.allocate_buffer(1, 100)
+        system.load_blocks([(0, 2, 64)])
+        assert not system.views
+        with pytest.raises(ValueError):
+            view[0]
+        assert len(system.get_buffer(2)) == 64
+
+
+def test_coalesce_keeps_live_views():
+    with ArenaBuddySystem(1024, 16) as system:
+        view = system.allocate_buffer(1, 16)
+        system.allocate_buffer(2, 16)
+        assert system.release(2)
+        system.coalesce()
+        view[0] = 7
+        assert system.get_buffer(1)[0] == 7
@@ -0,0 +1,42 @@
+"""
+* Objetivo:
+*   Pruebas del Buddy System sobre arreglos
+*
+"""
+
+import random
+from utils.array_buddy_system import ArrayBuddySystem
+from utils.buddy_system import BuddySystem
+
+
+def test_matches_buddy_system_on_random_trace():
+    rng = random.Random(11)
+    array_system, tree_system = ArrayBuddySystem(1 << 14, 16), BuddySystem(1 << 14, 16)
+    pids = list(range(1, 200))
+    for _ in range(5000):
+        pid = rng.choice(pids)
+        if pid in tree_system.allocated_blocks and rng.random() < 0.5:
+            assert array_system.release(pid) == tree_system.release(pid)
+        else:
+            size = rng.choice([rng.randrange(1, 64), rng.randrange(64, 4096), 1 << 15])
+            assert array_system.allocate_offset(pid, size) == tree_system.allocate_offset(pid, size)
+        address = rng.randrange(1 << 14)
+        assert array_system.owner_of(address) == tree_system.owner_of(address)
+
+    array_metrics, tree_metrics = array_system.get_metrics(), tree_system.get_metrics()
+    assert array_metrics["failed_allocations"] > 0
+    assert array_metrics == tree_metrics
+    for pid, node in tree_system.allocated_blocks.items():
+        view = array_system.lookup(pid)
+        assert (view.offset, view.size, view.pid, view.requested_size) == \
+            (node.offset, node.size, node.pid, node.requested_size)
+
+
+def test_owner_data_is_kept_only_for_allocated_blocks():
+    system = ArrayBuddySystem(1 << 20, 16)
+    assert system.allocate_offset(1, 100) == 0
+    assert system.owners == {system.allocated_blocks[1]: (1, 100)}
+    view = system.lookup(1)
+    assert system.release_at(0)
+    assert system.owners == {}
+    assert (view.pid, view.requested_size) == (-1, 0)
@@ -0,0 +1,27 @@
+"""
+* Objetivo:
+*   Pruebas del servicio de asignación asyncio
+*
+"""
+
+import asyncio
+import pytest
+from utils.async_allocator import AsyncAllocator
+from utils.buddy_system import BuddySystem
+from utils.tlsf import TLSF
+
+
+@pytest.mark.parametrize("system, size", [
+    (BuddySystem(1536, 16), 1025),  # Mayor que la raíz más grande, menor que MAX_SIZE
+    (TLSF(1000, 16), 995),  # Mayor que la memoria administrada (usable_size)
+])
+def test_request_larger_than_any_block_fails_fast(system, size):
+    async def scenario():
+        allocator = AsyncAllocator(system)
+        with pytest.raises(ValueError):
+            await allocator.allocate(1, size, timeout=1)
+        assert allocator.queue_depth == 0
+        # La solicitud rechazada no deja a las demás detrás de ella
+        assert await allocator.allocate(2, 16, timeout=1) >= 0
+
+    asyncio.run(scenario())
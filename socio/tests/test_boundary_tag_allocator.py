@@ -0,0 +1,26 @@
+"""
+* Objetivo:
+*   Pruebas de los asignadores con etiquetas de frontera
+*
+"""
+
+import pytest
+from utils.boundary_tag_allocator import BoundaryTagAllocator
+from utils.segregated_fit import SegregatedFit
+from utils.tlsf import TLSF
+
+
+def test_free_index_hooks_are_abstract():
+    with pytest.raises(TypeError):
+        BoundaryTagAllocator(1024, 16)
+
+
+@pytest.mark.parametrize("cls", [TLSF, SegregatedFit])
+def test_usage_and_free_memory_share_the_managed_size(cls):
+    system = cls(1000, 16)  # 8 bytes quedan fuera de la memoria administrada
+    assert system.allocate(1, 300)
+    used = system.get_memory_usage()
+    free = system.get_free_memory() / system.usable_size * 100
+    assert used + free == pytest.approx(100)
+    assert system.allocate(2, system.get_free_memory())
+    assert system.get_memory_usage() == pytest.approx(100)
@@ -0,0 +1,37 @@
+"""
+* Objetivo:
+*   Pruebas del Buddy System
+*
+"""
+
+from utils.buddy_system import BuddySystem
+
+
+def test_trim_tail_zero_size_takes_one_minimum_block():
+    system = BuddySystem(1024, 16, trim_tail=True)
+    assert system.allocate_offset(1, 0) == 0
+    assert [block.size for block in system.blocks_of(1)] == [16]
+    assert system.get_used_memory() == 16
+    assert system.release(1)
+    assert system.get_used_memory() == 0
+    assert system.get_largest_free_block() == 1024
+
+
+def test_trim_tail_returns_unused_tail():
+    system = BuddySystem(1024, 16, trim_tail=True)
+    assert system.allocate_offset(1, 600) == 0
+    blocks = system.blocks_of(1)
+    assert [(block.offset, block.size) for block in blocks] == [(0, 512), (512, 64), (576, 32)]
+    assert sum(block.requested_size for block in blocks) == 600
+    assert system.get_free_memory() == 1024 - 608
+    assert system.release(1)
+    assert system.get_largest_free_block() == 1024
+
+
+def test_non_power_of_two_size_uses_several_roots():
+    system = BuddySystem(1536, 16)
+    assert [root.size for root in system.roots] == [1024, 512]
+    assert system.allocate_offset(1, 1024) == 0
+    assert system.allocate_offset(2, 512) == 1024
+    assert not system.allocate(3, 16)
+    assert system.owner_of(1535) == 2
@@ -0,0 +1,82 @@
+"""
+* Objetivo:
+*   Pruebas de la caché por hilo del Buddy System
+*
+"""
+
+import threading
+from utils.buddy_system import BuddySystem
+from utils.cached_buddy_system import CachedBuddySystem
+from utils.concurrent_buddy_system import ConcurrentBuddySystem
+
+
+def test_cached_blocks_do_not_block_large_allocation():
+    system = CachedBuddySystem(BuddySystem(1024, 16), magazine_size=64)
+    assert system.allocate(1, 16)
+    assert system.release(1)
+    assert system.get_free_memory() == 1024
+
+    # Los bloques del magazine mantienen dividida la raíz hasta que se devuelven
+    assert system.allocate(2, 1024)
+    assert system.get_used_memory() == 1024
+    assert system.get_cache_stats()["cached_bytes"] == 0
+
+
+def test_refill_retries_after_flushing_other_orders():
+    system = CachedBuddySystem(BuddySystem(64, 16), cached_orders=2, magazine_size=8)
+    assert system.allocate(1, 16)
+    assert system.release(1)
+    # Todo el árbol quedó en el magazine de orden 0; el de orden 1 no puede rellenarse sin devolverlo
+    assert system.allocate(2, 32)
+    assert system.allocate(3, 32)
+    assert not system.allocate(4, 16)
+
+
+def test_magazines_of_finished_threads_are_returned():
+    backing = BuddySystem(1 << 14, 16)
+    system = CachedBuddySystem(backing, magazine_size=16)
+
+    def work(pid):
+        assert system.allocate(pid, 16)
+        assert system.release(pid)  # El bloque queda en el magazine del hilo
+
+    # Hilos cortos en secuencia: sus identificadores se reutilizan
+    for pid in range(50):
+        thread = threading.Thread(target=work, args=(pid,))
+        thread.start()
+        thread.join()
+
+    system.flush_all()
+    assert backing.get_used_memory() == 0
+    assert system.get_cache_stats()["cached_bytes"] == 0
+    assert not system.magazines
+
+
+def test_flush_all_while_other_threads_run():
+    system = CachedBuddySystem(ConcurrentBuddySystem(1 << 14, 16), magazine_size=8)
+    stop = threading.Event()
+    errors = []
+
+    def work(thread):
+        pid = thread << 20
+        try:
+            while not stop.is_set():
+                assert system.allocate(pid, 16)
+                assert system.release(pid)
+                pid += 1
+        except AssertionError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(200):
+        system.flush_all()
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    system.flush_all()
+    assert system.system.check_invariants()
+    assert system.system.get_used_memory() == 0
@@ -0,0 +1,141 @@
+"""
+* Objetivo:
+*   Pruebas de estrés con varios hilos sobre el Buddy System concurrente
+*
+* Descripción:
+*   La escala se configura con variables de entorno; por defecto es corta
+*   para la suite normal. Una corrida larga (millones de operaciones):
+*
+*       BUDDY_STRESS_OPS=500000 python -m pytest -q tests/test_concurrent_buddy_system.py
+*
+"""
+
+import os
+import random
+import threading
+from utils.concurrent_buddy_system import ConcurrentBuddySystem
+from utils.cached_buddy_system import CachedBuddySystem
+
+THREADS = int(os.environ.get("BUDDY_STRESS_THREADS", 8))
+OPS = int(os.environ.get("BUDDY_STRESS_OPS", 3000))  # Operaciones por hilo
+# Cada cuántas operaciones por hilo se pausan todos y se verifica el estado
+CHECK_EVERY = int(os.environ.get("BUDDY_STRESS_CHECK_EVERY", 500))
+
+
+def check_state(system, backing, live):
+    """Los bloques vivos no se solapan y el sistema de respaldo es consistente"""
+    spans = sorted(span for blocks in live for span in blocks.values())
+    for (offset, size), (next_offset, _) in zip(spans, spans[1:]):
+        assert offset + size <= next_offset
+    assert backing.check_invariants()
+    assert system.get_used_memory() >= sum(size for _, size in spans)
+
+
+def stress(system, backing, max_request):
+    """
+    Cada hilo asigna y libera al azar con sus propios PIDs (parte de las
+    liberaciones por dirección). Cada CHECK_EVERY operaciones todos los
+    hilos se detienen en una barrera y uno verifica el estado completo; al
+    final, liberado todo, la memoria usada vuelve a 0
+    """
+    live = [{} for _ in range(THREADS)]  # Por hilo, PID → (offset, tamaño)
+    errors = []
+
+    def pause():
+        try:
+            check_state(system, backing, live)
+        except AssertionError as error:
+            errors.append(error)
+
+    barrier = threading.Barrier(THREADS, action=pause)
+
+    def worker(thread):
+        rng = random.Random(thread)
+        mine = live[thread]
+        barrier.wait()
+        try:
+            for i in range(OPS):
+                if i % CHECK_EVERY == 0:
+                    barrier.wait()
+                if mine and rng.random() < 0.5:
+                    pid = rng.choice(list(mine))
+                    offset, _ = mine.pop(pid)
+                    if rng.random() < 0.25:
+                        assert system.release_at(offset)
+                    else:
+                        assert system.release(pid)
+                else:
+                    pid = thread * OPS + i
+                    size = rng.randint(1, max_request)
+                    offset = system.allocate_offset(pid, size)
+                    if offset >= 0:
+                        mine[pid] = (offset, size)
+        except Exception as error:  # Se reporta desde el hilo principal
+            errors.append(error)
+            barrier.abort()
+
+    threads = [threading.Thread(target=worker, args=(thread,)) for thread in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+    check_state(system, backing, live)
+    for blocks in live:
+        for pid in blocks:
+            assert system.release(pid)
+    if isinstance(system, CachedBuddySystem):
+        system.flush_all()
+    assert backing.check_invariants()
+    assert system.get_used_memory() == 0
+    assert backing.get_used_memory() == 0
+
+
+def test_concurrent_buddy_stress():
+    system = ConcurrentBuddySystem(1 << 16, 16)
+    stress(system, system, 2048)
+
+
+def test_cached_concurrent_buddy_stress():
+    backing = ConcurrentBuddySystem(1 << 16, 16)
+    system = CachedBuddySystem(backing, magazine_size=16)
+    # Solicitudes pequeñas para que la mayoría pase por los magazines
+    stress(system, backing, 128)
+
+
+
+class TriggerLock:
+    """Lock que ejecuta una acción la primera vez que se suelta"""
+
+    def __init__(self, lock, action):
+        self.lock = lock
+        self.action = action
+
+    def __enter__(self):
+        self.lock.acquire()
+
+    def __exit__(self, *exc):
+        self.lock.release()
+        action, self.action = self.action, None
+        if action is not None:
+            action()
+
+
+def test_release_at_does_not_free_a_reallocated_pid():
+    system = ConcurrentBuddySystem(1024, 16, subtrees=1)
+    assert system.allocate_offset(1, 16) == 0
+    racer = threading.Thread(target=lambda: (system.release(1), system.allocate(3, 16),
+                                             system.allocate(1, 16)))
+
+    def race():
+        # Justo después de consultar el índice, otro hilo libera el PID y lo reasigna
+        racer.start()
+        racer.join(0.2)
+
+    system.index_lock = TriggerLock(system.index_lock, race)
+    system.release_at(0)
+    racer.join()
+    # El PID 1 vive ahora en otra dirección y no debe haberse liberado
+    assert 1 in system.allocated_blocks and 3 in system.allocated_blocks
+    assert system.check_invariants()
@@ -0,0 +1,80 @@
+"""
+* Objetivo:
+*   Pruebas del journal y los snapshots del Buddy System
+*
+"""
+
+import random
+import pytest
+from utils.buddy_system import BuddySystem, COALESCE_EAGER, COALESCE_LAZY
+from utils.journal import Journal, restore, save_snapshot
+
+
+def blocks(system):
+    """Estado comparable: pid → (offset, tamaño del bloque, tamaño solicitado)"""
+    return {pid: (node.offset, node.size, node.requested_size)
+            for pid, node in system.allocated_blocks.items()}
+
+
+def run_trace(system, rng, pids, ops):
+    """Asigna y libera al azar PIDs de un rango"""
+    for _ in range(ops):
+        pid = rng.choice(pids)
+        if pid in system.allocated_blocks and rng.random() < 0.6:
+            assert system.release(pid)
+        elif pid not in system.allocated_blocks:
+            system.allocate(pid, rng.randrange(1, 400))
+
+
+@pytest.mark.parametrize("coalescing", [COALESCE_EAGER, COALESCE_LAZY])
+def test_snapshot_and_journal_round_trip(tmp_path, coalescing):
+    snapshot, journal_path = str(tmp_path / "estado.snapshot"), str(tmp_path / "estado.journal")
+    rng = random.Random(7)
+    pids = list(range(1, 40))
+    system = BuddySystem(1536, 16, coalescing=coalescing)  # Dos raíces: 1024 + 512
+
+    with Journal(journal_path, system) as journal:
+        run_trace(system, rng, pids, 300)
+        journal.checkpoint(snapshot)
+        at_checkpoint = blocks(system)
+        assert at_checkpoint
+        run_trace(system, rng, pids, 300)
+    assert any(offset >= 1024 for offset, _, _ in blocks(system).values())
+
+    assert blocks(restore(snapshot)) == at_checkpoint
+    for restored in (restore(snapshot, journal_path, coalescing=coalescing),
+                     restore(journal_path=journal_path)):
+        assert blocks(restored) == blocks(system)
+        assert restored.get_used_memory() == system.get_used_memory()
+        assert restored.get_requested_memory() == system.get_requested_memory()
+        # El árbol reconstruido sigue funcionando: se libera todo y queda entero
+        for pid in list(restored.allocated_blocks):
+            assert restored.release(pid)
+        assert restored.allocate(1000, 1024) and restored.allocate(1001, 512)
+
+
+def test_truncated_journal_record_is_ignored(tmp_path):
+    journal_path = str(tmp_path / "estado.journal")
+    system = BuddySystem(1536, 16)
+    with Journal(journal_path, system):
+        assert system.allocate(1, 100)
+        assert system.allocate(2, 600)
+    with open(journal_path, "ab") as output:
+        output.write(b"\x01\x03")  # Registro interrumpido a mitad de escritura
+    assert blocks(restore(journal_path=journal_path)) == blocks(system)
+
+
+def test_trim_tail_is_rejected(tmp_path):
+    system = BuddySystem(1024, 16, trim_tail=True)
+    with pytest.raises(ValueError):
+        Journal(str(tmp_path / "estado.journal"), system)
+    with pytest.raises(ValueError):
+        save_snapshot(system, str(tmp_path / "estado.snapshot"))
+    assert not list(tmp_path.iterdir())
+
+
+def test_journal_of_another_configuration_is_rejected(tmp_path):
+    journal_path = str(tmp_path / "estado.journal")
+    Journal(journal_path, BuddySystem(1536, 16)).close()
+    with pytest.raises(ValueError):
+        Journal(journal_path, BuddySystem(1024, 16))
@@ -0,0 +1,35 @@
+"""
+* Objetivo:
+*   Pruebas del administrador de varias arenas
+*
+"""
+
+from utils.multi_arena import MultiArenaAllocator
+
+
+def test_alternating_large_allocations_reuse_dedicated_arena():
+    system = MultiArenaAllocator(1 << 16, 16, arena_size=1 << 12)
+    for pid in range(100):
+        assert system.allocate(pid, 3 << 12)  # Arena dedicada de 4 ranuras
+        assert system.release(pid)
+    stats = system.get_arena_stats()
+    assert stats["arenas_created"] == 1
+    assert stats["arenas_reused"] == 99
+    assert stats["idle_dedicated"] == 1
+
+
+def test_idle_dedicated_arena_yields_its_slots():
+    system = MultiArenaAllocator(1024, 16, arena_size=64)
+    assert system.allocate(1, 512)
+    assert system.release(1)
+    assert system.get_arena_stats()["idle_dedicated"] == 1
+
+    # Otro número de ranuras: la arena conservada se devuelve para crear la nueva
+    assert system.allocate(2, 1024)
+    assert system.release(2)
+
+    # Las arenas normales pueden ocupar las ranuras de la dedicada conservada
+    for pid in range(3, 19):
+        assert system.allocate(pid, 64)
+    assert system.get_used_memory() == 1024
+    assert system.get_arena_stats()["idle_dedicated"] == 0
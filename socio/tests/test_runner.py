@@ -0,0 +1,22 @@
+"""
+* Objetivo:
+*   Pruebas del banco de rendimiento
+*
+"""
+
+import json
+
+from benchmark.runner import main
+
+
+def test_rejected_scale_does_not_abort_benchmark(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    status = main(["--strategies", "buddy", "array-buddy", "--workloads", "uniform",
+                   "--scales", "65536:16", "1000:8", "--ops", "300", "--no-memory",
+                   "--save", str(output)])
+    assert status == 0
+    results = json.loads(output.read_text())
+    failed = [(r["strategy"], r["MAX_SIZE"]) for r in results if "error" in r]
+    assert failed == [("array-buddy", 1000)]
+    assert len(results) == 4
+    assert "OMITIDA array-buddy" in capsys.readouterr().err
@@ -0,0 +1,123 @@
+"""
+* Objetivo:
+*   Pruebas del protocolo, el servidor y el cliente de asignación
+*
+"""
+
+import asyncio
+import pytest
+from service.client import AllocatorClient
+from service.protocol import (FRAME, REPLY, STATS, REQUEST, REQUEST_FRAME, MAX_FRAME,
+                              OP_ALLOCATE, OP_RELEASE, OP_STATS,
+                              STATUS_OK, STATUS_FAILED, STATUS_ERROR, STATS_FIELDS)
+from service.server import AllocatorServer
+from utils.buddy_system import BuddySystem
+
+
+def request(op, pid=0, size=0):
+    return REQUEST_FRAME.pack(REQUEST.size, op, pid, size)
+
+
+async def read_reply(reader):
+    """Lee una respuesta cruda: (estado, valor, datos adicionales)"""
+    length, = FRAME.unpack(await reader.readexactly(FRAME.size))
+    payload = await reader.readexactly(length)
+    status, value = REPLY.unpack_from(payload)
+    return status, value, payload[REPLY.size:]
+
+
+def run_with_server(scenario):
+    """Ejecuta scenario(server, host, port) con un servidor en un puerto libre"""
+    async def main():
+        server = AllocatorServer(BuddySystem(1024, 16))
+        address, = await server.start(tcp=("127.0.0.1", 0))
+        host, port = address.rsplit(":", 1)
+        try:
+            await asyncio.wait_for(scenario(server, host, int(port)), 10)
+        finally:
+            server.close()
+
+    asyncio.run(main())
+
+
+def test_pipelined_batch_split_across_writes():
+    async def scenario(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        data = b"".join([request(OP_ALLOCATE, 1, 100), request(OP_ALLOCATE, 2, 200),
+                         request(OP_ALLOCATE, 3, 2048), request(OP_RELEASE, 9),
+                         request(OP_STATS), request(OP_RELEASE, 1), request(OP_ALLOCATE, 4, 16)])
+        # Cortes dentro de la longitud y dentro del contenido de una solicitud
+        for start, end in ((0, 2), (2, 30), (30, 61), (61, len(data))):
+            writer.write(data[start:end])
+            await writer.drain()
+            await asyncio.sleep(0.01)
+
+        replies = [await read_reply(reader) for _ in range(7)]
+        assert [reply[:2] for reply in replies] == [
+            (STATUS_OK, 0), (STATUS_OK, 256), (STATUS_FAILED, -1), (STATUS_FAILED, 0),
+            (STATUS_OK, 0), (STATUS_OK, 0), (STATUS_OK, 0)]
+        stats = dict(zip(STATS_FIELDS, STATS.unpack(replies[4][2])))
+        assert stats == {"MAX_SIZE": 1024, "used_memory": 384, "free_memory": 640,
+                         "largest_free_block": 512, "live_blocks": 2}
+        assert server.requests == 7
+        assert server.writes < 7  # Las respuestas de cada lectura van juntas
+        writer.close()
+        await writer.wait_closed()
+
+    run_with_server(scenario)
+
+
+def test_wrong_payload_length_is_rejected_without_desynchronizing():
+    async def scenario(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(FRAME.pack(5) + b"\x01" * 5 + request(OP_ALLOCATE, 1, 0) + request(OP_ALLOCATE, 1, 64))
+        assert await read_reply(reader) == (STATUS_ERROR, 0, b"")
+        assert await read_reply(reader) == (STATUS_ERROR, 0, b"")  # Tamaño no positivo
+        assert await read_reply(reader) == (STATUS_OK, 0, b"")
+        writer.close()
+        await writer.wait_closed()
+
+    run_with_server(scenario)
+
+
+def test_oversized_frame_closes_connection():
+    async def scenario(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(request(OP_ALLOCATE, 1, 64))
+        assert await read_reply(reader) == (STATUS_OK, 0, b"")
+        writer.write(FRAME.pack(MAX_FRAME + 1) + request(OP_RELEASE, 1))
+        assert await reader.read() == b""  # Cerrada sin responder la liberación
+        writer.close()
+        assert server.system.get_used_memory() == 64
+
+    run_with_server(scenario)
+
+
+def test_client_pipeline_and_stats():
+    def session(address):
+        with AllocatorClient(address, timeout=5) as client:
+            batch = client.pipeline()
+            for pid in range(4):
+                batch.allocate(pid, 100)
+            batch.release(2)
+            batch.stats()
+            *offsets, released, stats = batch.execute()
+            assert offsets == [0, 128, 256, 384]
+            assert released is True
+            assert stats["used_memory"] == 384 and stats["live_blocks"] == 3
+
+            batch = client.pipeline()
+            batch.allocate(9, 0)
+            batch.release(0)
+            with pytest.raises(ValueError):
+                batch.execute()
+            # Se leyeron todas las respuestas: la conexión sigue sincronizada
+            assert client.stats()["live_blocks"] == 2
+            assert client.allocate(10, 64) == 0
+
+    async def scenario(server, host, port):
+        await asyncio.to_thread(session, f"{host}:{port}")
+        assert server.connections == 1
+
+    run_with_server(scenario)
+
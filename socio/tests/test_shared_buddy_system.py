@@ -0,0 +1,73 @@
+"""
+* Objetivo:
+*   Pruebas del Buddy System compartido entre procesos
+*
+"""
+
+import gc
+import multiprocessing
+import random
+import sys
+
+import pytest
+
+from utils.shared_buddy_system import SharedBuddySystem
+
+PROCESSES = 4
+OPS = 300
+
+
+def work(system, base, seed):
+    """Asigna y libera PIDs propios; escribe en cada bloque y verifica que nadie lo pisó"""
+    rng = random.Random(seed)
+    live = {}
+    for _ in range(OPS):
+        if live and rng.random() < 0.5:
+            pid = rng.choice(list(live))
+            view = system.get_buffer(pid)
+            assert bytes(view) == live.pop(pid)
+            view.release()
+            assert system.release(pid)
+        else:
+            pid, size = base + rng.randrange(1000), rng.randrange(1, 2048)
+            if pid not in live and system.allocate(pid, size):
+                data = bytes([pid % 251]) * size
+                view = system.get_buffer(pid)
+                view[:] = data
+                view.release()
+                live[pid] = data
+    for pid in live:
+        assert system.release(pid)
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_processes_share_one_segment(method):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} no disponible")
+    context = multiprocessing.get_context(method)
+    with SharedBuddySystem(1 << 16, 64, lock=context.Lock()) as system:
+        workers = [context.Process(target=work, args=(system, 1000 * (k + 1), k))
+                   for k in range(PROCESSES)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+        assert [worker.exitcode for worker in workers] == [0] * PROCESSES
+        assert system.get_used_memory() == 0
+        assert system.get_requested_memory() == 0
+        assert len(system.allocated_blocks) == 0
+        assert system.get_metrics()["allocations"] == system.get_metrics()["releases"] > 0
+        system.check_invariants()
+
+
+def test_attached_system_releases_views_without_close(monkeypatch):
+    errors = []
+    monkeypatch.setattr(sys, "unraisablehook", errors.append)
+    with SharedBuddySystem(1024, 64) as system:
+        attached = SharedBuddySystem.attach(system.name, system.lock)
+        assert attached.allocate(1, 100)
+        assert system.lookup(1) == (0, 128, 100)
+        del attached
+        gc.collect()
+        assert system.release(1)
+    assert errors == []
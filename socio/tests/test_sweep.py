@@ -0,0 +1,16 @@
+"""
+* Objetivo:
+*   Pruebas del barrido de parámetros
+*
+"""
+
+from benchmark.sweep import aggregate, build_tasks, run_sweep
+
+
+def test_invalid_configuration_does_not_abort_sweep():
+    tasks = build_tasks(["buddy", "concurrent-buddy"], [6144], [16], ["uniform"], [0], 500)
+    results = list(run_sweep(tasks, workers=2))
+    failed = [result for result in results if "error" in result]
+    assert [result["strategy"] for result in failed] == ["concurrent-buddy"]
+    assert "ValueError" in failed[0]["error"]
+    assert [row["strategy"] for row in aggregate(results)] == ["buddy"]
@@ -0,0 +1,144 @@
+"""
+* Objetivo:
+*   Buddy System que administra memoria real (bytearray o mmap)
+*
+* Descripción:
+*   Extiende BuddySystem para que sea dueño de un buffer de MAX_SIZE bytes.
+*   Cada asignación entrega un memoryview sin copia sobre el bloque asignado
+*   y la liberación (o load_blocks) invalida ese memoryview antes de reutilizar
+*   el bloque. Sólo se invalida la vista entregada: un slice tomado de ella o
+*   una vista creada desde self.memory siguen apuntando al bloque después de
+*   liberarlo, así que no deben conservarse más allá de release
+*
+"""
+
+import mmap
+from utils.buddy_system import BuddySystem
+
+
+class ArenaBuddySystem(BuddySystem):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4, backing="bytearray", path=None):
+        """
+        Inicializa el sistema Buddy junto con su arena de memoria
+
+        Args:
+            MAX_SIZE (int, optional): Tamaño de la arena en bytes. Defaults to 1024.
+            MIN_SIZE (int, optional): Tamaño mínimo de bloque. Defaults to 4.
+            backing (str, optional): Tipo de arena. Defaults to "bytearray".
+                - "bytearray": Buffer en el heap de Python
+                - "mmap": Mapeo anónimo, o respaldado por archivo si se da path
+            path (str, optional): Archivo para el mmap. Defaults to None (anónimo).
+
+        Raises:
+            ValueError: Si el tipo de arena no es válido o MAX_SIZE no es múltiplo
+                del bloque mínimo
+        """
+        super().__init__(MAX_SIZE, MIN_SIZE)
+
+        self.file = None
+        if backing == "bytearray":
+            self.arena = bytearray(MAX_SIZE)
+        elif backing == "mmap":
+            if path is None:
+                self.arena = mmap.mmap(-1, MAX_SIZE)
+            else:
+                self.file = open(path, "a+b")
+                self.file.truncate(MAX_SIZE)
+                self.arena = mmap.mmap(self.file.fileno(), MAX_SIZE)
+        else:
+            raise ValueError(f"Tipo de arena no válido: {backing}")
+
+        self.memory = memoryview(self.arena)  # Vista de toda la arena
+        self.views = {}  # PID → memoryview entregado al proceso
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def allocate_buffer(self, pid, size) -> memoryview | None:
+        """
+        Asigna memoria a un proceso y entrega una vista sin copia del bloque
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            Optional[memoryview]: Vista de size bytes sobre el bloque asignado
+                o None si no se pudo asignar
+        """
+        offset = self.allocate_offset(pid, size)
+        if offset < 0:
+            return None
+
+        view = self.memory[offset:offset + size]
+        self.views[pid] = view
+        return view
+
+    def get_buffer(self, pid) -> memoryview | None:
+        """
+        Retorna la vista del bloque de un proceso, creándola si se asignó con allocate
+
+        Args:
+            pid (int): ID del proceso
+
+        Returns:
+            Optional[memoryview]: Vista del bloque o None si el PID no está asignado
+        """
+        view = self.views.get(pid)
+        if view is None:
+            node = self.lookup(pid)
+            if node is None:
+                return None
+            view = self.memory[node.offset:node.offset + node.requested_size]
+            self.views[pid] = view
+        return view
+
+    def release(self, pid):
+        """
+        Libera la memoria de un proceso e invalida su memoryview
+
+        Los slices tomados de la vista no se invalidan (memoryview no lo
+        permite) y, si se conservan, escriben en el bloque ya reutilizado.
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+
+        Raises:
+            BufferError: Si la vista del bloque sigue exportada (p. ej. por numpy);
+                en ese caso el bloque no se libera
+        """
+        view = self.views.get(pid)
+        if view is not None:
+            view.release()  # Accesos posteriores lanzan ValueError
+            del self.views[pid]
+        return super().release(pid)
+
+    def load_blocks(self, blocks):
+        """
+        Reemplaza el estado del árbol (ver BuddySystem.load_blocks) e invalida
+        todas las vistas entregadas, cuyos bloques pueden ser ahora de otro proceso
+        """
+        self.__release_views()
+        super().load_blocks(blocks)
+
+    def __release_views(self):
+        """Invalida todas las vistas entregadas"""
+        for view in self.views.values():
+            view.release()
+        self.views.clear()
+
+    def close(self):
+        """Invalida todas las vistas y libera la arena"""
+        self.__release_views()
+        self.memory.release()
+        if isinstance(self.arena, mmap.mmap):
+            self.arena.close()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,519 @@
+"""
+* Objetivo:
+*   Implementación del Buddy System sobre un árbol implícito en arreglos
+*
+* Descripción:
+*   El árbol binario completo de buddies se guarda en buffers compactos
+*   indexados como un heap (hijos de i en 2i+1 y 2i+2), sin un objeto Python
+*   por nodo: cada slot ocupa un byte de estado, y el PID y el tamaño
+*   solicitado se guardan sólo para los bloques asignados. Las políticas de asignación son las mismas que las de BuddySystem,
+*   por lo que ambas implementaciones producen los mismos resultados
+*
+"""
+
+from bisect import bisect_left
+from strategy.system import MemoryAllocationStrategy
+from utils.buddy_system import EVENT_SPLIT, EVENT_MERGE, EVENT_ALLOCATE, EVENT_RELEASE
+
+# Estados de un slot del árbol implícito
+FREE = 0
+SPLIT = 1
+ALLOCATED = 2
+
+FREE_OWNER = (-1, 0)  # PID y tamaño solicitado de un slot sin asignar
+
+
+class ArrayNode:
+    """
+    Vista ligera de un slot del árbol implícito con la misma interfaz que Node,
+    para que el visualizador y demás llamadores puedan recorrer el árbol.
+    Se crea bajo demanda y no guarda estado propio.
+    """
+    __slots__ = ("system", "index")
+
+    def __init__(self, system, index):
+        self.system = system
+        self.index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, ArrayNode) and
+                self.system is other.system and self.index == other.index)
+
+    def __hash__(self):
+        return hash((id(self.system), self.index))
+
+    @property
+    def size(self):
+        return self.system.slot_size(self.index)
+
+    @property
+    def offset(self):
+        return self.system.slot_offset(self.index)
+
+    @property
+    def pid(self):
+        return self.system.owners.get(self.index, FREE_OWNER)[0]
+
+    @property
+    def requested_size(self):
+        return self.system.owners.get(self.index, FREE_OWNER)[1]
+
+    @property
+    def is_allocated(self):
+        return self.system.states[self.index] == ALLOCATED
+
+    @property
+    def is_split(self):
+        return self.system.states[self.index] == SPLIT
+
+    @property
+    def parent(self):
+        if self.index == 0:
+            return None
+        return ArrayNode(self.system, (self.index - 1) // 2)
+
+    @property
+    def left(self):
+        if not self.is_split:
+            return None
+        return ArrayNode(self.system, 2 * self.index + 1)
+
+    @property
+    def right(self):
+        if not self.is_split:
+            return None
+        return ArrayNode(self.system, 2 * self.index + 2)
+
+
+class ArrayBuddySystemIterator:
+    def __init__(self, system):
+        self.system = system
+        self.stack = [0]
+
+    def __iter__(self) -> "ArrayBuddySystemIterator":
+        return self
+
+    def __next__(self) -> ArrayNode:
+        if not self.stack:
+            raise StopIteration
+
+        index = self.stack.pop()
+
+        # Agregar hijos en orden inverso para procesar en pre-order
+        if self.system.states[index] == SPLIT:
+            self.stack.append(2 * index + 2)
+            self.stack.append(2 * index + 1)
+
+        return ArrayNode(self.system, index)
+
+
+class ArrayBuddySystem(MemoryAllocationStrategy):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4):
+        """
+        Inicializa el sistema Buddy sobre arreglos
+
+        Args:
+            MAX_SIZE (int, optional): Tamaño máximo de memoria. Defaults to 1024.
+            MIN_SIZE (int, optional): Tamaño mínimo de bloque. Defaults to 4.
+
+        Raises:
+            ValueError: Si MAX_SIZE no es una potencia de 2
+        """
+        if MAX_SIZE <= 0 or MAX_SIZE & (MAX_SIZE - 1):
+            raise ValueError("MAX_SIZE debe ser una potencia de 2")
+
+        self.MAX_SIZE = MAX_SIZE  # Tamaño total de memoria disponible
+        self.MIN_SIZE = MIN_SIZE  # Tamaño mínimo de bloque asignable
+
+        # Orden de un bloque: 0 = bloque mínimo, MAX_ORDER = raíz
+        self.MAX_ORDER = 0
+        while MAX_SIZE >> (self.MAX_ORDER + 1) >= max(MIN_SIZE, 1):
+            self.MAX_ORDER += 1
+        self.order_sizes = [MAX_SIZE >> (self.MAX_ORDER - order)
+                            for order in range(self.MAX_ORDER + 1)]
+
+        # Árbol implícito: un byte por nodo posible del árbol completo
+        self.states = bytearray((1 << (self.MAX_ORDER + 1)) - 1)  # FREE / SPLIT / ALLOCATED
+        # Slot asignado → (PID, tamaño solicitado); sólo ocupa memoria por bloque vivo
+        self.owners = {}
+
+        # Listas libres por orden (índices de slot) y bitmap de órdenes no vacíos
+        self.free_lists = [{} for _ in range(self.MAX_ORDER + 1)]
+        self.free_bitmap = 0
+
+        # Índice PID → slot asignado
+        self.allocated_blocks = {}
+
+        # Contadores incrementales de memoria, legibles en O(1)
+        self.used_memory = 0
+        self.requested_memory = 0
+        self.free_memory_per_order = [0] * (self.MAX_ORDER + 1)
+        self.live_blocks = 0
+        self.allocated_per_order = [0] * (self.MAX_ORDER + 1)
+        self.requested_per_order = [0] * (self.MAX_ORDER + 1)
+
+        # Contadores acumulados de operaciones
+        self.allocations = 0  # Asignaciones exitosas
+        self.releases = 0  # Liberaciones exitosas
+        self.failed_allocations = 0  # Asignaciones rechazadas por falta de bloque
+        self.fragmentation_failures = 0  # Fallas con memoria libre suficiente pero fragmentada
+        self.splits = 0  # Divisiones realizadas
+        self.merges = 0  # Combinaciones realizadas
+
+        # Observadores de eventos de cambio del árbol (reciben vistas ArrayNode)
+        self.listeners = []
+
+        self.__push_free(0)
+
+    def __iter__(self):
+        """Retorna un iterador para recorrer el árbol en pre-order"""
+        return ArrayBuddySystemIterator(self)
+
+    @property
+    def root(self):
+        """Vista del slot raíz, compatible con Node"""
+        return ArrayNode(self, 0)
+
+    def slot_order(self, index):
+        """Retorna el orden del bloque representado por un slot"""
+        return self.MAX_ORDER - ((index + 1).bit_length() - 1)
+
+    def slot_size(self, index):
+        """Retorna el tamaño del bloque representado por un slot"""
+        return self.MAX_SIZE >> ((index + 1).bit_length() - 1)
+
+    def slot_offset(self, index):
+        """Retorna la dirección de inicio del bloque representado por un slot"""
+        depth = (index + 1).bit_length() - 1
+        return (index + 1 - (1 << depth)) * (self.MAX_SIZE >> depth)
+
+    def allocate(self, pid, size):
+        """
+        Asigna memoria a un proceso
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            bool: True si la asignación fue exitosa, False en caso contrario
+                (memoria insuficiente o PID duplicado)
+        """
+        return self.allocate_offset(pid, size) >= 0
+
+    def allocate_offset(self, pid, size):
+        """
+        Asigna memoria a un proceso y retorna la dirección del bloque
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            int: Dirección de inicio del bloque asignado o -1 si no se pudo asignar
+        """
+        if size > self.MAX_SIZE:
+            self.failed_allocations += 1
+            return -1  # El tamaño solicitado excede la memoria total
+
+        if pid in self.allocated_blocks:
+            return -1  # El PID ya tiene un bloque asignado
+
+        order = self.order_for_size(size)
+        candidates = self.free_bitmap >> order
+        if not candidates:
+            self.failed_allocations += 1
+            if self.MAX_SIZE - self.used_memory >= self.order_sizes[order]:
+                self.fragmentation_failures += 1  # Hay memoria, pero no contigua
+            return -1  # No hay bloque libre suficientemente grande
+        found = order + (candidates & -candidates).bit_length() - 1
+
+        index = self.__pop_free(found)
+        self.splits += found - order
+        # Divide hasta llegar al orden solicitado; el buddy derecho queda libre
+        while found > order:
+            self.states[index] = SPLIT
+            self.__push_free(2 * index + 2)
+            if self.listeners:
+                self.__emit(EVENT_SPLIT, index)
+            index = 2 * index + 1
+            found -= 1
+
+        self.states[index] = ALLOCATED
+        self.owners[index] = (pid, size)
+        self.allocated_blocks[pid] = index
+        if self.listeners:
+            self.__emit(EVENT_ALLOCATE, index)
+
+        self.used_memory += self.order_sizes[order]
+        self.requested_memory += size
+        self.live_blocks += 1
+        self.allocated_per_order[order] += 1
+        self.requested_per_order[order] += size
+        self.allocations += 1
+        return self.slot_offset(index)  # Asignación exitosa
+
+    def allocate_many(self, requests):
+        """
+        Asigna memoria a varios procesos en un solo llamado
+
+        Las solicitudes se atienden de mayor a menor tamaño: al dividir un bloque
+        para una solicitud grande, los buddies sobrantes quedan en las listas
+        libres y las solicitudes menores los toman sin volver a dividir.
+
+        Args:
+            requests (iterable): Pares (pid, size)
+            
+        Returns:
+            list: Dirección asignada a cada solicitud (-1 si falló), en el mismo orden
+        """
+        requests = list(requests)
+        results = [-1] * len(requests)
+        allocate_offset = self.allocate_offset
+        for i in sorted(range(len(requests)), key=lambda i: requests[i][1], reverse=True):
+            pid, size = requests[i]
+            results[i] = allocate_offset(pid, size)
+        return results
+
+    def release(self, pid):
+        """
+        Libera la memoria asignada a un proceso
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        index = self.allocated_blocks.pop(pid, None)
+        if index is None:
+            return False  # No se encontró el proceso
+
+        order = self.slot_order(index)
+        requested = self.owners[index][1]
+        self.used_memory -= self.order_sizes[order]
+        self.requested_memory -= requested
+        self.live_blocks -= 1
+        self.allocated_per_order[order] -= 1
+        self.requested_per_order[order] -= requested
+        self.releases += 1
+
+        self.states[index] = FREE
+        if self.listeners:
+            self.__emit(EVENT_RELEASE, index)  # El observador aún ve el PID liberado
+        del self.owners[index]
+
+        # Combina buddies libres subiendo por el árbol; el buddy de un slot es
+        # su vecino en el mismo nivel: ((index + 1) ^ 1) - 1
+        while index > 0:
+            buddy = ((index + 1) ^ 1) - 1
+            if self.states[buddy] != FREE:
+                break  # El buddy está ocupado o dividido
+            self.__remove_free(buddy)
+            index = (index - 1) // 2
+            self.states[index] = FREE
+            self.merges += 1
+            if self.listeners:
+                self.__emit(EVENT_MERGE, index)
+
+        self.__push_free(index)
+        return True  # Liberación exitosa
+
+    def add_listener(self, listener):
+        """
+        Registra un observador de los cambios del árbol
+
+        Args:
+            listener (callable): Función listener(event, node) con los mismos
+                eventos que BuddySystem; node es una vista ArrayNode
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Quita un observador registrado con add_listener"""
+        self.listeners.remove(listener)
+
+    def __emit(self, event, index):
+        """Notifica un evento a todos los observadores"""
+        node = ArrayNode(self, index)
+        for listener in self.listeners:
+            listener(event, node)
+
+    def release_at(self, offset):
+        """
+        Libera el bloque que comienza en una dirección de memoria
+
+        Args:
+            offset (int): Dirección de inicio del bloque (la retornada por allocate_offset)
+
+        Returns:
+            bool: True si la liberación fue exitosa, False si no hay un bloque
+                asignado que comience en esa dirección
+        """
+        index = self.__find_leaf(offset)
+        if (index < 0 or self.states[index] != ALLOCATED or
+                self.slot_offset(index) != offset):
+            return False
+        return self.release(self.owners[index][0])
+
+    def order_for_size(self, size):
+        """Calcula el orden mínimo cuyo bloque cubre el tamaño solicitado"""
+        return bisect_left(self.order_sizes, size)
+
+    def lookup(self, pid) -> ArrayNode | None:
+        """
+        Busca el bloque asignado a un proceso en O(1)
+
+        Args:
+            pid (int): ID del proceso
+
+        Returns:
+            Optional[ArrayNode]: Vista del bloque asignado o None si no existe
+        """
+        index = self.allocated_blocks.get(pid)
+        if index is None:
+            return None
+        return ArrayNode(self, index)
+
+    def owner_of(self, address):
+        """
+        Retorna el PID dueño de una dirección de memoria
+
+        Args:
+            address (int): Dirección dentro del rango [0, MAX_SIZE)
+
+        Returns:
+            int: PID del proceso dueño o -1 si la dirección está libre o fuera de rango
+        """
+        index = self.__find_leaf(address)
+        if index < 0 or self.states[index] != ALLOCATED:
+            return -1
+        return self.owners[index][0]
+
+    def __find_leaf(self, address):
+        """
+        Desciende desde la raíz hasta el slot no dividido que contiene la dirección
+
+        Args:
+            address (int): Dirección de memoria
+
+        Returns:
+            int: Índice del slot o -1 si la dirección está fuera de rango
+        """
+        if address < 0 or address >= self.MAX_SIZE:
+            return -1
+
+        index = 0
+        size = self.MAX_SIZE
+        while self.states[index] == SPLIT:
+            size //= 2
+            # El bit de la dirección correspondiente al tamaño elige el hijo
+            index = 2 * index + (2 if address & size else 1)
+        return index
+
+    def __push_free(self, index):
+        """Agrega un slot libre a la lista de su orden"""
+        order = self.slot_order(index)
+        self.free_lists[order][index] = None
+        self.free_bitmap |= 1 << order
+        self.free_memory_per_order[order] += self.order_sizes[order]
+
+    def __pop_free(self, order):
+        """Extrae un slot libre de la lista del orden indicado (LIFO)"""
+        free_list = self.free_lists[order]
+        index, _ = free_list.popitem()
+        if not free_list:
+            self.free_bitmap &= ~(1 << order)
+        self.free_memory_per_order[order] -= self.order_sizes[order]
+        return index
+
+    def __remove_free(self, index):
+        """Quita un slot específico de la lista libre de su orden"""
+        order = self.slot_order(index)
+        free_list = self.free_lists[order]
+        del free_list[index]
+        if not free_list:
+            self.free_bitmap &= ~(1 << order)
+        self.free_memory_per_order[order] -= self.order_sizes[order]
+
+    def get_used_memory(self):
+        """Retorna la memoria utilizada por procesos"""
+        return self.used_memory
+
+    def get_free_memory(self):
+        """Retorna la memoria disponible para nuevos procesos"""
+        return self.MAX_SIZE - self.used_memory
+
+    def get_memory_usage(self):
+        """Retorna el porcentaje de memoria utilizada (0.0 a 100.0)"""
+        return (self.used_memory / self.MAX_SIZE) * 100
+
+    def get_requested_memory(self):
+        """Retorna la memoria solicitada por los procesos (antes de redondear)"""
+        return self.requested_memory
+
+    def get_internal_fragmentation(self):
+        """Retorna la diferencia entre memoria asignada y memoria solicitada"""
+        return self.used_memory - self.requested_memory
+
+    def get_free_memory_per_order(self):
+        """Retorna un dict tamaño de bloque → bytes libres en bloques de ese tamaño"""
+        return dict(zip(self.order_sizes, self.free_memory_per_order))
+
+    def get_live_blocks(self):
+        """Retorna la cantidad de bloques asignados actualmente"""
+        return self.live_blocks
+
+    def get_largest_free_block(self):
+        """Retorna el tamaño del bloque libre más grande (0 si no hay memoria libre)"""
+        if not self.free_bitmap:
+            return 0
+        return self.order_sizes[self.free_bitmap.bit_length() - 1]
+
+    def get_metrics(self):
+        """
+        Retorna una instantánea de la telemetría del asignador
+
+        Mismas claves que BuddySystem.get_metrics; la combinación siempre es
+        inmediata, así que no hay combinaciones diferidas.
+
+        Returns:
+            dict: Contadores acumulados, estado de la memoria e histogramas por
+                tamaño de bloque
+        """
+        largest_order = self.free_bitmap.bit_length() - 1
+        return {
+            "allocations": self.allocations,
+            "releases": self.releases,
+            "failed_allocations": self.failed_allocations,
+            "fragmentation_failures": self.fragmentation_failures,
+            "splits": self.splits,
+            "merges": self.merges,
+            "deferred_merges": 0,
+            "coalesce_passes": 0,
+            "used_memory": self.used_memory,
+            "requested_memory": self.requested_memory,
+            "free_memory": self.MAX_SIZE - self.used_memory,
+            "internal_fragmentation": self.used_memory - self.requested_memory,
+            "live_blocks": self.live_blocks,
+            "largest_free_order": largest_order,
+            "largest_free_block": self.order_sizes[largest_order] if largest_order >= 0 else 0,
+            "free_blocks_per_order": {size: free // size for size, free
+                                      in zip(self.order_sizes, self.free_memory_per_order)},
+            "allocated_blocks_per_order": dict(zip(self.order_sizes, self.allocated_per_order)),
+            "requested_bytes_per_order": dict(zip(self.order_sizes, self.requested_per_order)),
+        }
+
+    def show(self, index=0, level=0):
+        """Muestra el árbol de memoria (para debug)."""
+        indent = "    " * level
+        size = self.slot_size(index)
+        state = self.states[index]
+        if state == SPLIT:
+            print(f"{indent}[Size={size} SPLIT]")
+            self.show(2 * index + 1, level + 1)
+            self.show(2 * index + 2, level + 1)
+        elif state == ALLOCATED:
+            print(f"{indent}[Size={size} PID={self.owners[index][0]}]")
+        else:
+            print(f"{indent}[Size={size} FREE]")
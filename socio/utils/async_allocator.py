@@ -0,0 +1,227 @@
+"""
+* Objetivo:
+*   Servicio asyncio de asignación que espera memoria en lugar de fallar
+*
+* Descripción:
+*   Envuelve una estrategia de memoria para usarla desde un bucle de eventos.
+*   Una solicitud que no cabe queda en una cola hasta que una liberación deja
+*   espacio contiguo suficiente, se cumple su tiempo de espera o se cancela.
+*   Las esperas se atienden en orden de llegada (ORDER_FIFO) o de prioridad
+*   (ORDER_PRIORITY); el primero de la cola bloquea a los siguientes aunque
+*   éstos quepan, así las solicitudes grandes no quedan postergadas para
+*   siempre por un flujo de pequeñas. Uso:
+*
+*       service = AsyncAllocator(BuddySystem(1 << 20, 64))
+*       offset = await service.allocate(pid, 4096, timeout=0.5)
+*       ...
+*       service.release(pid)  # despierta a las solicitudes en espera
+*
+*   No es seguro para hilos: todas las llamadas deben hacerse desde el bucle
+*   de eventos, y las liberaciones deben pasar por el servicio (no por la
+*   estrategia envuelta) para despertar a la cola.
+*
+"""
+
+import asyncio
+import heapq
+import time
+from itertools import count
+
+# Orden en que se atienden las solicitudes en espera
+ORDER_FIFO = "fifo"  # Por orden de llegada
+ORDER_PRIORITY = "priority"  # Mayor prioridad primero; a igual prioridad, por llegada
+ORDERING_POLICIES = (ORDER_FIFO, ORDER_PRIORITY)
+
+
+class Waiter:
+    __slots__ = ("key", "pid", "size", "future", "start")
+
+    def __init__(self, key, pid, size, future):
+        """
+        Inicializa una solicitud en espera
+
+        Args:
+            key (tuple): Clave de orden en la cola (menor = antes)
+            pid (int): ID del proceso
+            size (int): Tamaño solicitado
+            future (asyncio.Future): Recibe la dirección del bloque asignado
+        """
+        self.key = key
+        self.pid = pid
+        self.size = size
+        self.future = future
+        self.start = time.perf_counter_ns()
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+class AsyncAllocator:
+    def __init__(self, system, ordering=ORDER_FIFO):
+        """
+        Inicializa el servicio sobre una estrategia de memoria
+
+        Args:
+            system (MemoryAllocationStrategy): Estrategia a envolver
+            ordering (str, optional): ORDER_FIFO u ORDER_PRIORITY. Defaults to ORDER_FIFO.
+
+        Raises:
+            ValueError: Si la política de orden no existe
+        """
+        if ordering not in ORDERING_POLICIES:
+            raise ValueError(f"Política de orden no válida: {ordering}")
+        self.system = system
+        self.ordering = ordering
+
+        # Cola de espera; las canceladas se descartan al llegar al frente
+        self.queue = []
+        self.waiting = {}  # PID → Waiter de las solicitudes en espera
+        self.__arrivals = count()
+        self.timing_hook = None
+
+        # Métricas
+        self.immediate_allocations = 0
+        self.queued_allocations = 0
+        self.granted_after_wait = 0
+        self.allocation_timeouts = 0
+        self.cancelled_allocations = 0
+        self.max_queue_depth = 0
+        self.wait_ns_sum = 0
+        self.wait_ns_max = 0
+
+    @property
+    def queue_depth(self):
+        """Cantidad de solicitudes esperando memoria"""
+        return len(self.waiting)
+
+    async def allocate(self, pid, size, timeout=None, priority=0):
+        """
+        Asigna memoria a un proceso, esperando a que se libere si no cabe
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+            timeout (float, optional): Segundos máximos de espera. Defaults to
+                None (sin límite).
+            priority (int, optional): Prioridad con ORDER_PRIORITY (mayor =
+                antes). Defaults to 0.
+
+        Returns:
+            int: Dirección de inicio del bloque asignado
+
+        Raises:
+            ValueError: Si el tamaño nunca podría caber o el PID ya tiene un
+                bloque o una solicitud en espera
+            TimeoutError: Si se cumple timeout sin memoria suficiente
+            asyncio.CancelledError: Si la tarea se cancela mientras espera
+        """
+        # Una solicitud que nunca podría caber bloquearía la cola para siempre
+        max_block = self.system.get_max_block_size()
+        if size > max_block:
+            raise ValueError(f"El tamaño {size} excede el bloque más grande posible ({max_block})")
+        if pid in self.waiting or pid in self.system.allocated_blocks:
+            raise ValueError(f"El PID {pid} ya tiene un bloque o una solicitud en espera")
+
+        # Sin cola se intenta directamente; con cola se respeta el orden
+        if not self.waiting:
+            offset = self.system.allocate_offset(pid, size)
+            if offset >= 0:
+                self.immediate_allocations += 1
+                return offset
+
+        arrival = next(self.__arrivals)
+        key = (-priority, arrival) if self.ordering == ORDER_PRIORITY else (arrival,)
+        waiter = Waiter(key, pid, size, asyncio.get_running_loop().create_future())
+        heapq.heappush(self.queue, waiter)
+        self.waiting[pid] = waiter
+        self.queued_allocations += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self.waiting))
+
+        # Con prioridad la solicitud nueva puede quedar al frente y caber ya
+        self.__wake()
+
+        try:
+            return await asyncio.wait_for(waiter.future, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError) as error:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # El bloque se asignó justo antes de la cancelación: se devuelve
+                self.release(pid)
+            elif self.waiting.get(pid) is waiter:
+                del self.waiting[pid]
+                if isinstance(error, asyncio.TimeoutError):
+                    self.allocation_timeouts += 1
+                else:
+                    self.cancelled_allocations += 1
+                # Si era el primero de la cola, los siguientes pueden caber
+                self.__wake()
+            raise
+
+    def release(self, pid):
+        """
+        Libera la memoria de un proceso y atiende a las solicitudes en espera
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        if not self.system.release(pid):
+            return False
+        self.__wake()
+        return True
+
+    def __wake(self):
+        """Asigna memoria a las solicitudes del frente de la cola mientras quepan"""
+        queue = self.queue
+        while queue:
+            waiter = queue[0]
+            if waiter.future.done() or self.waiting.get(waiter.pid) is not waiter:
+                heapq.heappop(queue)  # Cancelada o vencida
+                continue
+
+            offset = self.system.allocate_offset(waiter.pid, waiter.size)
+            if offset < 0:
+                return  # El frente no cabe: los demás siguen esperando detrás
+
+            heapq.heappop(queue)
+            del self.waiting[waiter.pid]
+            waited = time.perf_counter_ns() - waiter.start
+            self.granted_after_wait += 1
+            self.wait_ns_sum += waited
+            self.wait_ns_max = max(self.wait_ns_max, waited)
+            if self.timing_hook is not None:
+                self.timing_hook("wait", waited)
+            waiter.future.set_result(offset)
+
+    def set_timing_hook(self, hook):
+        """
+        Instala (o quita con None) una función que recibe cada tiempo de espera
+
+        Args:
+            hook (callable): Función hook("wait", elapsed_ns), p. ej. un
+                TimingRecorder de utils.telemetry, o None para desactivar
+        """
+        self.timing_hook = hook
+
+    def get_metrics(self):
+        """
+        Retorna una instantánea de las métricas de la cola
+
+        Returns:
+            dict: Profundidad actual y máxima de la cola, asignaciones inmediatas
+                y encoladas, atendidas tras esperar, vencidas, canceladas y
+                tiempos de espera (ns) de las atendidas
+        """
+        return {
+            "queue_depth": len(self.waiting),
+            "max_queue_depth": self.max_queue_depth,
+            "immediate_allocations": self.immediate_allocations,
+            "queued_allocations": self.queued_allocations,
+            "granted_after_wait": self.granted_after_wait,
+            "allocation_timeouts": self.allocation_timeouts,
+            "cancelled_allocations": self.cancelled_allocations,
+            "wait_ns_sum": self.wait_ns_sum,
+            "wait_ns_max": self.wait_ns_max,
+            "wait_ns_avg": self.wait_ns_sum // self.granted_after_wait if self.granted_after_wait else 0,
+        }
@@ -0,0 +1,260 @@
+"""
+* Objetivo:
+*   Base común para asignadores con etiquetas de frontera (boundary tags)
+*
+* Descripción:
+*   La memoria se divide en bloques contiguos de tamaño arbitrario (múltiplo
+*   de MIN_SIZE). Cada bloque se registra por su dirección de inicio (cabecera)
+*   y por su dirección de fin (pie), de modo que al liberar un bloque sus
+*   vecinos físicos se encuentran en O(1) y se combinan si están libres.
+*   Las subclases sólo deciden cómo indexar los bloques libres
+*
+"""
+
+from abc import abstractmethod
+from strategy.system import MemoryAllocationStrategy
+
+
+class Block:
+    __slots__ = ("offset", "size", "pid", "is_allocated", "requested_size")
+
+    def __init__(self, offset, size):
+        """
+        Inicializa un bloque libre
+
+        Args:
+            offset (int): Dirección de inicio del bloque
+            size (int): Tamaño del bloque
+        """
+        self.offset = offset
+        self.size = size
+        self.pid = -1  # -1: sin proceso asignado
+        self.is_allocated = False
+        self.requested_size = 0
+
+
+class BoundaryTagAllocator(MemoryAllocationStrategy):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4):
+        """
+        Inicializa la memoria como un único bloque libre
+
+        Args:
+            MAX_SIZE (int, optional): Tamaño total de memoria. Defaults to 1024.
+            MIN_SIZE (int, optional): Granularidad y tamaño mínimo de bloque. Defaults to 4.
+
+        Raises:
+            ValueError: Si MIN_SIZE no es positivo o es mayor que MAX_SIZE
+        """
+        if MIN_SIZE <= 0 or MIN_SIZE > MAX_SIZE:
+            raise ValueError("MIN_SIZE debe ser positivo y no mayor que MAX_SIZE")
+
+        self.MAX_SIZE = MAX_SIZE
+        self.MIN_SIZE = MIN_SIZE
+
+        # Etiquetas de frontera: dirección de inicio → bloque y dirección de fin → bloque
+        self.starts = {}
+        self.ends = {}
+
+        # Índice PID → bloque asignado y contadores incrementales
+        self.allocated_blocks = {}
+        self.used_memory = 0
+        self.requested_memory = 0
+        self.live_blocks = 0
+
+        # El resto que no completa un gránulo queda fuera de la memoria administrada
+        self.usable_size = MAX_SIZE - MAX_SIZE % MIN_SIZE
+
+    def _init_blocks(self):
+        """Crea el bloque libre inicial; las subclases lo llaman al terminar su __init__"""
+        block = Block(0, self.usable_size)
+        self.__tag(block)
+        self._insert_free(block)
+
+    # --- Índice de bloques libres (a implementar por las subclases) ---
+
+    @abstractmethod
+    def _insert_free(self, block: Block):
+        """Agrega un bloque libre al índice"""
+        pass
+
+    @abstractmethod
+    def _remove_free(self, block: Block):
+        """Quita un bloque libre específico del índice"""
+        pass
+
+    @abstractmethod
+    def _find_free(self, size) -> Block | None:
+        """Extrae del índice un bloque libre de al menos size bytes, o None"""
+        pass
+
+    @abstractmethod
+    def get_largest_free_block(self):
+        """Retorna el tamaño del bloque libre más grande"""
+        pass
+
+    # --- Operaciones comunes ---
+
+    def __iter__(self):
+        """Recorre los bloques (Block) en orden de dirección"""
+        offset = 0
+        while offset < self.usable_size:
+            block = self.starts[offset]
+            yield block
+            offset += block.size
+
+    def round_size(self, size):
+        """Redondea un tamaño al múltiplo de MIN_SIZE siguiente (mínimo MIN_SIZE)"""
+        return max(-(-size // self.MIN_SIZE), 1) * self.MIN_SIZE
+
+    def allocate(self, pid, size):
+        """
+        Asigna memoria a un proceso
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            bool: True si la asignación fue exitosa, False en caso contrario
+        """
+        return self.allocate_offset(pid, size) >= 0
+
+    def allocate_offset(self, pid, size):
+        """
+        Asigna memoria a un proceso y retorna la dirección del bloque
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            int: Dirección de inicio del bloque asignado o -1 si no se pudo asignar
+        """
+        if size > self.usable_size or pid in self.allocated_blocks:
+            return -1
+
+        rounded = self.round_size(size)
+        block = self._find_free(rounded)
+        if block is None:
+            return -1  # No hay un bloque libre suficientemente grande
+
+        # Devuelve el sobrante al índice como un bloque libre nuevo
+        if block.size - rounded >= self.MIN_SIZE:
+            remainder = Block(block.offset + rounded, block.size - rounded)
+            del self.ends[block.offset + block.size]
+            block.size = rounded
+            self.__tag(block)
+            self.__tag(remainder)
+            self._insert_free(remainder)
+
+        block.is_allocated = True
+        block.pid = pid
+        block.requested_size = size
+        self.allocated_blocks[pid] = block
+
+        self.used_memory += block.size
+        self.requested_memory += size
+        self.live_blocks += 1
+        return block.offset
+
+    def release(self, pid):
+        """
+        Libera la memoria de un proceso combinándola con sus vecinos libres
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        block = self.allocated_blocks.pop(pid, None)
+        if block is None:
+            return False
+
+        self.used_memory -= block.size
+        self.requested_memory -= block.requested_size
+        self.live_blocks -= 1
+        block.is_allocated = False
+        block.pid = -1
+        block.requested_size = 0
+
+        # El pie del bloque anterior termina donde empieza este
+        previous = self.ends.get(block.offset)
+        if previous is not None and not previous.is_allocated:
+            self._remove_free(previous)
+            block = self.__join(previous, block)
+
+        # La cabecera del bloque siguiente empieza donde termina este
+        following = self.starts.get(block.offset + block.size)
+        if following is not None and not following.is_allocated:
+            self._remove_free(following)
+            block = self.__join(block, following)
+
+        self._insert_free(block)
+        return True
+
+    def release_at(self, offset):
+        """
+        Libera el bloque que comienza en una dirección de memoria
+
+        Args:
+            offset (int): Dirección de inicio del bloque
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        block = self.starts.get(offset)
+        if block is None or not block.is_allocated:
+            return False
+        return self.release(block.pid)
+
+    def lookup(self, pid) -> Block | None:
+        """Retorna el bloque asignado a un proceso o None si no existe"""
+        return self.allocated_blocks.get(pid)
+
+    def __tag(self, block: Block):
+        """Registra la cabecera y el pie de un bloque"""
+        self.starts[block.offset] = block
+        self.ends[block.offset + block.size] = block
+
+    def __join(self, first: Block, second: Block):
+        """Une dos bloques libres físicamente contiguos y retorna el primero"""
+        del self.ends[first.offset + first.size]
+        del self.starts[second.offset]
+        first.size += second.size
+        self.ends[first.offset + first.size] = first
+        return first
+
+    def get_max_block_size(self):
+        """Retorna la memoria administrada: el resto de MAX_SIZE que no completa un gránulo no se usa"""
+        return self.usable_size
+
+    def get_used_memory(self):
+        """Retorna la memoria utilizada por procesos"""
+        return self.used_memory
+
+    def get_free_memory(self):
+        """Retorna la memoria disponible para nuevos procesos"""
+        return self.usable_size - self.used_memory
+
+    def get_memory_usage(self):
+        """Retorna el porcentaje de la memoria administrada (usable_size) que está utilizada"""
+        return (self.used_memory / self.usable_size) * 100
+
+    def get_requested_memory(self):
+        """Retorna la memoria solicitada por los procesos (antes de redondear)"""
+        return self.requested_memory
+
+    def get_internal_fragmentation(self):
+        """Retorna la diferencia entre memoria asignada y memoria solicitada"""
+        return self.used_memory - self.requested_memory
+
+    def get_live_blocks(self):
+        """Retorna la cantidad de bloques asignados actualmente"""
+        return self.live_blocks
+
+    def show(self):
+        """Muestra los bloques en orden de dirección (para debug)."""
+        for block in self:
+            status = f"PID={block.pid}" if block.is_allocated else "FREE"
+            print(f"[Offset={block.offset} Size={block.size} {status}]")
@@ -8,15 +8,31 @@
 *
 * Descripción:
 *   Este sistema gestiona la memoria dividiéndola en bloques de tamaño potencia de 2
-*   y permite la asignación y liberación de procesos de manera eficiente
+*   y permite la asignación y liberación de procesos de manera eficiente.
+*   Una memoria que no es potencia de 2 se representa con varios árboles
+*   (uno por cada bit de MAX_SIZE en bloques mínimos) y, con trim_tail, la
+*   parte no usada de un bloque redondeado se devuelve como buddies libres
 *
 """
 
-from typing import Optional, Iterator
+import time
+from bisect import bisect_left, bisect_right
 from strategy.system import MemoryAllocationStrategy
 
+# Políticas de combinación de buddies al liberar
+COALESCE_EAGER = "eager"  # Combina en cada liberación
+COALESCE_LAZY = "lazy"  # Combina sólo cuando una asignación fallaría
+COALESCE_THRESHOLD = "threshold"  # Combina tras cierta cantidad de liberaciones diferidas
+COALESCING_POLICIES = (COALESCE_EAGER, COALESCE_LAZY, COALESCE_THRESHOLD)
+
+# Eventos de cambio del árbol que reciben los observadores (listener(event, node))
+EVENT_SPLIT = "split"  # node se dividió; ya tiene hijos left y right
+EVENT_MERGE = "merge"  # Los hijos de node se combinaron; node queda libre sin hijos
+EVENT_ALLOCATE = "allocate"  # node se asignó a un proceso
+EVENT_RELEASE = "release"  # node se liberó (antes de combinarlo con su buddy)
+
 class Node:
-    def __init__(self, size, parent=None, is_allocated=False, pid=-1):
+    def __init__(self, size, parent=None, is_allocated=False, pid=-1, offset=0):
         """
         Inicializa un nodo de memoria
         
@@ -27,24 +43,26 @@ class Node:
             pid (int, optional): ID del proceso asignado. Defaults to -1.
                 - -1: Sin proceso asignado (libre)
                 - >=1: Con proceso asignado
+            offset (int, optional): Dirección de inicio del bloque. Defaults to 0.
         """
         # PID = -1 (Sin proceso asignado)
         # PID >= 1 (Con proceso asignado)
         self.pid = pid
         self.size = size  # Tamaño del bloque de memoria
+        self.offset = offset  # Dirección de inicio del bloque
         self.is_allocated = is_allocated  # Estado de asignación
         self.parent = parent  # Referencia al nodo padre
         self.left = None  # Hijo izquierdo (buddy)
         self.right = None  # Hijo derecho (buddy)
         self.is_split = False  # Indica si el nodo está dividido
+        self.requested_size = 0  # Tamaño solicitado por el proceso (fragmentación interna)
 
 class BuddySystemIterator:
-    def __init__(self, root: Optional[Node]):
-        self.stack = []
-        if root:
-            self.stack.append(root)
+    def __init__(self, roots):
+        # Las raíces se recorren en orden de dirección
+        self.stack = list(reversed(roots))
     
-    def __iter__(self) -> Iterator[Node]:
+    def __iter__(self) -> "BuddySystemIterator":
         return self
     
     def __next__(self) -> Node:
@@ -62,21 +80,114 @@ class BuddySystemIterator:
         return current
 
 class BuddySystem(MemoryAllocationStrategy):
-    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4, coalescing=COALESCE_EAGER,
+                 coalesce_threshold=64, trim_tail=False):
         """
         Inicializa el sistema Buddy
         
         Args:
             MAX_SIZE (int, optional): Tamaño máximo de memoria. Defaults to 1024.
             MIN_SIZE (int, optional): Tamaño mínimo de bloque. Defaults to 8.
+            coalescing (str, optional): Política de combinación de buddies.
+                Defaults to COALESCE_EAGER.
+                - COALESCE_EAGER: Combina en cada liberación
+                - COALESCE_LAZY: Difiere la combinación hasta que una asignación
+                  no encuentre un bloque libre suficientemente grande
+                - COALESCE_THRESHOLD: Como lazy, pero además combina todo cada
+                  coalesce_threshold combinaciones diferidas
+            coalesce_threshold (int, optional): Combinaciones diferidas que disparan
+                una pasada de combinación con COALESCE_THRESHOLD. Defaults to 64.
+            trim_tail (bool, optional): Asignar sólo los bloques mínimos que cubren
+                la solicitud: el bloque redondeado se divide y su cola sin usar
+                queda libre, así un proceso puede ocupar varios bloques
+                contiguos (blocks_of). Defaults to False.
+            
+        Raises:
+            ValueError: Si MAX_SIZE no es múltiplo del bloque mínimo o la política no existe
         """
+        if MAX_SIZE <= 0:
+            raise ValueError("MAX_SIZE debe ser positivo")
+
+        if coalescing not in COALESCING_POLICIES:
+            raise ValueError(f"Política de combinación no válida: {coalescing}")
+
         self.MAX_SIZE = MAX_SIZE  # Tamaño total de memoria disponible
         self.MIN_SIZE = MIN_SIZE  # Tamaño mínimo de bloque asignable
-        self.root = Node(MAX_SIZE)  # Nodo raíz que representa toda la memoria
+
+        # Orden de un bloque: 0 = bloque mínimo, MAX_ORDER = raíz más grande
+        # (la mayor potencia de 2 que no supera MAX_SIZE)
+        top = 1 << (MAX_SIZE.bit_length() - 1)
+        self.MAX_ORDER = 0
+        while top >> (self.MAX_ORDER + 1) >= max(MIN_SIZE, 1):
+            self.MAX_ORDER += 1
+        # Tamaño de bloque de cada orden (estrictamente creciente)
+        self.order_sizes = [top >> (self.MAX_ORDER - order)
+                            for order in range(self.MAX_ORDER + 1)]
+        self.__size_orders = {size: order for order, size in enumerate(self.order_sizes)}
+        if MAX_SIZE % self.order_sizes[0]:
+            raise ValueError(f"MAX_SIZE debe ser múltiplo del bloque mínimo ({self.order_sizes[0]})")
+
+        # Una lista libre por orden (dict dirección → nodo, borrado O(1))
+        # y un bitmap cuyo bit k indica que la lista del orden k no está vacía
+        self.free_lists = [{} for _ in range(self.MAX_ORDER + 1)]
+        self.free_bitmap = 0
+
+        # Contadores incrementales de memoria, legibles en O(1)
+        self.used_memory = 0  # Bytes en bloques asignados
+        self.requested_memory = 0  # Bytes solicitados por los procesos
+        self.free_memory_per_order = [0] * (self.MAX_ORDER + 1)  # Bytes libres por orden
+        self.live_blocks = 0  # Bloques asignados actualmente
+        self.allocated_per_order = [0] * (self.MAX_ORDER + 1)  # Bloques asignados por orden
+        self.requested_per_order = [0] * (self.MAX_ORDER + 1)  # Bytes solicitados por orden
+
+        # Telemetría: operaciones acumuladas desde la creación
+        self.allocations = 0  # Asignaciones exitosas
+        self.releases = 0  # Liberaciones exitosas
+        self.failed_allocations = 0  # Asignaciones rechazadas por falta de bloque
+        self.fragmentation_failures = 0  # Fallas con memoria libre suficiente pero fragmentada
+        self.timing_hook = None
+
+        # Observadores de eventos de cambio del árbol (p. ej. el visualizador)
+        self.listeners = []
+
+        # Índice PID → bloque asignado (búsquedas y liberaciones sin recorrer el árbol)
+        self.allocated_blocks = {}
+
+        # Política de combinación y contadores de trabajo de división/combinación
+        self.coalescing = coalescing
+        self.coalesce_threshold = coalesce_threshold
+        self.splits = 0  # Divisiones realizadas
+        self.merges = 0  # Combinaciones realizadas
+        self.deferred_merges = 0  # Liberaciones con el buddy libre que no se combinaron
+        self.pending_merges = 0  # Combinaciones diferidas desde la última pasada
+        self.coalesce_passes = 0  # Pasadas completas de combinación
+
+        # Bloques adicionales (cola recortada) de cada proceso con trim_tail
+        self.trim_tail = trim_tail
+        self.tail_blocks = {}  # PID → nodos contiguos después del bloque de allocated_blocks
+
+        self.__create_roots()
+        for root in self.roots:
+            self.__push_free(root)
+
+    def __create_roots(self):
+        """
+        Crea un árbol por cada bit de MAX_SIZE (en bloques mínimos), del más
+        grande al más chico; cada raíz queda alineada a su tamaño y ningún
+        bloque tiene su buddy en otro árbol
+        """
+        self.roots = []
+        offset = 0
+        for size in reversed(self.order_sizes):
+            if self.MAX_SIZE - offset >= size:
+                self.roots.append(Node(size, offset=offset))
+                offset += size
+        self.root_offsets = [root.offset for root in self.roots]
+        self.root = self.roots[0]  # Raíz más grande (la única si MAX_SIZE es potencia de 2)
 
     def __iter__(self):
-        """Retorna un iterador para recorrer el árbol en pre-order"""
-        return BuddySystemIterator(self.root)
+        """Retorna un iterador para recorrer los árboles en pre-order"""
+        return BuddySystemIterator(self.roots)
 
     def allocate(self, pid, size):
         """
@@ -88,16 +199,140 @@ class BuddySystem(MemoryAllocationStrategy):
             
         Returns:
             bool: True si la asignación fue exitosa, False en caso contrario
+                (memoria insuficiente o PID duplicado)
         """
-        if size > self.MAX_SIZE:
-            return False  # El tamaño solicitado excede la memoria total
+        return self.allocate_offset(pid, size) >= 0
+
+    def allocate_offset(self, pid, size):
+        """
+        Asigna memoria a un proceso y retorna la dirección del bloque
+        
+        Busca en el bitmap el orden libre más pequeño que cubre el tamaño
+        solicitado y divide ese bloque sólo lo necesario. Costo O(log N).
+        Con trim_tail el bloque se sigue dividiendo (__trim) y la cola sin usar
+        queda libre; la dirección retornada es el inicio de la región contigua.
         
-        return self.__allocated_helper(self.root, pid, size)
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+            
+        Returns:
+            int: Dirección de inicio del bloque asignado o -1 si no se pudo asignar
+        """
+        if size > self.order_sizes[-1]:
+            self.failed_allocations += 1
+            return -1  # El tamaño solicitado excede el árbol más grande
+
+        if pid in self.allocated_blocks:
+            return -1  # El PID ya tiene un bloque asignado
+        
+        order = self.order_for_size(size)
+        found = self.__find_free_order(order)
+        if found < 0 and self.pending_merges:
+            # Con combinación diferida puede haber buddies libres sin combinar
+            self.coalesce()
+            found = self.__find_free_order(order)
+        if found < 0:
+            self.failed_allocations += 1
+            if self.MAX_SIZE - self.used_memory >= self.order_sizes[order]:
+                self.fragmentation_failures += 1  # Hay memoria, pero no contigua
+            return -1  # No hay bloque libre suficientemente grande
+
+        node = self.__pop_free(found)
+        # Divide hasta llegar al orden solicitado; el buddy derecho queda libre
+        while found > order:
+            self.__split_node(node)
+            node = node.left
+            found -= 1
+
+        if self.trim_tail and size <= node.size - self.order_sizes[0]:
+            blocks = self.__trim(node, size)
+            self.tail_blocks[pid] = blocks[1:]
+        else:
+            blocks = [node]
+
+        remaining = size
+        for block in blocks:
+            block.is_allocated = True
+            block.pid = pid
+            # Cada bloque guarda la parte de la solicitud que cubre
+            block.requested_size = min(remaining, block.size)
+            remaining -= block.requested_size
+            block_order = self.__size_orders[block.size]
+            self.used_memory += block.size
+            self.live_blocks += 1
+            self.allocated_per_order[block_order] += 1
+            self.requested_per_order[block_order] += block.requested_size
+            if self.listeners:
+                self.__emit(EVENT_ALLOCATE, block)
+
+        self.allocated_blocks[pid] = blocks[0]
+        self.requested_memory += size
+        self.allocations += 1
+        return node.offset  # Asignación exitosa
+
+    def __trim(self, node: Node, size):
+        """
+        Divide un bloque recién tomado para cubrir sólo los bloques mínimos de una solicitud
+        
+        Mientras la solicitud no llene el nodo se divide: si cabe en la mitad
+        izquierda se sigue por ella (la derecha queda libre); si no, la izquierda
+        se asigna completa y se sigue por la derecha. Resultan a lo sumo
+        log N bloques contiguos desde node.offset.
+        
+        Args:
+            node (Node): Bloque del orden que cubre la solicitud (fuera de las listas libres)
+            size (int): Tamaño solicitado
+            
+        Returns:
+            list: Nodos a asignar, en orden de dirección
+        """
+        unit = self.order_sizes[0]
+        need = max(-(-size // unit), 1) * unit  # Bytes en bloques mínimos (al menos uno)
+        blocks = []
+        while need < node.size:
+            self.__split_node(node)
+            half = node.size // 2
+            if need > half:
+                blocks.append(node.left)
+                need -= half
+                node = node.right
+                self.__remove_free(node)
+            else:
+                node = node.left
+        blocks.append(node)
+        return blocks
+
+    def allocate_many(self, requests):
+        """
+        Asigna memoria a varios procesos en un solo llamado
+        
+        Las solicitudes se atienden de mayor a menor tamaño: al dividir un bloque
+        para una solicitud grande, los buddies sobrantes quedan en las listas
+        libres y las solicitudes menores los toman sin volver a dividir.
+        
+        Args:
+            requests (iterable): Pares (pid, size)
+            
+        Returns:
+            list: Dirección asignada a cada solicitud (-1 si falló), en el mismo orden
+        """
+        requests = list(requests)
+        results = [-1] * len(requests)
+        allocate_offset = self.allocate_offset
+        for i in sorted(range(len(requests)), key=lambda i: requests[i][1], reverse=True):
+            pid, size = requests[i]
+            results[i] = allocate_offset(pid, size)
+        return results
 
     def release(self, pid):
         """
         Libera la memoria asignada a un proceso
         
+        El bloque se obtiene del índice de PIDs, por lo que el costo es sólo
+        el de subir por el árbol combinando buddies: O(log N). Con trim_tail
+        también se liberan los bloques de la cola del proceso.
+        
         Args:
             pid (int): ID del proceso a liberar
             
@@ -107,52 +342,411 @@ class BuddySystem(MemoryAllocationStrategy):
         if self.root is None:
             return False  # No hay memoria inicializada
         
-        if not self.__release_helper(self.root, pid):
+        node = self.allocated_blocks.pop(pid, None)
+        if node is None:
             return False  # No se encontró el proceso
-        
+
+        self.releases += 1
+        self.__release_block(node)
+        if self.tail_blocks:
+            for block in self.tail_blocks.pop(pid, ()):
+                self.__release_block(block)
         return True  # Liberación exitosa
 
-    def __allocated_helper(self, node: Node, pid, size):
+    def __release_block(self, node: Node):
+        """Marca libre un bloque asignado y lo combina según la política"""
+        order = self.__size_orders[node.size]
+        self.used_memory -= node.size
+        self.requested_memory -= node.requested_size
+        self.live_blocks -= 1
+        self.allocated_per_order[order] -= 1
+        self.requested_per_order[order] -= node.requested_size
+
+        node.is_allocated = False
+        node.pid = -1
+        node.requested_size = 0
+        if self.listeners:
+            self.__emit(EVENT_RELEASE, node)
+        if self.coalescing == COALESCE_EAGER:
+            self.__merge_buddies(node)  # Intenta combinar buddies libres
+        else:
+            self.__defer_merge(node)
+
+    def coalesce(self):
+        """
+        Combina todos los pares de buddies libres pendientes, de abajo hacia arriba
+        
+        Returns:
+            int: Cantidad de combinaciones realizadas
+        """
+        merged = 0
+        for order in range(self.MAX_ORDER):
+            free_list = self.free_lists[order]
+            size = self.order_sizes[order]
+            for offset in list(free_list):
+                node = free_list.get(offset)
+                if node is None:
+                    continue  # Ya se combinó con su buddy en esta pasada
+                buddy = free_list.get(offset ^ size)
+                if buddy is None:
+                    continue
+                self.__remove_free(node)
+                self.__remove_free(buddy)
+                parent = self.__join(node)
+                self.__push_free(parent)  # Se revisa al procesar el orden siguiente
+                merged += 1
+
+        self.pending_merges = 0
+        self.coalesce_passes += 1
+        return merged
+
+    def get_coalescing_stats(self):
+        """
+        Retorna los contadores de división y combinación de la política actual
+        
+        Returns:
+            dict: Política, divisiones, combinaciones, combinaciones diferidas
+                y pasadas de combinación
+        """
+        return {
+            "policy": self.coalescing,
+            "splits": self.splits,
+            "merges": self.merges,
+            "deferred_merges": self.deferred_merges,
+            "coalesce_passes": self.coalesce_passes,
+        }
+
+    def get_metrics(self):
         """
-        Función helper recursiva para asignar memoria
+        Retorna una instantánea de la telemetría del asignador
+        
+        Todos los valores provienen de contadores incrementales, así que
+        el costo no depende del tamaño del árbol.
+        
+        Returns:
+            dict: Contadores acumulados, estado de la memoria e histogramas por
+                tamaño de bloque:
+                - free_blocks_per_order: bloques libres (fragmentación externa)
+                - allocated_blocks_per_order: bloques asignados
+                - requested_bytes_per_order: bytes solicitados en esos bloques
+                  (fragmentación interna = bloques * tamaño - solicitados)
+        """
+        largest_order = self.free_bitmap.bit_length() - 1
+        return {
+            "allocations": self.allocations,
+            "releases": self.releases,
+            "failed_allocations": self.failed_allocations,
+            "fragmentation_failures": self.fragmentation_failures,
+            "splits": self.splits,
+            "merges": self.merges,
+            "deferred_merges": self.deferred_merges,
+            "coalesce_passes": self.coalesce_passes,
+            "used_memory": self.used_memory,
+            "requested_memory": self.requested_memory,
+            "free_memory": self.MAX_SIZE - self.used_memory,
+            "internal_fragmentation": self.used_memory - self.requested_memory,
+            "live_blocks": self.live_blocks,
+            "largest_free_order": largest_order,
+            "largest_free_block": self.order_sizes[largest_order] if largest_order >= 0 else 0,
+            "free_blocks_per_order": {size: free // size for size, free
+                                      in zip(self.order_sizes, self.free_memory_per_order)},
+            "allocated_blocks_per_order": dict(zip(self.order_sizes, self.allocated_per_order)),
+            "requested_bytes_per_order": dict(zip(self.order_sizes, self.requested_per_order)),
+        }
+
+    def set_timing_hook(self, hook):
+        """
+        Instala (o quita con None) una función que recibe la duración de cada operación
+        
+        Las versiones cronometradas de allocate_offset y release se instalan como
+        atributos de la instancia, así que sin hook no hay costo adicional.
+        
+        Args:
+            hook (callable): Función hook(operation, elapsed_ns) con operation
+                "allocate" o "release", o None para desactivar
+        """
+        self.__dict__.pop("allocate_offset", None)
+        self.__dict__.pop("release", None)
+        self.timing_hook = hook
+        if hook is None:
+            return
+
+        clock = time.perf_counter_ns
+        allocate_offset = self.allocate_offset
+        release = self.release
+
+        def timed_allocate_offset(pid, size):
+            start = clock()
+            result = allocate_offset(pid, size)
+            hook("allocate", clock() - start)
+            return result
+
+        def timed_release(pid):
+            start = clock()
+            result = release(pid)
+            hook("release", clock() - start)
+            return result
+
+        self.allocate_offset = timed_allocate_offset
+        self.release = timed_release
+
+    def load_blocks(self, blocks):
+        """
+        Reemplaza el estado del árbol por un conjunto de bloques asignados
+        
+        El árbol se construye en una sola pasada de arriba hacia abajo: sólo se
+        dividen los nodos que contienen algún bloque, así que el costo es
+        O(bloques * profundidad) sin pasar por allocate. Los buddies libres
+        quedan combinados. No notifica eventos a los observadores.
+        
+        Args:
+            blocks (iterable): Tuplas (offset, pid, requested_size); el tamaño del
+                bloque es el del orden que cubre requested_size
+                
+        Raises:
+            ValueError: Si un bloque no está alineado a su tamaño, se solapa
+                con otro o un PID se repite
+        """
+        entries = []
+        for offset, pid, requested_size in blocks:
+            size = self.order_sizes[self.order_for_size(requested_size)]
+            if offset < 0 or offset % size or offset + size > self.MAX_SIZE:
+                raise ValueError(f"Bloque inválido en la dirección {offset} (tamaño {size})")
+            entries.append((offset, size, pid, requested_size))
+        entries.sort()
+
+        self.free_lists = [{} for _ in range(self.MAX_ORDER + 1)]
+        self.free_bitmap = 0
+        self.free_memory_per_order = [0] * (self.MAX_ORDER + 1)
+        self.allocated_per_order = [0] * (self.MAX_ORDER + 1)
+        self.requested_per_order = [0] * (self.MAX_ORDER + 1)
+        self.used_memory = 0
+        self.requested_memory = 0
+        self.live_blocks = 0
+        self.pending_merges = 0
+        self.allocated_blocks = {}
+        self.tail_blocks = {}
+        self.__create_roots()
+
+        # Pila de nodos pendientes en orden de dirección; i es el siguiente bloque
+        i = 0
+        stack = list(reversed(self.roots))
+        while stack:
+            node = stack.pop()
+            end = node.offset + node.size
+            if i == len(entries) or entries[i][0] >= end:
+                self.__push_free(node)  # Ningún bloque dentro: queda libre completo
+                continue
+
+            offset, size, pid, requested_size = entries[i]
+            if offset < node.offset:
+                raise ValueError(f"El bloque en la dirección {offset} se solapa con otro")
+            if offset == node.offset and size == node.size:
+                if pid in self.allocated_blocks:
+                    raise ValueError(f"PID duplicado: {pid}")
+                node.is_allocated = True
+                node.pid = pid
+                node.requested_size = requested_size
+                self.allocated_blocks[pid] = node
+                order = self.__size_orders[size]
+                self.used_memory += size
+                self.requested_memory += requested_size
+                self.live_blocks += 1
+                self.allocated_per_order[order] += 1
+                self.requested_per_order[order] += requested_size
+                i += 1
+                continue
+            if size > node.size:
+                raise ValueError(f"El bloque en la dirección {offset} se solapa con otro")
+
+            half = node.size // 2
+            node.is_split = True
+            node.left = Node(half, node, offset=node.offset)
+            node.right = Node(half, node, offset=node.offset + half)
+            stack.append(node.right)
+            stack.append(node.left)
+
+    def add_listener(self, listener):
+        """
+        Registra un observador de los cambios del árbol
+        
+        Args:
+            listener (callable): Función listener(event, node) con event uno de
+                EVENT_SPLIT, EVENT_MERGE, EVENT_ALLOCATE o EVENT_RELEASE
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Quita un observador registrado con add_listener"""
+        self.listeners.remove(listener)
+
+    def __emit(self, event, node):
+        """Notifica un evento a todos los observadores"""
+        for listener in self.listeners:
+            listener(event, node)
+
+    def release_at(self, offset):
+        """
+        Libera el bloque que comienza en una dirección de memoria
+        
+        Args:
+            offset (int): Dirección de inicio del bloque (la retornada por allocate_offset)
+            
+        Returns:
+            bool: True si la liberación fue exitosa, False si no hay un bloque
+                asignado que comience en esa dirección
+        """
+        node = self.__find_leaf(offset)
+        if node is None or not node.is_allocated or node.offset != offset:
+            return False
+        if self.allocated_blocks.get(node.pid) is not node:
+            return False  # Bloque de la cola de otro: no es una dirección retornada
+        return self.release(node.pid)
+
+    def lookup(self, pid):
+        """
+        Busca el bloque asignado a un proceso en O(1)
         
         Args:
-            node (Node): Nodo actual en la recursión
             pid (int): ID del proceso
-            size (int): Tamaño de memoria solicitado
             
         Returns:
-            bool: True si la asignación fue exitosa, False en caso contrario
+            Optional[Node]: Nodo asignado al proceso o None si no existe
+        """
+        return self.allocated_blocks.get(pid)
+
+    def blocks_of(self, pid):
         """
-        if node.is_allocated:
-            return False  # El nodo ya está asignado, no se puede usar
+        Retorna todos los bloques asignados a un proceso
         
-        if node.is_split:
-            # Si el nodo está dividido, busca en sus hijos
-            return (self.__allocated_helper(node.left, pid, size) or
-                    self.__allocated_helper(node.right, pid, size))
-                    
-        # Si el nodo es lo suficientemente grande para dividir y cumplir con el mínimo
-        if node.size // 2 >= self.MIN_SIZE and node.size // 2 >= size:
-            if self.__split_node(node):
-                # Después de dividir, intenta asignar en los hijos
-                return (self.__allocated_helper(node.left, pid, size) 
-                        or self.__allocated_helper(node.right, pid, size))
-            return False
-        # Si el tamaño del nodo es adecuado para la asignación
-        elif node.size >= size:
-            node.is_allocated = True
-            node.pid = pid
-            return True  # Asignación exitosa
+        Sin trim_tail es sólo el de lookup; con trim_tail le siguen los de la
+        cola, contiguos y en orden de dirección.
         
-        return False  # No se pudo asignar
+        Args:
+            pid (int): ID del proceso
+            
+        Returns:
+            list: Nodos del proceso (vacía si no existe)
+        """
+        node = self.allocated_blocks.get(pid)
+        if node is None:
+            return []
+        return [node, *self.tail_blocks.get(pid, ())]
+
+    def owner_of(self, address):
+        """
+        Retorna el PID dueño de una dirección de memoria
+        
+        Desciende desde la raíz eligiendo la mitad que contiene la dirección,
+        por lo que el costo es O(log N).
+        
+        Args:
+            address (int): Dirección dentro del rango [0, MAX_SIZE)
+            
+        Returns:
+            int: PID del proceso dueño o -1 si la dirección está libre o fuera de rango
+        """
+        node = self.__find_leaf(address)
+        if node is None or not node.is_allocated:
+            return -1
+        return node.pid
+
+    def buddy_offset(self, offset, size):
+        """
+        Calcula la dirección del buddy de un bloque
+        
+        Todo bloque está alineado a su tamaño (potencia de 2), así que su buddy
+        se obtiene invirtiendo el bit correspondiente al tamaño: offset ^ size.
+        
+        Args:
+            offset (int): Dirección de inicio del bloque
+            size (int): Tamaño del bloque
+            
+        Returns:
+            int: Dirección de inicio del buddy
+        """
+        return offset ^ size
+
+    def __find_leaf(self, address):
+        """
+        Desciende desde la raíz que cubre la dirección hasta el bloque no dividido que contiene la dirección
+        
+        Args:
+            address (int): Dirección de memoria
+            
+        Returns:
+            Optional[Node]: Bloque que contiene la dirección o None si está fuera de rango
+        """
+        if address < 0 or address >= self.MAX_SIZE:
+            return None
+
+        node = self.roots[bisect_right(self.root_offsets, address) - 1]
+        while node.is_split:
+            node = node.left if address < node.right.offset else node.right
+        return node
+
+    def order_for_size(self, size):
+        """
+        Calcula el orden mínimo cuyo bloque cubre el tamaño solicitado
+        
+        Args:
+            size (int): Tamaño de memoria solicitado (<= MAX_SIZE)
+            
+        Returns:
+            int: Orden del bloque (0 = bloque mínimo)
+        """
+        return bisect_left(self.order_sizes, size)
+
+    def __find_free_order(self, order):
+        """
+        Busca en el bitmap el orden no vacío más pequeño que sea >= order
+        
+        Args:
+            order (int): Orden mínimo aceptable
+            
+        Returns:
+            int: Orden encontrado o -1 si no hay bloques libres suficientes
+        """
+        candidates = self.free_bitmap >> order
+        if not candidates:
+            return -1
+        # Bit menos significativo encendido → orden libre más pequeño
+        return order + (candidates & -candidates).bit_length() - 1
+
+    def __push_free(self, node: Node):
+        """Agrega un bloque libre a la lista de su orden"""
+        order = self.__size_orders[node.size]
+        self.free_lists[order][node.offset] = node
+        self.free_bitmap |= 1 << order
+        self.free_memory_per_order[order] += node.size
+
+    def __pop_free(self, order):
+        """Extrae un bloque libre de la lista del orden indicado (LIFO)"""
+        free_list = self.free_lists[order]
+        _, node = free_list.popitem()
+        if not free_list:
+            self.free_bitmap &= ~(1 << order)
+        self.free_memory_per_order[order] -= node.size
+        return node
+
+    def __remove_free(self, node: Node):
+        """Quita un bloque específico de la lista libre de su orden"""
+        order = self.__size_orders[node.size]
+        free_list = self.free_lists[order]
+        del free_list[node.offset]
+        if not free_list:
+            self.free_bitmap &= ~(1 << order)
+        self.free_memory_per_order[order] -= node.size
     
     def __split_node(self, node: Node):
         """
         Divide un nodo de memoria en dos buddies
         
+        El buddy derecho se agrega a la lista libre de su orden; el izquierdo
+        queda fuera de las listas para que el llamador lo siga usando.
+        
         Args:
-            node (Node): Nodo a dividir
+            node (Node): Nodo a dividir (ya retirado de las listas libres)
             
         Returns:
             bool: True si la división fue exitosa, False en caso contrario
@@ -164,59 +758,75 @@ class BuddySystem(MemoryAllocationStrategy):
         
         node.is_split = True  # Marca el nodo como dividido
         # Crea los dos hijos (buddies) con la mitad del tamaño
-        node.left = Node(node.size // 2, node)
-        node.right = Node(node.size // 2, node)
+        half = node.size // 2
+        node.left = Node(half, node, offset=node.offset)
+        node.right = Node(half, node, offset=node.offset + half)
+        self.__push_free(node.right)
+        self.splits += 1
+        if self.listeners:
+            self.__emit(EVENT_SPLIT, node)
 
         return True  # División exitosa
 
-    def __release_helper(self, node: Node, pid):
+    def __merge_buddies(self, node: Node):
         """
-        Función helper recursiva para liberar memoria
+        Combina buddies si ambos están libres (iterativamente hacia arriba)
+        
+        El buddy se localiza por dirección (buddy_offset) en la lista libre del
+        mismo orden: si está ahí, está libre y sin dividir. El bloque resultante
+        de la última combinación se agrega a la lista libre de su orden.
         
         Args:
-            node (Node): Nodo actual en la recursión
-            pid (int): ID del proceso a liberar
+            node (Node): Nodo recién liberado desde donde comenzar la combinación
+        """
+        order = self.__size_orders[node.size]
+        while node.parent is not None:  # Las raíces no tienen buddy
+            buddy = self.free_lists[order].get(self.buddy_offset(node.offset, node.size))
+            if buddy is None:
+                break  # El buddy está ocupado o dividido, no se puede combinar
+
+            # Ambos buddies están libres → podemos mergear
+            self.__remove_free(buddy)
+            node = self.__join(node)
+            order += 1
+
+        self.__push_free(node)
+
+    def __join(self, node: Node):
+        """
+        Elimina un par de buddies libres y deja a su padre como bloque libre
+        
+        Args:
+            node (Node): Cualquiera de los dos buddies (ya retirados de las listas)
             
         Returns:
-            bool: True si se encontró y liberó el proceso, False en caso contrario
+            Node: Nodo padre, ahora libre y sin dividir
         """
-        if node.pid == pid:
-            # Encontró el proceso, libera el nodo
-            node.is_allocated = False
-            node.pid = -1
-            self.__merge_buddies(node.parent)  # Intenta combinar buddies libres
-            return True  # Liberación exitosa
-        elif node.is_split:
-            # Si está dividido, busca en los hijos
-            return (self.__release_helper(node.left, pid) or
-                    self.__release_helper(node.right, pid))
-        
-        return False  # No se encontró el proceso
+        parent = node.parent
+        parent.is_split = False
+        parent.left = None
+        parent.right = None
+        self.merges += 1
+        if self.listeners:
+            self.__emit(EVENT_MERGE, parent)
+        return parent
 
-    def __merge_buddies(self, parent: Node):
+    def __defer_merge(self, node: Node):
         """
-        Combina buddies si ambos están libres (recursivamente hacia arriba)
+        Agrega a la lista libre un bloque recién liberado sin combinarlo
         
         Args:
-            node (Node): Nodo desde donde comenzar la combinación
+            node (Node): Nodo recién liberado
         """
-        # Caso base: no hay padre o el nodo actual está allocated
-        if parent is None:
-            return
-        
-        if (parent.left is not None and
-            not parent.left.is_allocated and
-            not parent.left.is_split and
-            parent.right is not None and
-            not parent.right.is_allocated and
-            not parent.right.is_split):
+        free_list = self.free_lists[self.__size_orders[node.size]]
+        if node.parent is not None and self.buddy_offset(node.offset, node.size) in free_list:
+            self.deferred_merges += 1
+            self.pending_merges += 1
+        self.__push_free(node)
 
-            # Ambos buddies están libres → podemos mergear
-            parent.is_split = False
-            parent.left = None
-            parent.right = None
-            
-            self.__merge_buddies(parent.parent)
+        if (self.coalescing == COALESCE_THRESHOLD and
+                self.pending_merges >= self.coalesce_threshold):
+            self.coalesce()
 
     def get_used_memory(self):
         """
@@ -225,7 +835,7 @@ class BuddySystem(MemoryAllocationStrategy):
         Returns:
             int: Memoria utilizada en unidades de tamaño
         """
-        return self.__calculate_used_memory(self.root)
+        return self.used_memory
         
     def get_free_memory(self):
         """
@@ -234,7 +844,7 @@ class BuddySystem(MemoryAllocationStrategy):
         Returns:
             int: Memoria libre en unidades de tamaño
         """
-        return self.MAX_SIZE - self.__calculate_used_memory(self.root)
+        return self.MAX_SIZE - self.used_memory
         
     def get_memory_usage(self):
         """
@@ -243,36 +853,66 @@ class BuddySystem(MemoryAllocationStrategy):
         Returns:
             float: Porcentaje de uso (0.0 a 100.0)
         """
-        return (self.__calculate_used_memory(self.root) / self.MAX_SIZE) * 100
+        return (self.used_memory / self.MAX_SIZE) * 100
 
-    def __calculate_used_memory(self, node: Node):
+    def get_requested_memory(self):
         """
-        Método helper recursivo que calcula la memoria utilizada recorriendo el árbol.
-        Utiliza recorrido en post-orden (hijos primero, luego raíz).
+        Retorna la memoria solicitada por los procesos (antes de redondear).
         
-        Args:
-            node (Node): Nodo actual del árbol a evaluar
-            
         Returns:
-            int: Memoria utilizada en el subárbol a partir de este nodo
+            int: Memoria solicitada en unidades de tamaño
         """
-        if node is None:
-            return 0  # Caso base: nodo nulo, no contribuye a memoria usada
-        
-        # Primero procesamos los hijos recursivamente
-        if node.is_allocated:
-            # Nodo asignado a un proceso → contribuye con todo su tamaño
-            return node.size
-        elif node.is_split:
-            # Nodo dividido → la memoria usada es la suma de sus hijos
-            return (self.__calculate_used_memory(node.left) + 
-                    self.__calculate_used_memory(node.right))
-        return 0  # Nodo libre → no contribuye a memoria usada
+        return self.requested_memory
+
+    def get_internal_fragmentation(self):
+        """
+        Retorna la memoria desperdiciada por redondear a potencias de 2.
+        
+        Returns:
+            int: Diferencia entre memoria asignada y memoria solicitada
+        """
+        return self.used_memory - self.requested_memory
+
+    def get_free_memory_per_order(self):
+        """
+        Retorna los bytes libres de cada orden de bloque.
+        
+        Returns:
+            dict: Tamaño de bloque → bytes libres en bloques de ese tamaño
+        """
+        return dict(zip(self.order_sizes, self.free_memory_per_order))
+
+    def get_live_blocks(self):
+        """
+        Retorna la cantidad de bloques asignados actualmente.
+        
+        Returns:
+            int: Número de bloques vivos
+        """
+        return self.live_blocks
+
+    def get_max_block_size(self):
+        """Retorna el tamaño de la raíz más grande: ninguna solicitud mayor puede caber"""
+        return self.order_sizes[-1]
+
+    def get_largest_free_block(self):
+        """
+        Retorna el tamaño del bloque libre más grande (fragmentación externa).
+        Con combinación diferida no cuenta los buddies que aún no se combinan.
+        
+        Returns:
+            int: Tamaño del mayor bloque libre o 0 si no hay memoria libre
+        """
+        if not self.free_bitmap:
+            return 0
+        return self.order_sizes[self.free_bitmap.bit_length() - 1]
 
     def show(self, node = None, level=0):
         """Muestra el árbol de memoria (para debug)."""
         if node is None:
-            node = self.root
+            for root in self.roots:
+                self.show(root, level)
+            return
         
         indent = "    " * level
         status = f"PID={node.pid}" if node.is_allocated else "FREE"
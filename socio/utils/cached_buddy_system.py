@@ -0,0 +1,343 @@
+"""
+* Objetivo:
+*   Caché por hilo delante del Buddy System para bloques pequeños
+*
+* Descripción:
+*   Cada hilo mantiene "magazines" (pilas) de bloques ya divididos de los
+*   órdenes más pequeños. Las asignaciones y liberaciones de esos órdenes se
+*   atienden desde el magazine en O(1); sólo cuando un magazine se vacía o
+*   supera su capacidad se piden o devuelven bloques al árbol buddy en lote,
+*   evitando cascadas de división y combinación que se deshacen enseguida.
+*   Los magazines de hilos que terminaron se devuelven al registrar uno nuevo
+*   o con flush_all
+*
+"""
+
+import threading
+from itertools import count
+from strategy.system import MemoryAllocationStrategy
+
+
+class Magazine:
+    __slots__ = ("stacks", "lock", "owner")
+
+    def __init__(self, orders):
+        """
+        Inicializa los magazines vacíos de un hilo
+
+        Args:
+            orders (int): Cantidad de órdenes con caché
+        """
+        self.stacks = [[] for _ in range(orders)]  # Por orden, pila de (offset, pid interno)
+        # El dueño lo toma en cada operación; flush_all lo toma desde otros hilos
+        self.lock = threading.Lock()
+        self.owner = threading.current_thread()
+
+
+class CachedBuddySystem(MemoryAllocationStrategy):
+    def __init__(self, system, cached_orders=2, magazine_size=32):
+        """
+        Inicializa la caché sobre un sistema buddy
+
+        Args:
+            system (MemoryAllocationStrategy): Sistema buddy de respaldo (debe
+                tener order_for_size y order_sizes; si se usa desde varios
+                hilos debe ser seguro para hilos, p. ej. ConcurrentBuddySystem)
+            cached_orders (int, optional): Cantidad de órdenes pequeños con caché.
+                Defaults to 2.
+            magazine_size (int, optional): Capacidad de cada magazine (marca alta).
+                Al vaciarse se rellena con la mitad y al superarla se devuelve
+                hasta la mitad. Defaults to 32.
+        """
+        self.system = system
+        self.MAX_SIZE = system.MAX_SIZE
+        self.MIN_SIZE = system.MIN_SIZE
+        self.cached_orders = cached_orders
+        self.magazine_size = magazine_size
+        self.batch_size = max(magazine_size // 2, 1)
+
+        # Magazines registrados: id(Magazine) → Magazine. Los identificadores de
+        # hilo se reutilizan, así que no sirven de clave
+        self.magazines = {}
+        self.__thread_state = threading.local()
+
+        # Los bloques de la caché se asignan en el sistema de respaldo con PIDs
+        # internos negativos (-1 está reservado para "libre")
+        self.__cache_pids = count(-2, -1)
+
+        self.lock = threading.Lock()  # Protege el índice y los contadores
+        # Índice PID → (offset, orden, pid interno o None si no viene de la caché, tamaño)
+        self.allocated_blocks = {}
+        self.block_offsets = {}  # offset → PID
+        self.cached_bytes = 0  # Bytes en magazines (asignados atrás, libres al frente)
+        self.requested_memory = 0
+
+        # Contadores de la caché
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.flushes = 0
+
+    def __magazine(self) -> Magazine:
+        """
+        Retorna los magazines del hilo actual, creándolos si no existen; al
+        crearlos devuelve los de hilos que ya terminaron
+        """
+        magazine = getattr(self.__thread_state, "magazine", None)
+        if magazine is None:
+            magazine = Magazine(self.cached_orders)
+            self.__thread_state.magazine = magazine
+            with self.lock:
+                self.magazines[id(magazine)] = magazine
+                orphans = self.__take_orphans()
+            for orphan in orphans:
+                self.__drain(orphan)
+        return magazine
+
+    def __take_orphans(self):
+        """Quita del registro los magazines de hilos terminados (con self.lock tomado)"""
+        orphans = [magazine for magazine in self.magazines.values()
+                   if not magazine.owner.is_alive()]
+        for orphan in orphans:
+            del self.magazines[id(orphan)]
+        return orphans
+
+    def __pop(self, magazine, order):
+        """
+        Saca un bloque del magazine, rellenándolo si está vacío (con magazine.lock tomado)
+
+        Returns:
+            tuple: (offset, pid interno, acierto) o None si no se pudo rellenar
+        """
+        stack = magazine.stacks[order]
+        hit = bool(stack)
+        if not hit:
+            self.__refill(order, stack)
+            if not stack:
+                return None
+        offset, cache_pid = stack.pop()
+        return offset, cache_pid, hit
+
+    def allocate(self, pid, size):
+        """
+        Asigna memoria a un proceso
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            bool: True si la asignación fue exitosa, False en caso contrario
+        """
+        return self.allocate_offset(pid, size) >= 0
+
+    def allocate_offset(self, pid, size):
+        """
+        Asigna memoria a un proceso, desde la caché si el orden es pequeño
+
+        Si el sistema de respaldo no puede atender la solicitud (o rellenar el
+        magazine) se devuelven todos los magazines y se reintenta una vez:
+        los bloques en caché pueden impedir combinar buddies.
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            int: Dirección de inicio del bloque asignado o -1 si no se pudo asignar
+        """
+        if size > self.MAX_SIZE:
+            return -1
+
+        with self.lock:
+            if pid in self.allocated_blocks:
+                return -1  # El PID ya tiene un bloque asignado
+            self.allocated_blocks[pid] = None  # Reserva el PID
+
+        order = self.system.order_for_size(size)
+        if order < self.cached_orders:
+            magazine = self.__magazine()
+            with magazine.lock:
+                entry = self.__pop(magazine, order)
+            # flush_all toma los locks de todos los magazines: no se llama con uno tomado
+            if entry is None and self.flush_all():
+                with magazine.lock:
+                    entry = self.__pop(magazine, order)
+            if entry is not None:
+                offset, cache_pid, hit = entry
+                with self.lock:
+                    if hit:
+                        self.hits += 1
+                    else:
+                        self.misses += 1
+                    self.allocated_blocks[pid] = (offset, order, cache_pid, size)
+                    self.block_offsets[offset] = pid
+                    self.cached_bytes -= self.system.order_sizes[order]
+                    self.requested_memory += size
+                return offset
+            offset = -1
+        else:
+            offset = self.system.allocate_offset(pid, size)
+            if offset < 0 and self.flush_all():
+                offset = self.system.allocate_offset(pid, size)
+
+        with self.lock:
+            if offset < 0:
+                del self.allocated_blocks[pid]
+            else:
+                self.allocated_blocks[pid] = (offset, order, None, size)
+                self.block_offsets[offset] = pid
+                self.requested_memory += size
+        return offset
+
+    def release(self, pid):
+        """
+        Libera la memoria de un proceso; los bloques pequeños vuelven al magazine
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        with self.lock:
+            block = self.allocated_blocks.get(pid)
+            if block is None:
+                return False  # No se encontró el proceso (o se está asignando)
+            del self.allocated_blocks[pid]
+            offset, order, cache_pid, size = block
+            del self.block_offsets[offset]
+            self.requested_memory -= size
+            if cache_pid is not None:
+                self.cached_bytes += self.system.order_sizes[order]
+
+        if cache_pid is None:
+            self.system.release(pid)
+        else:
+            magazine = self.__magazine()
+            with magazine.lock:
+                stack = magazine.stacks[order]
+                stack.append((offset, cache_pid))
+                if len(stack) > self.magazine_size:
+                    self.__flush(order, stack, self.batch_size)
+        return True  # Liberación exitosa
+
+    def release_at(self, offset):
+        """
+        Libera el bloque que comienza en una dirección de memoria
+
+        Args:
+            offset (int): Dirección de inicio del bloque
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        pid = self.block_offsets.get(offset)
+        if pid is None:
+            return False
+        return self.release(pid)
+
+    def __refill(self, order, stack):
+        """Pide al sistema de respaldo un lote de bloques del orden indicado"""
+        size = self.system.order_sizes[order]
+        cache_pids = [next(self.__cache_pids) for _ in range(self.batch_size)]
+        offsets = self.system.allocate_many([(cache_pid, size) for cache_pid in cache_pids])
+        refilled = [(offset, cache_pid)
+                    for offset, cache_pid in zip(offsets, cache_pids) if offset >= 0]
+        # Se apilan en orden inverso para entregar primero las direcciones bajas
+        stack.extend(reversed(refilled))
+        with self.lock:
+            self.refills += 1
+            self.cached_bytes += size * len(refilled)
+
+    def __flush(self, order, stack, keep):
+        """Devuelve al sistema de respaldo los bloques del magazine que exceden keep"""
+        excess = stack[keep:]
+        del stack[keep:]
+        self.system.release_many([cache_pid for _, cache_pid in excess])
+        with self.lock:
+            self.flushes += 1
+            self.cached_bytes -= self.system.order_sizes[order] * len(excess)
+
+    def __drain(self, magazine):
+        """Devuelve todos los bloques de un magazine; retorna True si había alguno"""
+        flushed = False
+        with magazine.lock:
+            for order, stack in enumerate(magazine.stacks):
+                if stack:
+                    self.__flush(order, stack, 0)
+                    flushed = True
+        return flushed
+
+    def flush(self):
+        """
+        Devuelve al sistema de respaldo todos los bloques en magazines del hilo actual
+
+        Returns:
+            bool: True si se devolvió algún bloque
+        """
+        return self.__drain(self.__magazine())
+
+    def flush_all(self):
+        """
+        Devuelve al sistema de respaldo los bloques de todos los magazines y
+        olvida los de hilos que ya terminaron. Puede llamarse mientras otros
+        hilos asignan o liberan: cada magazine se vacía bajo su lock.
+
+        Returns:
+            bool: True si se devolvió algún bloque
+        """
+        with self.lock:
+            magazines = list(self.magazines.values())
+            self.__take_orphans()
+        flushed = False
+        for magazine in magazines:
+            flushed = self.__drain(magazine) or flushed
+        return flushed
+
+    def get_cache_stats(self):
+        """
+        Retorna los contadores de la caché
+
+        Returns:
+            dict: hits, misses, refills, flushes, bytes en caché y tasa de aciertos
+        """
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refills": self.refills,
+                "flushes": self.flushes,
+                "cached_bytes": self.cached_bytes,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def get_requested_memory(self):
+        """Retorna la memoria solicitada por los procesos (antes de redondear)"""
+        return self.requested_memory
+
+    def get_max_block_size(self):
+        """Retorna la solicitud más grande que puede atender el sistema de respaldo"""
+        return self.system.get_max_block_size()
+
+    def get_largest_free_block(self):
+        """Retorna el bloque libre más grande del sistema de respaldo (sin magazines)"""
+        return self.system.get_largest_free_block()
+
+    def get_used_memory(self):
+        """Retorna la memoria utilizada por procesos (sin contar los magazines)"""
+        return self.system.get_used_memory() - self.cached_bytes
+
+    def get_free_memory(self):
+        """Retorna la memoria disponible para nuevos procesos"""
+        return self.MAX_SIZE - self.get_used_memory()
+
+    def get_memory_usage(self):
+        """Retorna el porcentaje de memoria utilizada (0.0 a 100.0)"""
+        return (self.get_used_memory() / self.MAX_SIZE) * 100
+
+    def show(self):
+        """Muestra el estado del sistema de respaldo y de la caché (para debug)."""
+        self.system.show()
+        print(self.get_cache_stats())
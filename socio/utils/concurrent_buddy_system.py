@@ -0,0 +1,370 @@
+"""
+* Objetivo:
+*   Buddy System seguro para usarse desde varios hilos
+*
+* Descripción:
+*   Los niveles superiores del árbol se fijan como divididos y la memoria se
+*   reparte en 2^k subárboles, cada uno un BuddySystem con su propio lock.
+*   Las asignaciones que caben en un subárbol sólo bloquean ese subárbol, así
+*   que hilos que trabajan en mitades distintas de la memoria no se serializan.
+*   Las asignaciones más grandes que un subárbol reclaman un grupo alineado de
+*   subárboles completamente libres, igual que lo haría un único árbol buddy
+*
+"""
+
+import threading
+from bisect import bisect_left
+from itertools import count
+from strategy.system import MemoryAllocationStrategy
+from utils.buddy_system import BuddySystem
+
+
+class ConcurrentBuddySystem(MemoryAllocationStrategy):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4, subtrees=None):
+        """
+        Inicializa el sistema Buddy concurrente
+
+        Args:
+            MAX_SIZE (int, optional): Tamaño máximo de memoria. Defaults to 1024.
+            MIN_SIZE (int, optional): Tamaño mínimo de bloque. Defaults to 4.
+            subtrees (int, optional): Cantidad de subárboles con lock propio
+                (potencia de 2). Defaults to None (hasta 16, según MIN_SIZE).
+
+        Raises:
+            ValueError: Si MAX_SIZE o subtrees no son potencias de 2, o si los
+                subárboles resultarían menores que MIN_SIZE
+        """
+        if MAX_SIZE <= 0 or MAX_SIZE & (MAX_SIZE - 1):
+            raise ValueError("MAX_SIZE debe ser una potencia de 2")
+
+        if subtrees is None:
+            subtrees = 1
+            while subtrees < 16 and MAX_SIZE // (subtrees * 2) >= max(MIN_SIZE, 1):
+                subtrees *= 2
+        elif (subtrees <= 0 or subtrees & (subtrees - 1) or
+                MAX_SIZE // subtrees < max(MIN_SIZE, 1)):
+            raise ValueError("subtrees debe ser una potencia de 2 con subárboles >= MIN_SIZE")
+
+        self.MAX_SIZE = MAX_SIZE  # Tamaño total de memoria disponible
+        self.MIN_SIZE = MIN_SIZE  # Tamaño mínimo de bloque asignable
+        self.SUBTREE_SIZE = MAX_SIZE // subtrees  # Memoria de cada subárbol
+
+        self.subtrees = [BuddySystem(self.SUBTREE_SIZE, MIN_SIZE) for _ in range(subtrees)]
+        # Tamaños por orden del árbol completo (los de los subárboles son un prefijo)
+        self.MAX_ORDER = self.subtrees[0].MAX_ORDER + subtrees.bit_length() - 1
+        self.order_sizes = [MAX_SIZE >> (self.MAX_ORDER - order)
+                            for order in range(self.MAX_ORDER + 1)]
+        self.locks = [threading.Lock() for _ in range(subtrees)]  # Un lock por subárbol
+        self.span_lock = threading.Lock()  # Serializa asignaciones de varios subárboles
+        self.index_lock = threading.Lock()  # Protege el índice de PIDs
+
+        # Índice PID → primer subárbol del bloque (-1 mientras la asignación está en curso)
+        self.allocated_blocks = {}
+        # Asignaciones que abarcan varios subárboles: PID → (primero, cantidad, tamaño)
+        self.spans = {}
+        self.span_slack = 0  # Bytes reclamados de más por asignaciones de varios subárboles
+
+        # Cada hilo comienza a buscar en su propio subárbol "de casa"
+        self.__thread_state = threading.local()
+        self.__homes = count()
+
+    def allocate(self, pid, size):
+        """
+        Asigna memoria a un proceso
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            bool: True si la asignación fue exitosa, False en caso contrario
+        """
+        return self.allocate_offset(pid, size) >= 0
+
+    def allocate_offset(self, pid, size):
+        """
+        Asigna memoria a un proceso y retorna la dirección del bloque
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            int: Dirección de inicio del bloque asignado o -1 si no se pudo asignar
+        """
+        if size > self.MAX_SIZE:
+            return -1  # El tamaño solicitado excede la memoria total
+
+        # Reserva el PID para rechazar duplicados aun entre hilos
+        with self.index_lock:
+            if pid in self.allocated_blocks:
+                return -1
+            self.allocated_blocks[pid] = -1
+
+        if size > self.SUBTREE_SIZE:
+            offset = self.__allocate_span(pid, size)
+        else:
+            offset = self.__allocate_local(pid, size)
+
+        with self.index_lock:
+            if offset < 0:
+                del self.allocated_blocks[pid]
+            else:
+                self.allocated_blocks[pid] = offset // self.SUBTREE_SIZE
+        return offset
+
+    def release(self, pid):
+        """
+        Libera la memoria asignada a un proceso
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        with self.index_lock:
+            first = self.allocated_blocks.get(pid)
+            if first is None or first < 0:
+                return False  # No se encontró el proceso (o se está asignando)
+            del self.allocated_blocks[pid]
+            span = self.spans.pop(pid, None)
+            if span is not None:
+                self.span_slack -= span[1] * self.SUBTREE_SIZE - span[2]
+
+        if span is None:
+            with self.locks[first]:
+                self.subtrees[first].release(pid)
+        else:
+            first, amount, _ = span
+            for i in range(first, first + amount):
+                with self.locks[i]:
+                    self.subtrees[i].release(pid)
+        return True  # Liberación exitosa
+
+    def release_at(self, offset):
+        """
+        Libera el bloque que comienza en una dirección de memoria
+
+        El dueño se busca y se libera sin soltar el lock del subárbol (y, para
+        un bloque de varios subárboles, con span_lock y los locks del grupo),
+        así otro hilo no puede liberar el PID y reasignarlo en otra dirección
+        entre la búsqueda y la liberación.
+
+        Args:
+            offset (int): Dirección de inicio del bloque
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        if offset < 0 or offset >= self.MAX_SIZE:
+            return False
+
+        i, local = divmod(offset, self.SUBTREE_SIZE)
+        with self.locks[i]:
+            pid = self.__owner_at(i, local)
+            if pid is None:
+                return False
+            with self.index_lock:
+                if self.allocated_blocks.get(pid) != i:
+                    return False  # El bloque es parte de una asignación que empieza antes
+                span = self.spans.get(pid)
+                if span is None:
+                    del self.allocated_blocks[pid]
+            if span is None:
+                self.subtrees[i].release(pid)
+                return True
+
+        # Bloque de varios subárboles: span_lock y locks del grupo en orden
+        # ascendente, como __allocate_span; se vuelve a verificar el dueño
+        first, amount, size = span
+        group = range(first, first + amount)
+        with self.span_lock:
+            for j in group:
+                self.locks[j].acquire()
+            try:
+                with self.index_lock:
+                    if self.spans.get(pid) != span or self.__owner_at(i, local) != pid:
+                        return False
+                    del self.allocated_blocks[pid]
+                    del self.spans[pid]
+                    self.span_slack -= amount * self.SUBTREE_SIZE - size
+                for j in group:
+                    self.subtrees[j].release(pid)
+                return True
+            finally:
+                for j in reversed(group):
+                    self.locks[j].release()
+
+    def __owner_at(self, i, local):
+        """
+        Retorna el PID del bloque que comienza en una dirección de un subárbol
+        (con el lock del subárbol tomado), o None si ninguno comienza ahí
+        """
+        pid = self.subtrees[i].owner_of(local)
+        node = self.subtrees[i].lookup(pid)
+        if node is None or node.offset != local:
+            return None
+        return pid
+
+    def order_for_size(self, size):
+        """Calcula el orden mínimo cuyo bloque cubre el tamaño solicitado"""
+        return bisect_left(self.order_sizes, size)
+
+    def __home(self):
+        """Retorna el subárbol en el que el hilo actual comienza a buscar"""
+        home = getattr(self.__thread_state, "home", None)
+        if home is None:
+            home = next(self.__homes) % len(self.subtrees)
+            self.__thread_state.home = home
+        return home
+
+    def __allocate_local(self, pid, size):
+        """
+        Asigna un bloque que cabe en un subárbol, bloqueando sólo ese subárbol
+
+        Returns:
+            int: Dirección global del bloque o -1 si ningún subárbol tiene espacio
+        """
+        amount = len(self.subtrees)
+        home = self.__home()
+        order = self.order_for_size(size)
+        for k in range(amount):
+            i = (home + k) % amount
+            subtree = self.subtrees[i]
+            # Lectura sin lock para descartar subárboles llenos; se confirma bajo el lock
+            if not subtree.free_bitmap >> order:
+                continue
+            with self.locks[i]:
+                offset = subtree.allocate_offset(pid, size)
+            if offset >= 0:
+                return i * self.SUBTREE_SIZE + offset
+        return -1
+
+    def __allocate_span(self, pid, size):
+        """
+        Asigna un bloque mayor que un subárbol reclamando un grupo alineado de
+        subárboles completamente libres (sus raíces quedan asignadas al PID)
+
+        Returns:
+            int: Dirección global del bloque o -1 si no hay un grupo libre
+        """
+        amount = 1
+        while amount * self.SUBTREE_SIZE < size:
+            amount *= 2
+
+        with self.span_lock:
+            for first in range(0, len(self.subtrees), amount):
+                group = range(first, first + amount)
+                # Locks en orden ascendente: nunca hay ciclos de espera
+                for i in group:
+                    self.locks[i].acquire()
+                try:
+                    if all(self.subtrees[i].live_blocks == 0 for i in group):
+                        for i in group:
+                            self.subtrees[i].allocate_offset(pid, self.SUBTREE_SIZE)
+                        with self.index_lock:
+                            self.spans[pid] = (first, amount, size)
+                            self.span_slack += amount * self.SUBTREE_SIZE - size
+                        return first * self.SUBTREE_SIZE
+                finally:
+                    for i in reversed(group):
+                        self.locks[i].release()
+        return -1
+
+    def get_used_memory(self):
+        """Retorna la memoria utilizada por procesos"""
+        return sum(subtree.used_memory for subtree in self.subtrees)
+
+    def get_free_memory(self):
+        """Retorna la memoria disponible para nuevos procesos"""
+        return self.MAX_SIZE - self.get_used_memory()
+
+    def get_memory_usage(self):
+        """Retorna el porcentaje de memoria utilizada (0.0 a 100.0)"""
+        return (self.get_used_memory() / self.MAX_SIZE) * 100
+
+    def get_requested_memory(self):
+        """Retorna la memoria solicitada por los procesos (antes de redondear)"""
+        return sum(subtree.requested_memory for subtree in self.subtrees) - self.span_slack
+
+    def get_largest_free_block(self):
+        """
+        Retorna el tamaño del bloque libre más grande, incluidos los grupos
+        alineados de subárboles completamente libres (lectura sin locks)
+        """
+        largest = max(subtree.get_largest_free_block() for subtree in self.subtrees)
+        if largest < self.SUBTREE_SIZE:
+            return largest
+
+        amount = 2
+        while amount <= len(self.subtrees):
+            if not any(all(self.subtrees[i].live_blocks == 0 for i in range(first, first + amount))
+                       for first in range(0, len(self.subtrees), amount)):
+                break
+            largest = amount * self.SUBTREE_SIZE
+            amount *= 2
+        return largest
+
+    def check_invariants(self):
+        """
+        Verifica la consistencia de todos los subárboles y del índice de PIDs.
+        Toma todos los locks y supone que no hay operaciones a medio camino,
+        así que sólo debe usarse en pruebas o depuración.
+
+        Returns:
+            bool: True si el estado es consistente, False en caso contrario
+        """
+        with self.span_lock:
+            for lock in self.locks:
+                lock.acquire()
+            try:
+                with self.index_lock:
+                    return self.__check_invariants()
+            finally:
+                for lock in reversed(self.locks):
+                    lock.release()
+
+    def __check_invariants(self):
+        owners = {}
+        for i, subtree in enumerate(self.subtrees):
+            free = {}
+            allocated = {}
+            used = 0
+            for node in subtree:
+                if node.is_split:
+                    if node.left is None or node.right is None or node.is_allocated:
+                        return False
+                elif node.is_allocated:
+                    allocated[node.pid] = node
+                    used += node.size
+                else:
+                    free[node.offset] = node
+
+            listed = {}
+            for order, free_list in enumerate(subtree.free_lists):
+                if bool(free_list) != bool(subtree.free_bitmap >> order & 1):
+                    return False
+                listed.update(free_list)
+            if listed != free or allocated != subtree.allocated_blocks:
+                return False
+            if used != subtree.used_memory or len(allocated) != subtree.live_blocks:
+                return False
+
+            for pid in allocated:
+                owners.setdefault(pid, []).append(i)
+
+        for pid, first in self.allocated_blocks.items():
+            if first < 0:
+                return False  # Asignación sin terminar
+            span = self.spans.get(pid)
+            expected = [first] if span is None else list(range(first, first + span[1]))
+            if owners.pop(pid, None) != expected:
+                return False
+        return not owners
+
+    def show(self):
+        """Muestra el árbol de cada subárbol (para debug)."""
+        for i, subtree in enumerate(self.subtrees):
+            print(f"Subárbol {i} (offset {i * self.SUBTREE_SIZE}):")
+            subtree.show()
@@ -0,0 +1,283 @@
+"""
+* Objetivo:
+*   Persistir el estado de un BuddySystem con un journal binario y snapshots
+*
+* Descripción:
+*   El journal es un archivo de sólo agregado con un registro de tamaño fijo
+*   por asignación o liberación exitosa, escrito desde los eventos del
+*   asignador. El snapshot guarda el estado completo codificado por bloque
+*   mínimo (un byte por bloque: libre, inicio de un bloque de orden k o
+*   continuación) más los PID y tamaños solicitados, comprimido con zlib.
+*
+*   Para restaurar se carga el snapshot, se aplican al conjunto de bloques los
+*   registros del journal posteriores a él y el árbol se construye una sola
+*   vez con BuddySystem.load_blocks, sin repetir cada operación con allocate.
+*   Uso:
+*
+*       journal = Journal("estado.journal", system)
+*       ...                                   # operaciones sobre system
+*       journal.checkpoint("estado.snapshot")  # snapshot + posición del journal
+*       system = restore("estado.snapshot", "estado.journal")
+*
+"""
+
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from utils.buddy_system import BuddySystem, EVENT_ALLOCATE, EVENT_RELEASE
+
+JOURNAL_MAGIC = b"BSJ1"
+SNAPSHOT_MAGIC = b"BSS1"
+
+# Cabecera del journal: MAX_SIZE, MIN_SIZE
+JOURNAL_HEADER = struct.Struct("<4sqq")
+# Registro: operación, PID, dirección, tamaño solicitado
+RECORD = struct.Struct("<Bqqq")
+# Cabecera del snapshot: MAX_SIZE, MIN_SIZE, posición del journal, bloques asignados
+SNAPSHOT_HEADER = struct.Struct("<4sqqqq")
+
+OP_ALLOCATE = 1
+OP_RELEASE = 2
+
+# Códigos por bloque mínimo en el snapshot (inicio de bloque = orden + 1)
+CELL_FREE = 0
+CELL_CONTINUATION = 255
+BLOCK_START = re.compile(rb"[\x01-\xfe]")
+
+
+class Journal:
+    def __init__(self, path, system: BuddySystem, sync=False):
+        """
+        Abre (o crea) un journal y lo conecta a los eventos de un BuddySystem
+
+        Args:
+            path (str): Archivo del journal
+            system (BuddySystem): Asignador cuyas operaciones se registran
+            sync (bool, optional): Vaciar el buffer en cada registro. Defaults to False.
+
+        Raises:
+            ValueError: Si el journal existente es de otra configuración o el
+                asignador usa trim_tail
+        """
+        if system.trim_tail:
+            raise ValueError("El journal no admite asignadores con trim_tail")
+        self.path = path
+        self.system = system
+        self.sync = sync
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            read_journal_header(path, system.MAX_SIZE, system.MIN_SIZE)
+        self.file = open(path, "ab")
+        if not exists:
+            self.file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, system.MAX_SIZE, system.MIN_SIZE))
+            self.file.flush()
+
+        system.add_listener(self.record)
+
+    def record(self, event, node):
+        """Registra una asignación o liberación (firma de listener de BuddySystem)"""
+        if event == EVENT_ALLOCATE:
+            self.file.write(RECORD.pack(OP_ALLOCATE, node.pid, node.offset, node.requested_size))
+        elif event == EVENT_RELEASE:
+            self.file.write(RECORD.pack(OP_RELEASE, -1, node.offset, 0))
+        else:
+            return
+        if self.sync:
+            self.file.flush()
+
+    def tell(self):
+        """Retorna la posición actual (bytes) del final del journal"""
+        self.file.flush()
+        return self.file.tell()
+
+    def checkpoint(self, snapshot_path):
+        """
+        Guarda un snapshot del asignador que cubre el journal hasta la posición actual
+
+        Args:
+            snapshot_path (str): Archivo del snapshot
+        """
+        save_snapshot(self.system, snapshot_path, self.tell())
+
+    def close(self):
+        """Desconecta el journal del asignador y cierra el archivo"""
+        self.system.remove_listener(self.record)
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def read_journal_header(path, MAX_SIZE=None, MIN_SIZE=None):
+    """
+    Lee y valida la cabecera de un journal
+
+    Returns:
+        tuple: (MAX_SIZE, MIN_SIZE) del journal
+
+    Raises:
+        ValueError: Si el archivo no es un journal o su configuración no coincide
+    """
+    with open(path, "rb") as source:
+        header = source.read(JOURNAL_HEADER.size)
+    if len(header) < JOURNAL_HEADER.size:
+        raise ValueError(f"Journal incompleto: {path}")
+    magic, max_size, min_size = JOURNAL_HEADER.unpack(header)
+    if magic != JOURNAL_MAGIC:
+        raise ValueError(f"No es un journal: {path}")
+    if MAX_SIZE is not None and (max_size, min_size) != (MAX_SIZE, MIN_SIZE):
+        raise ValueError(f"El journal es de {max_size}/{min_size}, no de {MAX_SIZE}/{MIN_SIZE}")
+    return max_size, min_size
+
+
+def iter_journal(path, start=0):
+    """
+    Recorre los registros de un journal
+
+    Args:
+        path (str): Archivo del journal
+        start (int, optional): Posición desde la que leer (0 = justo después de
+            la cabecera). Defaults to 0.
+
+    Yields:
+        tuple: (operación, pid, offset, requested_size). Un registro final
+            incompleto (escritura interrumpida) se ignora
+    """
+    with open(path, "rb") as source:
+        source.seek(max(start, JOURNAL_HEADER.size))
+        data = source.read()
+    usable = len(data) - len(data) % RECORD.size
+    yield from RECORD.iter_unpack(data[:usable])
+
+
+def save_snapshot(system: BuddySystem, path, journal_offset=0):
+    """
+    Guarda el estado del asignador codificado por bloque mínimo
+
+    El archivo se escribe en uno temporal y se renombra, así un snapshot
+    nunca queda a medias.
+
+    Args:
+        system (BuddySystem): Asignador a guardar
+        path (str): Archivo del snapshot
+        journal_offset (int, optional): Posición del journal que el snapshot
+            ya incluye. Defaults to 0.
+
+    Raises:
+        ValueError: Si el asignador usa trim_tail (un proceso con varios bloques)
+    """
+    if system.trim_tail:
+        raise ValueError("El snapshot no admite asignadores con trim_tail")
+    unit = system.order_sizes[0]
+    cells = bytearray(system.MAX_SIZE // unit)
+    pids = array("q")
+    requested = array("q")
+    for offset, node in sorted((node.offset, node) for node in system.allocated_blocks.values()):
+        start = offset // unit
+        count = node.size // unit
+        cells[start] = system.order_for_size(node.size) + 1
+        cells[start + 1:start + count] = bytes([CELL_CONTINUATION]) * (count - 1)
+        pids.append(node.pid)
+        requested.append(node.requested_size)
+
+    if sys.byteorder == "big":
+        pids.byteswap()
+        requested.byteswap()
+
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, system.MAX_SIZE, system.MIN_SIZE,
+                                  journal_offset, len(pids))
+    payload = zlib.compress(bytes(cells) + pids.tobytes() + requested.tobytes())
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as output:
+        output.write(header)
+        output.write(payload)
+    os.replace(temporary, path)
+
+
+def load_snapshot(path):
+    """
+    Lee un snapshot
+
+    Returns:
+        tuple: (MAX_SIZE, MIN_SIZE, journal_offset, bloques) donde bloques es un
+            dict offset → (pid, requested_size)
+
+    Raises:
+        ValueError: Si el archivo no es un snapshot válido
+    """
+    with open(path, "rb") as source:
+        data = source.read()
+    if len(data) < SNAPSHOT_HEADER.size:
+        raise ValueError(f"Snapshot incompleto: {path}")
+    magic, max_size, min_size, journal_offset, count = SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"No es un snapshot: {path}")
+
+    try:
+        payload = zlib.decompress(data[SNAPSHOT_HEADER.size:])
+    except zlib.error as error:
+        raise ValueError(f"Snapshot corrupto: {path}") from error
+    cell_count = len(payload) - 16 * count
+    cells = payload[:cell_count]
+    pids = array("q", payload[cell_count:cell_count + 8 * count])
+    requested = array("q", payload[cell_count + 8 * count:])
+    if sys.byteorder == "big":
+        pids.byteswap()
+        requested.byteswap()
+
+    unit = max_size // cell_count
+    starts = [match.start() * unit for match in BLOCK_START.finditer(cells)]
+    if len(starts) != count:
+        raise ValueError(f"Snapshot corrupto: {path}")
+    return max_size, min_size, journal_offset, dict(zip(starts, zip(pids, requested)))
+
+
+def restore(snapshot_path=None, journal_path=None, **kwargs):
+    """
+    Reconstruye un BuddySystem desde un snapshot y/o la cola de un journal
+
+    Args:
+        snapshot_path (str, optional): Snapshot de partida (None = memoria vacía)
+        journal_path (str, optional): Journal cuyos registros posteriores al
+            snapshot se aplican
+        **kwargs: Argumentos adicionales para BuddySystem (p. ej. coalescing)
+
+    Returns:
+        BuddySystem: Asignador con el estado restaurado
+
+    Raises:
+        ValueError: Si no se indica ningún archivo o sus configuraciones no coinciden
+    """
+    if snapshot_path is None and journal_path is None:
+        raise ValueError("Se necesita un snapshot, un journal o ambos")
+
+    blocks = {}
+    journal_offset = 0
+    if snapshot_path is not None:
+        max_size, min_size, journal_offset, blocks = load_snapshot(snapshot_path)
+    if journal_path is not None:
+        journal_config = read_journal_header(journal_path)
+        if snapshot_path is None:
+            max_size, min_size = journal_config
+        elif journal_config != (max_size, min_size):
+            raise ValueError("El snapshot y el journal son de configuraciones distintas")
+
+        # La cola del journal se aplica al conjunto de bloques, no al árbol
+        for op, pid, offset, requested_size in iter_journal(journal_path, journal_offset):
+            if op == OP_ALLOCATE:
+                blocks[offset] = (pid, requested_size)
+            else:
+                blocks.pop(offset, None)
+
+    system = BuddySystem(max_size, min_size, **kwargs)
+    system.load_blocks((offset, pid, requested_size)
+                       for offset, (pid, requested_size) in blocks.items())
+    return system
@@ -0,0 +1,424 @@
+"""
+* Objetivo:
+*   Administrador de varias arenas Buddy System con enrutamiento de solicitudes
+*
+* Descripción:
+*   La capacidad total (MAX_SIZE) se reparte en ranuras de arena_size bytes
+*   y cada arena es un BuddySystem independiente con su propio lock. Las
+*   solicitudes se envían a un grupo de arenas según su clase de tamaño
+*   (los bloques chicos no fragmentan las arenas de bloques grandes) o según
+*   el hilo que llama (cada hilo trabaja en sus propias arenas). Las arenas
+*   se crean cuando su grupo se agota, las solicitudes mayores que una arena
+*   reciben una arena dedicada de varias ranuras alineadas, y las arenas que
+*   quedan vacías se devuelven para que su espacio lo use cualquier grupo.
+*   Cada grupo conserva algunas arenas vacías y las dedicadas vacías se
+*   guardan para reutilizarlas con el mismo número de ranuras; éstas se
+*   devuelven sólo cuando falta espacio para crear otra arena, así una carga
+*   que alterna asignaciones grandes no reconstruye la arena cada vez
+*
+"""
+
+import threading
+from bisect import bisect_left
+from itertools import count
+from strategy.system import MemoryAllocationStrategy
+from utils.buddy_system import BuddySystem
+
+# Enrutamiento de solicitudes a grupos de arenas
+ROUTE_SIZE = "size"  # Por clase de tamaño
+ROUTE_THREAD = "thread"  # Por hilo que llama
+ROUTING_POLICIES = (ROUTE_SIZE, ROUTE_THREAD)
+
+
+class Arena:
+    __slots__ = ("system", "slot", "slots", "base", "group", "lock", "retired")
+
+    def __init__(self, slot, slots, slot_size, MIN_SIZE, group):
+        """
+        Inicializa una arena que ocupa slots ranuras consecutivas
+
+        Args:
+            slot (int): Primera ranura
+            slots (int): Cantidad de ranuras (potencia de 2)
+            slot_size (int): Tamaño de una ranura
+            MIN_SIZE (int): Tamaño mínimo de bloque
+            group: Grupo de enrutamiento al que pertenece (None = arena dedicada)
+        """
+        self.system = BuddySystem(slots * slot_size, MIN_SIZE)
+        self.slot = slot
+        self.slots = slots
+        self.base = slot * slot_size  # Dirección global del inicio de la arena
+        self.group = group
+        self.lock = threading.Lock()
+        self.retired = False  # True cuando la arena se devolvió y ya no acepta bloques
+
+
+class MultiArenaAllocator(MemoryAllocationStrategy):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4, arena_size=None, routing=ROUTE_SIZE,
+                 size_classes=None, threads=None, retain_empty=1):
+        """
+        Inicializa el administrador de arenas (sin arenas creadas)
+
+        Args:
+            MAX_SIZE (int, optional): Capacidad total de memoria. Defaults to 1024.
+            MIN_SIZE (int, optional): Tamaño mínimo de bloque. Defaults to 4.
+            arena_size (int, optional): Tamaño de cada arena (potencia de 2).
+                Defaults to None (MAX_SIZE / 16, sin bajar de MIN_SIZE).
+            routing (str, optional): ROUTE_SIZE o ROUTE_THREAD. Defaults to ROUTE_SIZE.
+            size_classes (list, optional): Límites superiores crecientes de las
+                clases de tamaño. Defaults to None (arena/64, arena/8 y arena).
+            threads (int, optional): Grupos por hilo con ROUTE_THREAD. Defaults
+                to None (uno por arena posible, hasta 16).
+            retain_empty (int, optional): Arenas vacías que cada grupo (y el
+                conjunto de arenas dedicadas) conserva en lugar de devolverlas.
+                Defaults to 1.
+
+        Raises:
+            ValueError: Si los tamaños no son potencias de 2 o la política no existe
+        """
+        if MAX_SIZE <= 0 or MAX_SIZE & (MAX_SIZE - 1):
+            raise ValueError("MAX_SIZE debe ser una potencia de 2")
+        if routing not in ROUTING_POLICIES:
+            raise ValueError(f"Política de enrutamiento no válida: {routing}")
+
+        if arena_size is None:
+            arena_size = MAX_SIZE
+            while arena_size > MAX_SIZE // 16 and arena_size // 2 >= max(MIN_SIZE, 1):
+                arena_size //= 2
+        elif (arena_size <= 0 or arena_size & (arena_size - 1) or
+                arena_size > MAX_SIZE or arena_size < MIN_SIZE):
+            raise ValueError("arena_size debe ser una potencia de 2 entre MIN_SIZE y MAX_SIZE")
+
+        self.MAX_SIZE = MAX_SIZE  # Capacidad total de memoria
+        self.MIN_SIZE = MIN_SIZE  # Tamaño mínimo de bloque asignable
+        self.ARENA_SIZE = arena_size  # Tamaño de una arena normal (una ranura)
+        self.routing = routing
+        self.retain_empty = retain_empty
+
+        self.size_classes = sorted(size_classes or
+                                   {max(arena_size // 64, MIN_SIZE), max(arena_size // 8, MIN_SIZE), arena_size})
+        self.threads = threads or min(16, MAX_SIZE // arena_size)
+
+        self.slots = [None] * (MAX_SIZE // arena_size)  # Ranura → arena que la ocupa
+        self.groups = {}  # Grupo de enrutamiento → arenas del grupo
+        self.idle_dedicated = []  # Arenas dedicadas vacías conservadas para reutilizarlas
+        self.allocated_blocks = {}  # PID → arena (None mientras la asignación está en curso)
+        self.lock = threading.Lock()  # Protege ranuras, grupos y el índice de PIDs
+
+        # Estadísticas de crecimiento
+        self.arenas_created = 0
+        self.arenas_retired = 0
+        self.arenas_reused = 0  # Asignaciones grandes atendidas por una arena dedicada conservada
+
+        # Cada hilo recibe un grupo "de casa" con ROUTE_THREAD
+        self.__thread_state = threading.local()
+        self.__homes = count()
+
+    def allocate(self, pid, size):
+        """
+        Asigna memoria a un proceso
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            bool: True si la asignación fue exitosa, False en caso contrario
+        """
+        return self.allocate_offset(pid, size) >= 0
+
+    def allocate_offset(self, pid, size):
+        """
+        Asigna memoria a un proceso y retorna su dirección global
+
+        Busca primero en las arenas del grupo de la solicitud, luego crea una
+        arena nueva para el grupo y, si ya no queda capacidad, toma espacio de
+        las arenas de otros grupos.
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            int: Dirección de inicio del bloque o -1 si no se pudo asignar
+        """
+        if size > self.MAX_SIZE:
+            return -1  # El tamaño solicitado excede la capacidad total
+
+        # Reserva el PID para rechazar duplicados aun entre hilos
+        with self.lock:
+            if pid in self.allocated_blocks:
+                return -1
+            self.allocated_blocks[pid] = None
+
+        if size > self.ARENA_SIZE:
+            arena, offset = self.__allocate_dedicated(pid, size)
+        else:
+            group = self.__route(size)
+            arena, offset = self.__allocate_in(self.groups.get(group, ()), pid, size)
+            if arena is None:
+                arena, offset = self.__grow(group, pid, size)
+            if arena is None:
+                arena, offset = self.__allocate_in(self.__other_arenas(group), pid, size)
+
+        with self.lock:
+            if arena is None:
+                del self.allocated_blocks[pid]
+                return -1
+            self.allocated_blocks[pid] = arena
+        return arena.base + offset
+
+    def release(self, pid):
+        """
+        Libera la memoria asignada a un proceso y devuelve su arena si quedó vacía
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        with self.lock:
+            arena = self.allocated_blocks.get(pid)
+            if arena is None:
+                return False  # No se encontró el proceso (o se está asignando)
+            del self.allocated_blocks[pid]
+
+        with arena.lock:
+            arena.system.release(pid)
+            empty = arena.system.live_blocks == 0
+
+        if empty:
+            self.__retire(arena)
+        return True
+
+    def release_at(self, offset):
+        """
+        Libera el bloque que comienza en una dirección global
+
+        Args:
+            offset (int): Dirección de inicio del bloque
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        if offset < 0 or offset >= self.MAX_SIZE:
+            return False
+
+        arena = self.slots[offset // self.ARENA_SIZE]
+        if arena is None:
+            return False
+        with arena.lock:
+            local = offset - arena.base
+            pid = arena.system.owner_of(local)
+            node = arena.system.lookup(pid)
+            if node is None or node.offset != local:
+                return False
+        return self.release(pid)
+
+    def lookup(self, pid):
+        """
+        Busca el bloque asignado a un proceso
+
+        Returns:
+            Optional[Node]: Nodo dentro de su arena (offset relativo a la arena)
+                o None si no existe
+        """
+        arena = self.allocated_blocks.get(pid)
+        return arena.system.lookup(pid) if arena is not None else None
+
+    def __route(self, size):
+        """Retorna el grupo de arenas que atiende una solicitud"""
+        if self.routing == ROUTE_SIZE:
+            return bisect_left(self.size_classes, size)
+        home = getattr(self.__thread_state, "home", None)
+        if home is None:
+            home = next(self.__homes) % self.threads
+            self.__thread_state.home = home
+        return home
+
+    def __allocate_in(self, arenas, pid, size):
+        """
+        Intenta asignar en una secuencia de arenas, de la más reciente a la más antigua
+
+        Returns:
+            tuple: (arena, dirección local) o (None, -1) si ninguna tiene espacio
+        """
+        for arena in reversed(list(arenas)):
+            # Lectura sin lock para descartar arenas llenas; se confirma bajo el lock
+            if arena.system.get_largest_free_block() < size:
+                continue
+            with arena.lock:
+                if arena.retired:
+                    continue
+                offset = arena.system.allocate_offset(pid, size)
+            if offset >= 0:
+                return arena, offset
+        return None, -1
+
+    def __other_arenas(self, group):
+        """Retorna las arenas normales de los demás grupos"""
+        with self.lock:
+            return [arena for key, arenas in self.groups.items() if key != group
+                    for arena in arenas]
+
+    def __grow(self, group, pid, size):
+        """
+        Crea una arena para un grupo y asigna el bloque en ella
+
+        Returns:
+            tuple: (arena, dirección local) o (None, -1) si no queda capacidad
+        """
+        with self.lock:
+            arena = self.__create_arena(1, group)
+            if arena is None and self.idle_dedicated:
+                self.__drop_idle_dedicated()
+                arena = self.__create_arena(1, group)
+            if arena is None:
+                return None, -1
+            self.groups.setdefault(group, []).append(arena)
+            with arena.lock:
+                return arena, arena.system.allocate_offset(pid, size)
+
+    def __allocate_dedicated(self, pid, size):
+        """
+        Asigna un bloque mayor que una arena en una arena propia de varias ranuras
+
+        Primero reutiliza una arena dedicada vacía con las mismas ranuras; si
+        hay que crear una y no alcanzan las ranuras libres, se devuelven las
+        dedicadas vacías y se reintenta.
+
+        Returns:
+            tuple: (arena, dirección local) o (None, -1) si no hay ranuras alineadas libres
+        """
+        slots = 1
+        while slots * self.ARENA_SIZE < size:
+            slots *= 2
+        with self.lock:
+            arena = next((idle for idle in self.idle_dedicated if idle.slots == slots), None)
+            if arena is not None:
+                self.idle_dedicated.remove(arena)
+                self.arenas_reused += 1
+            else:
+                arena = self.__create_arena(slots, None)
+            if arena is None and self.idle_dedicated:
+                self.__drop_idle_dedicated()
+                arena = self.__create_arena(slots, None)
+            if arena is None:
+                return None, -1
+            with arena.lock:
+                return arena, arena.system.allocate_offset(pid, size)
+
+    def __create_arena(self, slots, group):
+        """
+        Ocupa un grupo alineado de ranuras libres con una arena nueva (con self.lock tomado)
+
+        Returns:
+            Optional[Arena]: Arena creada o None si no hay ranuras libres suficientes
+        """
+        for first in range(0, len(self.slots), slots):
+            if all(arena is None for arena in self.slots[first:first + slots]):
+                arena = Arena(first, slots, self.ARENA_SIZE, self.MIN_SIZE, group)
+                self.slots[first:first + slots] = [arena] * slots
+                self.arenas_created += 1
+                return arena
+        return None
+
+    def __retire(self, arena):
+        """
+        Devuelve una arena vacía si su grupo ya conserva suficientes arenas
+        vacías; una dedicada se guarda en idle_dedicated si hay lugar
+        """
+        with self.lock:
+            if arena.retired:
+                return
+            if arena.group is not None:
+                group = self.groups[arena.group]
+                empty = sum(1 for other in group if other.system.live_blocks == 0)
+                if empty <= self.retain_empty:
+                    return
+            elif len(self.idle_dedicated) < self.retain_empty:
+                # Una arena dedicada sólo la usa su proceso: se conserva tal cual
+                self.idle_dedicated.append(arena)
+                return
+            with arena.lock:
+                if arena.system.live_blocks:
+                    return  # Otro hilo asignó en la arena mientras tanto
+                arena.retired = True
+            if arena.group is not None:
+                group.remove(arena)
+            self.__free_slots(arena)
+
+    def __drop_idle_dedicated(self):
+        """Devuelve las ranuras de todas las arenas dedicadas vacías (con self.lock tomado)"""
+        for arena in self.idle_dedicated:
+            arena.retired = True
+            self.__free_slots(arena)
+        self.idle_dedicated.clear()
+
+    def __free_slots(self, arena):
+        """Libera las ranuras de una arena retirada (con self.lock tomado)"""
+        self.slots[arena.slot:arena.slot + arena.slots] = [None] * arena.slots
+        self.arenas_retired += 1
+
+    def get_used_memory(self):
+        """Retorna la memoria utilizada por procesos en todas las arenas"""
+        return sum(arena.system.used_memory for arena in self.__arenas())
+
+    def get_free_memory(self):
+        """Retorna la capacidad restante (arenas existentes y ranuras sin usar)"""
+        return self.MAX_SIZE - self.get_used_memory()
+
+    def get_memory_usage(self):
+        """Retorna el porcentaje de la capacidad total utilizada (0.0 a 100.0)"""
+        return (self.get_used_memory() / self.MAX_SIZE) * 100
+
+    def get_requested_memory(self):
+        """Retorna la memoria solicitada por los procesos (antes de redondear)"""
+        return sum(arena.system.requested_memory for arena in self.__arenas())
+
+    def get_largest_free_block(self):
+        """
+        Retorna el tamaño del bloque libre más grande, contando las arenas que
+        todavía se pueden crear en grupos alineados de ranuras libres
+        """
+        largest = max((arena.system.get_largest_free_block() for arena in self.__arenas()), default=0)
+        slots = 1
+        while slots <= len(self.slots):
+            if not any(all(arena is None for arena in self.slots[first:first + slots])
+                       for first in range(0, len(self.slots), slots)):
+                break
+            largest = max(largest, slots * self.ARENA_SIZE)
+            slots *= 2
+        return largest
+
+    def get_arena_stats(self):
+        """
+        Retorna estadísticas de las arenas
+
+        Returns:
+            dict: Arenas activas, arenas por grupo, arenas dedicadas vacías
+                conservadas, ranuras libres, arenas creadas, devueltas y
+                dedicadas reutilizadas desde el inicio
+        """
+        with self.lock:
+            return {
+                "routing": self.routing,
+                "arenas": len(self.__arenas()),
+                "arenas_per_group": {group: len(arenas) for group, arenas in self.groups.items()},
+                "idle_dedicated": len(self.idle_dedicated),
+                "free_slots": sum(1 for arena in self.slots if arena is None),
+                "arenas_created": self.arenas_created,
+                "arenas_retired": self.arenas_retired,
+                "arenas_reused": self.arenas_reused,
+            }
+
+    def __arenas(self):
+        """Retorna las arenas activas (cada una una vez)"""
+        return list({id(arena): arena for arena in self.slots if arena is not None}.values())
+
+    def show(self):
+        """Muestra el árbol de cada arena (para debug)."""
+        for arena in self.__arenas():
+            print(f"Arena en {arena.base} ({arena.system.MAX_SIZE} bytes, grupo {arena.group}):")
+            arena.system.show()
@@ -0,0 +1,27 @@
+"""
+* Objetivo:
+*   Interpretación de configuraciones de tamaño de memoria
+*
+* Descripción:
+*   Las herramientas de línea de comandos (banco de pruebas, simulador y
+*   servidor) reciben el tamaño de la memoria y del bloque mínimo como
+*   "MAX:MIN"; este módulo no depende de ninguna de ellas
+*
+"""
+
+
+def parse_scale(text):
+    """
+    Convierte "MAX:MIN" en la tupla (MAX, MIN)
+
+    Args:
+        text (str): Configuración, p. ej. "1048576:64"
+
+    Returns:
+        tuple: (MAX_SIZE, MIN_SIZE)
+
+    Raises:
+        ValueError: Si el texto no tiene la forma MAX:MIN con enteros
+    """
+    max_size, min_size = text.split(":")
+    return int(max_size), int(min_size)
@@ -0,0 +1,82 @@
+"""
+* Objetivo:
+*   Asignador de ajuste segregado (segregated fit) con combinación por etiquetas
+*
+* Descripción:
+*   Los bloques libres se agrupan en clases por potencia de 2 de su tamaño.
+*   Una solicitud busca el mejor ajuste dentro de su propia clase y, si no lo
+*   hay, toma cualquier bloque de la clase no vacía inmediata superior (todos
+*   le alcanzan). El sobrante se devuelve a su clase y al liberar se combinan
+*   los vecinos físicos libres mediante las etiquetas de frontera
+*
+"""
+
+from utils.boundary_tag_allocator import Block, BoundaryTagAllocator
+
+
+class SegregatedFit(BoundaryTagAllocator):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4):
+        """
+        Inicializa el asignador de ajuste segregado
+
+        Args:
+            MAX_SIZE (int, optional): Tamaño total de memoria. Defaults to 1024.
+            MIN_SIZE (int, optional): Granularidad y tamaño mínimo de bloque. Defaults to 4.
+        """
+        super().__init__(MAX_SIZE, MIN_SIZE)
+
+        classes = (self.usable_size // MIN_SIZE).bit_length()
+        self.free_lists = [{} for _ in range(classes)]  # Clase k: [2^k, 2^(k+1)) unidades
+        self.free_bitmap = 0  # Bit k encendido: la clase k no está vacía
+
+        self._init_blocks()
+
+    def size_class(self, size):
+        """Retorna la clase de un tamaño (múltiplo de MIN_SIZE)"""
+        return (size // self.MIN_SIZE).bit_length() - 1
+
+    def _insert_free(self, block: Block):
+        size_class = self.size_class(block.size)
+        self.free_lists[size_class][block.offset] = block
+        self.free_bitmap |= 1 << size_class
+
+    def _remove_free(self, block: Block):
+        size_class = self.size_class(block.size)
+        free_list = self.free_lists[size_class]
+        del free_list[block.offset]
+        if not free_list:
+            self.free_bitmap &= ~(1 << size_class)
+
+    def _find_free(self, size) -> Block | None:
+        size_class = self.size_class(size)
+        if size_class >= len(self.free_lists):
+            return None
+
+        # Mejor ajuste dentro de la propia clase
+        best = None
+        for block in self.free_lists[size_class].values():
+            if block.size >= size and (best is None or block.size < best.size):
+                best = block
+                if best.size == size:
+                    break
+        if best is not None:
+            self._remove_free(best)
+            return best
+
+        # Cualquier bloque de la siguiente clase no vacía
+        candidates = self.free_bitmap >> (size_class + 1)
+        if not candidates:
+            return None
+        size_class += (candidates & -candidates).bit_length()
+        free_list = self.free_lists[size_class]
+        _, block = free_list.popitem()
+        if not free_list:
+            self.free_bitmap &= ~(1 << size_class)
+        return block
+
+    def get_largest_free_block(self):
+        """Retorna el tamaño del bloque libre más grande (0 si no hay memoria libre)"""
+        if not self.free_bitmap:
+            return 0
+        size_class = self.free_bitmap.bit_length() - 1
+        return max(block.size for block in self.free_lists[size_class].values())
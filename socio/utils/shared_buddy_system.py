@@ -0,0 +1,567 @@
+"""
+* Objetivo:
+*   Buddy System compartido entre procesos sobre multiprocessing.shared_memory
+*
+* Descripción:
+*   Todo el estado vive en un único segmento de memoria compartida: una
+*   cabecera con la configuración y los contadores, el árbol implícito, los
+*   datos de cada bloque asignado, un índice PID → dirección y la arena. Cada
+*   proceso que se conecta al segmento asigna y libera directamente, sin un
+*   proceso intermedio, y los bloques se pasan de un proceso a otro por su
+*   dirección sin copiar datos (buffer(offset, size)).
+*
+*   Cada nodo del árbol guarda el orden + 1 del mayor bloque libre de su
+*   subárbol (0 = ninguno); asignar es bajar hacia el hijo que alcanza y
+*   liberar es subir recalculando, ambos en O(log N) sin listas enlazadas.
+*   Las operaciones se serializan con un lock de multiprocessing, que se
+*   hereda al crear los procesos (argumento de Process o initializer de un
+*   Pool). Uso:
+*
+*       with SharedBuddySystem(1 << 20, 64) as system:  # close() + unlink()
+*           worker = Process(target=work, args=(system,))  # se reconecta por nombre
+*           ...
+*
+*   El proceso que crea el segmento es responsable de liberarlo con unlink().
+*   Los procesos que se reconectan no necesitan llamar a close(): las vistas
+*   del segmento se liberan solas cuando el asignador deja de usarse o al
+*   terminar el proceso.
+*
+"""
+
+import multiprocessing
+import weakref
+from multiprocessing import shared_memory
+from strategy.system import MemoryAllocationStrategy
+
+SEGMENT_MAGIC = 0x42534D31  # "BSM1": identifica el formato del segmento
+
+# Posiciones de la cabecera (enteros de 8 bytes)
+HEADER_MAGIC = 0
+HEADER_MAX_SIZE = 1
+HEADER_MIN_SIZE = 2
+HEADER_USED = 3
+HEADER_REQUESTED = 4
+HEADER_LIVE = 5
+HEADER_ALLOCATIONS = 6
+HEADER_RELEASES = 7
+HEADER_FAILED = 8
+HEADER_WORDS = 16
+
+EMPTY = -1  # Dirección de una entrada libre del índice
+ARENA_ALIGNMENT = 64
+
+
+def segment_layout(MAX_SIZE, MIN_SIZE):
+    """
+    Calcula la distribución del segmento para una configuración
+
+    Returns:
+        dict: MAX_ORDER, bloques mínimos, capacidad del índice, posición de
+            cada sección y tamaño total del segmento en bytes
+    """
+    max_order = 0
+    while MAX_SIZE >> (max_order + 1) >= max(MIN_SIZE, 1):
+        max_order += 1
+    cells = 1 << max_order
+    capacity = 1
+    while capacity < 2 * cells:  # Factor de carga del índice <= 0.5
+        capacity <<= 1
+
+    layout = {"max_order": max_order, "cells": cells, "capacity": capacity}
+    position = 8 * HEADER_WORDS
+    for name, size in (("tree", 2 * cells - 1), ("orders", cells)):
+        layout[name] = position
+        position += size
+    position = -(-position // 8) * 8
+    for name, size in (("pids", 8 * cells), ("requested", 8 * cells),
+                       ("keys", 8 * capacity), ("offsets", 8 * capacity)):
+        layout[name] = position
+        position += size
+    layout["arena"] = -(-position // ARENA_ALIGNMENT) * ARENA_ALIGNMENT
+    layout["size"] = layout["arena"] + MAX_SIZE
+    return layout
+
+
+class SharedBuddySystem(MemoryAllocationStrategy):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4, name=None, lock=None):
+        """
+        Crea un segmento compartido con un Buddy System vacío
+
+        Args:
+            MAX_SIZE (int, optional): Tamaño máximo de memoria. Defaults to 1024.
+            MIN_SIZE (int, optional): Tamaño mínimo de bloque. Defaults to 4.
+            name (str, optional): Nombre del segmento. Defaults to None (uno al azar).
+            lock (optional): Lock compartido entre procesos. Defaults to None
+                (un multiprocessing.Lock nuevo).
+
+        Raises:
+            ValueError: Si MAX_SIZE no es una potencia de 2
+        """
+        if MAX_SIZE <= 0 or MAX_SIZE & (MAX_SIZE - 1):
+            raise ValueError("MAX_SIZE debe ser una potencia de 2")
+
+        layout = segment_layout(MAX_SIZE, MIN_SIZE)
+        segment = shared_memory.SharedMemory(name=name, create=True, size=layout["size"])
+        self.__map(segment, layout, MAX_SIZE, MIN_SIZE, lock or multiprocessing.Lock())
+        self.owner = True
+
+        header = self.header
+        header[HEADER_MAGIC] = SEGMENT_MAGIC
+        header[HEADER_MAX_SIZE] = MAX_SIZE
+        header[HEADER_MIN_SIZE] = MIN_SIZE
+        # Todo libre: cada nodo ofrece su propio bloque completo
+        for depth in range(self.MAX_ORDER + 1):
+            first = (1 << depth) - 1
+            self.tree[first:2 * first + 1] = bytes([self.MAX_ORDER - depth + 1]) * (1 << depth)
+        # Índice vacío: todas las direcciones en EMPTY (-1 = todos los bytes en 0xFF)
+        start = layout["offsets"]
+        segment.buf[start:start + 8 * layout["capacity"]] = b"\xff" * (8 * layout["capacity"])
+
+    @classmethod
+    def attach(cls, name, lock):
+        """
+        Se conecta a un segmento creado por otro proceso
+
+        Args:
+            name (str): Nombre del segmento
+            lock: El mismo lock que usa el proceso que lo creó
+
+        Returns:
+            SharedBuddySystem: Vista del asignador compartido
+
+        Raises:
+            ValueError: Si el segmento no contiene un SharedBuddySystem
+        """
+        segment = open_segment(name)
+        header = segment.buf[:8 * HEADER_WORDS].cast("q")
+        magic, MAX_SIZE, MIN_SIZE = header[HEADER_MAGIC], header[HEADER_MAX_SIZE], header[HEADER_MIN_SIZE]
+        header.release()
+        if magic != SEGMENT_MAGIC:
+            segment.close()
+            raise ValueError(f"El segmento {name} no contiene un SharedBuddySystem")
+
+        system = cls.__new__(cls)
+        system.__map(segment, segment_layout(MAX_SIZE, MIN_SIZE), MAX_SIZE, MIN_SIZE, lock)
+        system.owner = False
+        return system
+
+    def __map(self, segment, layout, MAX_SIZE, MIN_SIZE, lock):
+        """Crea las vistas de cada sección del segmento"""
+        self.segment = segment
+        self.name = segment.name
+        self.lock = lock
+        self.MAX_SIZE = MAX_SIZE
+        self.MIN_SIZE = MIN_SIZE
+        self.MAX_ORDER = layout["max_order"]
+        self.order_sizes = [MAX_SIZE >> (self.MAX_ORDER - order)
+                            for order in range(self.MAX_ORDER + 1)]
+        self.unit = self.order_sizes[0]
+        self.mask = layout["capacity"] - 1
+        self.shift = 64 - layout["capacity"].bit_length() + 1
+
+        buf = segment.buf
+        cells = layout["cells"]
+        self.header = buf[:8 * HEADER_WORDS].cast("q")
+        self.tree = buf[layout["tree"]:layout["tree"] + 2 * cells - 1]
+        self.orders = buf[layout["orders"]:layout["orders"] + cells]  # Orden + 1 del bloque que empieza en cada celda
+        self.pids = buf[layout["pids"]:layout["pids"] + 8 * cells].cast("q")
+        self.requested = buf[layout["requested"]:layout["requested"] + 8 * cells].cast("q")
+        self.keys = buf[layout["keys"]:layout["keys"] + 8 * layout["capacity"]].cast("q")
+        self.offsets = buf[layout["offsets"]:layout["offsets"] + 8 * layout["capacity"]].cast("q")
+        self.arena = buf[layout["arena"]:layout["arena"] + MAX_SIZE]
+        self.allocated_blocks = SharedBlockIndex(self)
+        # Sin liberar las vistas, SharedMemory.__del__ falla con BufferError al
+        # cerrar el segmento; el finalizador corre una sola vez (close, GC o salida)
+        self.__finalizer = weakref.finalize(
+            self, release_segment, segment,
+            (self.header, self.tree, self.orders, self.pids, self.requested,
+             self.keys, self.offsets, self.arena))
+
+    def __reduce__(self):
+        # Al pasar el asignador a otro proceso, éste se reconecta al mismo segmento
+        return (SharedBuddySystem.attach, (self.name, self.lock))
+
+    # --- Índice PID → dirección (direccionamiento abierto con sondeo lineal) ---
+
+    def __home(self, pid):
+        """Posición inicial de un PID en el índice (hash de Fibonacci)"""
+        return ((pid * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self.shift & self.mask
+
+    def __find(self, pid):
+        """Retorna la posición del PID en el índice o -1 si no está"""
+        keys, offsets, mask = self.keys, self.offsets, self.mask
+        slot = self.__home(pid)
+        while offsets[slot] != EMPTY:
+            if keys[slot] == pid:
+                return slot
+            slot = (slot + 1) & mask
+        return -1
+
+    def __insert(self, pid, offset):
+        keys, offsets, mask = self.keys, self.offsets, self.mask
+        slot = self.__home(pid)
+        while offsets[slot] != EMPTY:
+            slot = (slot + 1) & mask
+        keys[slot] = pid
+        offsets[slot] = offset
+
+    def __delete(self, slot):
+        """Borra una entrada corriendo hacia atrás las siguientes de su grupo (sin marcas de borrado)"""
+        keys, offsets, mask = self.keys, self.offsets, self.mask
+        following = slot
+        while True:
+            following = (following + 1) & mask
+            if offsets[following] == EMPTY:
+                break
+            home = self.__home(keys[following])
+            # La entrada se queda si su posición inicial está entre el hueco y ella
+            if (slot < following and slot < home <= following) or \
+                    (slot > following and (home > slot or home <= following)):
+                continue
+            keys[slot] = keys[following]
+            offsets[slot] = offsets[following]
+            slot = following
+        offsets[slot] = EMPTY
+
+    # --- Operaciones ---
+
+    def allocate(self, pid, size):
+        """
+        Asigna memoria a un proceso
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            bool: True si la asignación fue exitosa, False en caso contrario
+        """
+        return self.allocate_offset(pid, size) >= 0
+
+    def allocate_offset(self, pid, size):
+        """
+        Asigna memoria a un proceso y retorna la dirección del bloque
+
+        Args:
+            pid (int): ID del proceso
+            size (int): Tamaño de memoria solicitado
+
+        Returns:
+            int: Dirección de inicio del bloque asignado o -1 si no se pudo asignar
+        """
+        with self.lock:
+            header = self.header
+            if size > self.MAX_SIZE:
+                header[HEADER_FAILED] += 1
+                return -1
+            if self.__find(pid) >= 0:
+                return -1  # El PID ya tiene un bloque asignado
+
+            order = self.order_for_size(size)
+            tree = self.tree
+            if tree[0] <= order:
+                header[HEADER_FAILED] += 1
+                return -1  # No hay bloque libre suficientemente grande
+
+            # Bajar por el hijo que tiene un bloque libre del orden pedido
+            index = 0
+            for _ in range(self.MAX_ORDER - order):
+                index = 2 * index + 1
+                if tree[index] <= order:
+                    index += 1
+            tree[index] = 0
+            self.__update_parents(index, order)
+
+            block_size = self.order_sizes[order]
+            offset = (index - (1 << (self.MAX_ORDER - order)) + 1) * block_size
+            cell = offset // self.unit
+            self.orders[cell] = order + 1
+            self.pids[cell] = pid
+            self.requested[cell] = size
+            self.__insert(pid, offset)
+
+            header[HEADER_USED] += block_size
+            header[HEADER_REQUESTED] += size
+            header[HEADER_LIVE] += 1
+            header[HEADER_ALLOCATIONS] += 1
+            return offset
+
+    def __update_parents(self, index, order):
+        """Recalcula el mayor bloque libre de los ancestros de un nodo"""
+        tree = self.tree
+        while index:
+            index = (index - 1) // 2
+            order += 1
+            left = tree[2 * index + 1]
+            right = tree[2 * index + 2]
+            # Dos hijos completamente libres forman un bloque libre del padre
+            value = order + 1 if left == right == order else max(left, right)
+            if tree[index] == value:
+                break  # Los ancestros ya están al día
+            tree[index] = value
+
+    def release(self, pid):
+        """
+        Libera la memoria de un proceso
+
+        Args:
+            pid (int): ID del proceso a liberar
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        with self.lock:
+            slot = self.__find(pid)
+            if slot < 0:
+                return False  # No se encontró el proceso
+            self.__release_block(self.offsets[slot], slot)
+            return True
+
+    def release_at(self, offset):
+        """
+        Libera el bloque que comienza en una dirección de memoria
+
+        Args:
+            offset (int): Dirección de inicio del bloque
+
+        Returns:
+            bool: True si la liberación fue exitosa, False en caso contrario
+        """
+        if offset < 0 or offset >= self.MAX_SIZE or offset % self.unit:
+            return False
+        with self.lock:
+            cell = offset // self.unit
+            if not self.orders[cell]:
+                return False  # No hay un bloque asignado en esa dirección
+            self.__release_block(offset, self.__find(self.pids[cell]))
+            return True
+
+    def __release_block(self, offset, slot):
+        """Marca libre el bloque asignado en offset y borra su entrada del índice"""
+        cell = offset // self.unit
+        order = self.orders[cell] - 1
+        block_size = self.order_sizes[order]
+        index = (1 << (self.MAX_ORDER - order)) - 1 + offset // block_size
+        self.tree[index] = order + 1
+        self.__update_parents(index, order)
+
+        header = self.header
+        header[HEADER_USED] -= block_size
+        header[HEADER_REQUESTED] -= self.requested[cell]
+        header[HEADER_LIVE] -= 1
+        header[HEADER_RELEASES] += 1
+        self.orders[cell] = 0
+        self.__delete(slot)
+
+    def lookup(self, pid):
+        """
+        Busca el bloque asignado a un proceso
+
+        Returns:
+            tuple | None: (offset, tamaño del bloque, tamaño solicitado) o None
+                si el PID no tiene bloque
+        """
+        with self.lock:
+            slot = self.__find(pid)
+            if slot < 0:
+                return None
+            offset = self.offsets[slot]
+            cell = offset // self.unit
+            return offset, self.order_sizes[self.orders[cell] - 1], self.requested[cell]
+
+    def buffer(self, offset, size):
+        """
+        Retorna una vista (sin copia) de una región de la arena compartida
+
+        Cualquier proceso conectado al segmento ve los mismos bytes. Las vistas
+        deben liberarse (release()) antes de close().
+
+        Args:
+            offset (int): Dirección de inicio
+            size (int): Cantidad de bytes
+
+        Returns:
+            memoryview: Vista de la región
+        """
+        return self.arena[offset:offset + size]
+
+    def get_buffer(self, pid) -> memoryview | None:
+        """
+        Retorna la vista del bloque de un proceso, del tamaño que solicitó
+
+        Returns:
+            memoryview | None: Vista del bloque o None si el PID no está asignado
+        """
+        block = self.lookup(pid)
+        if block is None:
+            return None
+        offset, _, requested = block
+        return self.buffer(offset, requested)
+
+    def order_for_size(self, size):
+        """
+        Calcula el orden mínimo cuyo bloque cubre el tamaño solicitado
+
+        Returns:
+            int: Orden del bloque (0 = bloque mínimo)
+        """
+        order = 0
+        while self.order_sizes[order] < size:
+            order += 1
+        return order
+
+    # --- Estado ---
+
+    def get_used_memory(self):
+        """Retorna memoria utilizada"""
+        return self.header[HEADER_USED]
+
+    def get_free_memory(self):
+        """Retorna memoria libre"""
+        return self.MAX_SIZE - self.header[HEADER_USED]
+
+    def get_memory_usage(self):
+        """Retorna porcentaje de uso"""
+        return (self.header[HEADER_USED] / self.MAX_SIZE) * 100
+
+    def get_requested_memory(self):
+        """Retorna la suma de los tamaños solicitados por los procesos asignados"""
+        return self.header[HEADER_REQUESTED]
+
+    def get_largest_free_block(self):
+        """Retorna el tamaño del bloque libre más grande"""
+        order = self.tree[0]
+        return self.order_sizes[order - 1] if order else 0
+
+    def get_metrics(self):
+        """
+        Retorna una instantánea de los contadores compartidos
+
+        Returns:
+            dict: Operaciones de todos los procesos conectados y estado de la memoria
+        """
+        with self.lock:
+            header = self.header
+            return {
+                "allocations": header[HEADER_ALLOCATIONS],
+                "releases": header[HEADER_RELEASES],
+                "failed_allocations": header[HEADER_FAILED],
+                "used_memory": header[HEADER_USED],
+                "requested_memory": header[HEADER_REQUESTED],
+                "live_blocks": header[HEADER_LIVE],
+                "largest_free_block": self.get_largest_free_block(),
+            }
+
+    def check_invariants(self):
+        """
+        Verifica que el árbol, los bloques y el índice sean consistentes
+
+        Raises:
+            AssertionError: Si encuentra una inconsistencia
+        """
+        with self.lock:
+            used = live = 0
+            for cell in range(len(self.orders)):
+                if self.orders[cell]:
+                    offset = cell * self.unit
+                    slot = self.__find(self.pids[cell])
+                    assert slot >= 0 and self.offsets[slot] == offset, \
+                        f"El bloque en {offset} no está en el índice"
+                    used += self.order_sizes[self.orders[cell] - 1]
+                    live += 1
+            entries = sum(1 for slot in range(self.mask + 1) if self.offsets[slot] != EMPTY)
+            assert entries == live == self.header[HEADER_LIVE], "Cantidad de bloques inconsistente"
+            assert used == self.header[HEADER_USED], "Memoria usada inconsistente"
+
+    def show(self):
+        """Muestra los bloques asignados (para debug)."""
+        for pid, offset in sorted(self.allocated_blocks.items(), key=lambda item: item[1]):
+            block = self.lookup(pid)
+            if block is not None:
+                print(f"PID {pid}: [{offset}, {offset + block[1]}) solicitado {block[2]}")
+
+    def close(self):
+        """
+        Desconecta este proceso del segmento
+
+        Las vistas obtenidas con buffer() o get_buffer() deben liberarse antes.
+        Llamarlo más de una vez no tiene efecto.
+        """
+        self.__finalizer()
+
+    def unlink(self):
+        """Destruye el segmento (sólo el proceso que lo creó, una vez que todos cerraron)"""
+        self.segment.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+
+class SharedBlockIndex:
+    def __init__(self, system):
+        """
+        Vista de sólo lectura PID → dirección de los bloques asignados
+
+        Args:
+            system (SharedBuddySystem): Asignador cuyo índice se consulta
+        """
+        self.system = system
+
+    def __len__(self):
+        return self.system.header[HEADER_LIVE]
+
+    def __contains__(self, pid):
+        return self.system.lookup(pid) is not None
+
+    def __getitem__(self, pid):
+        block = self.system.lookup(pid)
+        if block is None:
+            raise KeyError(pid)
+        return block[0]
+
+    def get(self, pid, default=None):
+        block = self.system.lookup(pid)
+        return default if block is None else block[0]
+
+    def items(self):
+        """Pares (pid, offset) en el momento de la llamada"""
+        system = self.system
+        with system.lock:
+            return [(system.keys[slot], system.offsets[slot])
+                    for slot in range(system.mask + 1) if system.offsets[slot] != EMPTY]
+
+    def keys(self):
+        return [pid for pid, _ in self.items()]
+
+    def values(self):
+        return [offset for _, offset in self.items()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+
+def release_segment(segment, views):
+    """Libera las vistas de un segmento y lo cierra en este proceso"""
+    for view in views:
+        view.release()
+    segment.close()
+
+
+def open_segment(name):
+    """
+    Abre un segmento existente sin que el proceso lo destruya al terminar
+
+    En Python < 3.13 abrir un segmento también lo registra en el
+    resource_tracker. Los procesos que comparten el lock descienden del que
+    creó el segmento y usan su mismo resource_tracker, así que ese registro
+    repite el del creador y el segmento sólo se destruye con su unlink().
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
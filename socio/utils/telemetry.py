@@ -0,0 +1,124 @@
+"""
+* Objetivo:
+*   Exportar la telemetría de los asignadores y medir la duración de sus operaciones
+*
+* Descripción:
+*   to_prometheus convierte la instantánea de get_metrics() al formato de
+*   texto de Prometheus (los histogramas por orden se exportan con la
+*   etiqueta size). TimingRecorder se instala con set_timing_hook y acumula
+*   un histograma de latencias por operación. Uso:
+*
+*       recorder = TimingRecorder()
+*       system.set_timing_hook(recorder)
+*       print(to_prometheus(system.get_metrics()) + recorder.to_prometheus())
+*
+"""
+
+# Métricas acumuladas (counter); el resto son valores instantáneos (gauge)
+COUNTER_METRICS = {
+    "allocations", "releases", "failed_allocations", "fragmentation_failures",
+    "splits", "merges", "deferred_merges", "coalesce_passes",
+    "immediate_allocations", "queued_allocations", "granted_after_wait",
+    "allocation_timeouts", "cancelled_allocations", "wait_ns_sum",
+}
+
+# Límites superiores (ns) de los buckets del histograma de latencias
+DEFAULT_BUCKETS_NS = (250, 500, 1000, 2500, 5000, 10000, 25000, 100000)
+
+
+def to_prometheus(metrics, prefix="buddy"):
+    """
+    Da formato de texto de Prometheus a una instantánea de métricas
+
+    Args:
+        metrics (dict): Resultado de get_metrics(); los valores pueden ser
+            números o diccionarios tamaño de bloque → número
+        prefix (str, optional): Prefijo de los nombres de métrica. Defaults to "buddy".
+
+    Returns:
+        str: Una línea por muestra, con sus líneas # TYPE
+    """
+    lines = []
+    for name, value in metrics.items():
+        if name in COUNTER_METRICS:
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+        else:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# TYPE {metric} gauge")
+
+        if isinstance(value, dict):
+            for size, count in value.items():
+                lines.append(f'{metric}{{size="{size}"}} {count}')
+        else:
+            lines.append(f"{metric} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class TimingRecorder:
+    def __init__(self, buckets=DEFAULT_BUCKETS_NS):
+        """
+        Inicializa un acumulador de latencias por operación
+
+        Args:
+            buckets (tuple, optional): Límites superiores en ns, crecientes.
+                Defaults to DEFAULT_BUCKETS_NS.
+        """
+        self.buckets = tuple(buckets)
+        self.operations = {}  # operación → [cuenta, suma ns, máximo ns, cuentas por bucket]
+
+    def __call__(self, operation, elapsed_ns):
+        """Registra la duración de una operación (firma de set_timing_hook)"""
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = [0, 0, 0, [0] * len(self.buckets)]
+        stats[0] += 1
+        stats[1] += elapsed_ns
+        if elapsed_ns > stats[2]:
+            stats[2] = elapsed_ns
+        for i, bound in enumerate(self.buckets):
+            if elapsed_ns <= bound:
+                stats[3][i] += 1
+                break
+
+    def get_metrics(self):
+        """
+        Retorna la instantánea de latencias
+
+        Returns:
+            dict: operación → {count, sum_ns, max_ns, buckets: {límite: cuenta acumulada}}
+        """
+        snapshot = {}
+        for operation, (count, total, maximum, counts) in self.operations.items():
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                buckets[bound] = cumulative
+            snapshot[operation] = {"count": count, "sum_ns": total, "max_ns": maximum,
+                                   "buckets": buckets}
+        return snapshot
+
+    def reset(self):
+        """Descarta las latencias registradas"""
+        self.operations.clear()
+
+    def to_prometheus(self, prefix="buddy"):
+        """
+        Da formato de histograma de Prometheus a las latencias registradas
+
+        Args:
+            prefix (str, optional): Prefijo del nombre de métrica. Defaults to "buddy".
+
+        Returns:
+            str: Histograma {prefix}_operation_duration_ns con la etiqueta operation
+        """
+        metric = f"{prefix}_operation_duration_ns"
+        lines = [f"# TYPE {metric} histogram"]
+        for operation, stats in self.get_metrics().items():
+            for bound, cumulative in stats["buckets"].items():
+                lines.append(f'{metric}_bucket{{operation="{operation}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{operation="{operation}",le="+Inf"}} {stats["count"]}')
+            lines.append(f'{metric}_sum{{operation="{operation}"}} {stats["sum_ns"]}')
+            lines.append(f'{metric}_count{{operation="{operation}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,127 @@
+"""
+* Objetivo:
+*   Asignador TLSF (Two-Level Segregated Fit) con liberación O(1) y
+*   asignación O(1) salvo cuando la memoria está casi llena
+*
+* Descripción:
+*   Los bloques libres se clasifican en dos niveles: el primero por potencia
+*   de 2 del tamaño y el segundo subdivide cada potencia en SL_COUNT rangos
+*   lineales. Dos niveles de bitmaps permiten encontrar una lista no vacía
+*   con bloques suficientemente grandes con operaciones de bits, sin recorrer
+*   listas. La solicitud se redondea al inicio de la clase siguiente; si no
+*   queda ningún bloque en esa clase o superiores se recorre la lista de la
+*   clase propia de la solicitud, que puede tener bloques que le alcanzan,
+*   antes de fallar. Ese último recurso es O(bloques de la clase). Los
+*   tamaños se manejan en unidades de MIN_SIZE
+*
+"""
+
+from utils.boundary_tag_allocator import Block, BoundaryTagAllocator
+
+SL_BITS = 4  # log2 de la cantidad de subdivisiones del segundo nivel
+SL_COUNT = 1 << SL_BITS
+
+
+class TLSF(BoundaryTagAllocator):
+    def __init__(self, MAX_SIZE=1024, MIN_SIZE=4):
+        """
+        Inicializa el asignador TLSF
+
+        Args:
+            MAX_SIZE (int, optional): Tamaño total de memoria. Defaults to 1024.
+            MIN_SIZE (int, optional): Granularidad y tamaño mínimo de bloque. Defaults to 4.
+        """
+        super().__init__(MAX_SIZE, MIN_SIZE)
+
+        fl_count = self.mapping(self.usable_size // MIN_SIZE)[0] + 1
+        self.fl_bitmap = 0  # Bit fl encendido: alguna lista del nivel fl no está vacía
+        self.sl_bitmaps = [0] * fl_count  # Bit sl encendido: la lista (fl, sl) no está vacía
+        self.free_lists = [[{} for _ in range(SL_COUNT)] for _ in range(fl_count)]
+
+        self._init_blocks()
+
+    @staticmethod
+    def mapping(units):
+        """
+        Calcula la clase (fl, sl) a la que pertenece un bloque de units unidades
+
+        Args:
+            units (int): Tamaño en unidades de MIN_SIZE (>= 1)
+
+        Returns:
+            tuple: (primer nivel, segundo nivel)
+        """
+        if units < SL_COUNT:
+            return 0, units  # Bloques pequeños: rangos lineales de una unidad
+        msb = units.bit_length() - 1
+        return msb - SL_BITS + 1, (units >> (msb - SL_BITS)) - SL_COUNT
+
+    def __mapping_search(self, units):
+        """
+        Redondea la solicitud hacia arriba al inicio de la siguiente clase, de
+        modo que cualquier bloque de la clase resultante o mayores le alcanza
+        """
+        if units >= SL_COUNT:
+            units += (1 << (units.bit_length() - 1 - SL_BITS)) - 1
+        return self.mapping(units)
+
+    def _insert_free(self, block: Block):
+        fl, sl = self.mapping(block.size // self.MIN_SIZE)
+        self.free_lists[fl][sl][block.offset] = block
+        self.sl_bitmaps[fl] |= 1 << sl
+        self.fl_bitmap |= 1 << fl
+
+    def _remove_free(self, block: Block):
+        fl, sl = self.mapping(block.size // self.MIN_SIZE)
+        free_list = self.free_lists[fl][sl]
+        del free_list[block.offset]
+        self.__clear_if_empty(fl, sl)
+
+    def __clear_if_empty(self, fl, sl):
+        """Apaga los bits de la lista (fl, sl) si quedó vacía"""
+        if not self.free_lists[fl][sl]:
+            self.sl_bitmaps[fl] &= ~(1 << sl)
+            if not self.sl_bitmaps[fl]:
+                self.fl_bitmap &= ~(1 << fl)
+
+    def _find_free(self, size) -> Block | None:
+        """
+        Extrae un bloque libre de al menos size bytes
+
+        Con bitmaps es O(1); si no hay bloques en clases superiores a la
+        solicitud redondeada, recorre la lista de la clase de la solicitud:
+        O(bloques de esa clase), sólo con la memoria casi llena.
+        """
+        units = size // self.MIN_SIZE
+        fl, sl = self.__mapping_search(units)
+        if fl < len(self.sl_bitmaps):
+            # Primero la misma fila del primer nivel, desde la subclase sl hacia arriba
+            sl_map = self.sl_bitmaps[fl] & (-1 << sl)
+            if not sl_map:
+                # Si no, la siguiente fila no vacía del primer nivel
+                fl_map = self.fl_bitmap & (-1 << (fl + 1))
+                if fl_map:
+                    fl = (fl_map & -fl_map).bit_length() - 1
+                    sl_map = self.sl_bitmaps[fl]
+            if sl_map:
+                sl = (sl_map & -sl_map).bit_length() - 1
+                _, block = self.free_lists[fl][sl].popitem()
+                self.__clear_if_empty(fl, sl)
+                return block
+
+        # Al redondear se descartó la clase propia de la solicitud: se revisa
+        # esa lista antes de fallar (sólo cuando no hay bloques en clases superiores)
+        fl, sl = self.mapping(units)
+        for block in self.free_lists[fl][sl].values():
+            if block.size >= size:
+                self._remove_free(block)
+                return block
+        return None
+
+    def get_largest_free_block(self):
+        """Retorna el tamaño del bloque libre más grande (0 si no hay memoria libre)"""
+        if not self.fl_bitmap:
+            return 0
+        fl = self.fl_bitmap.bit_length() - 1
+        sl = self.sl_bitmaps[fl].bit_length() - 1
+        return max(block.size for block in self.free_lists[fl][sl].values())